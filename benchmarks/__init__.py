@@ -0,0 +1 @@
+# benchmarks paketi
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+İşleme yolundaki sıcak fonksiyonlar için benchmark takımı.
+
+    python -m benchmarks.bench_processing
+    python -m benchmarks.bench_processing --sizes 1k,100k,1M --kinds spiral --functions apply_punteriz
+    python -m benchmarks.bench_processing --sizes all --no-save
+
+Sonuçlar (fonksiyon/tür/boyut -> en iyi süre) benchmarks/history.json dosyasına eklenir
+ve aynı takımın bir önceki çalıştırmasıyla karşılaştırılır.
+"""
+import argparse
+import math
+import sys
+import tempfile
+import time
+from array import array
+from operator import sub
+
+from benchmarks import history
+from benchmarks.route_generators import GENERATORS, SIZES, generate_route, route_lines, write_routes_folder
+from models import feed_planner
+from models.cycle_time import CycleTimeEstimator
+from models.gcode_processor import GCodeProcessor, build_speed_profile, speed_suffixes
+from models.multi_route_processor import MultiRouteProcessor
+from models.route import Route
+
+SUITE = "processing"
+
+# process_routes için bir rota dosyasındaki en fazla nokta sayısı
+POINTS_PER_ROUTE_FILE = 10000
+
+DEFAULT_SIZES = ['1k', '10k', '100k']
+
+def make_processor():
+    """Benchmark'larda kullanılan, punteriz ve bobin açık işlemci."""
+    processor = GCodeProcessor()
+    processor.update_calibration_values("21.57", "388.6")
+    processor.update_punteriz_settings(True, "2", "2")
+    processor.update_bobbin_settings(True, "1")
+    processor.thread_cut_params = ["% Cutting Parameters", "Z28", "M124"]
+    return processor
+
+def bench_load_file_content(kind, points):
+    content = '\n'.join(route_lines(*generate_route(kind, points)))
+    processor = make_processor()
+    return lambda: processor.load_file_content(content)
+
+def bench_apply_calibration(kind, points):
+    xs, ys = generate_route(kind, points)
+    pairs = list(zip(map(str, xs), map(str, ys)))
+    processor = make_processor()
+    return lambda: [processor.apply_calibration(x, y, True) for x, y in pairs]
+
+def bench_calculate_speed(kind, points):
+    processor = make_processor()
+
+    def run():
+        processor.current_speed = None
+        for index in range(points):
+            processor.calculate_speed(index, points)
+    return run
+
+def bench_speed_profile(kind, points):
+    processor = make_processor()
+
+    def run():
+        build_speed_profile.cache_clear()
+        processor.speed_profile(points)
+    return run
+
+def bench_feed_plan(kind, points):
+    xs, ys = generate_route(kind, points)
+    processor = make_processor()
+    processor.update_feed_planning(True)
+    route = Route(xs, ys, 1, None, *processor.calibration_offset())
+    check_feed_plan(processor, route, kind)
+    return lambda: processor.route_speed_profile(route, 0, len(route) - 1)
+
+# Hız planının rampaya göre çalışma süresini kısaltması gereken rota türleri
+FASTER_FEED_KINDS = ('running', 'spiral')
+
+def stitch_cycle_time(processor, route, speeds):
+    """Rotanın dikiş satırlarının verilen hızlarla tahmini çalışma süresini (saniye) döndürür."""
+    coordinates = route.formatted()
+    estimator = CycleTimeEstimator()
+    estimator.walk([f"{coordinates[0]} {processor.z_positions['needle_up']}"])
+    return estimator.walk(processor.stitch_lines(coordinates[1:], speed_suffixes(speeds)))
+
+def check_feed_plan(processor, route, kind):
+    """
+    Hız planını indekse göre rampayla karşılaştırır: serbest açıdan keskin köşelerin iki
+    yanındaki dikişler rampanın o dikişteki hızını aşmamalı; running ve spiral rotalarda
+    planlanan çalışma süresi, aynı köşelerde aynı hıza düşürülmüş rampanınkinden kısa olmalı.
+    """
+    moves = len(route) - 1
+    planned = processor.route_speed_profile(route, 0, moves).speeds
+    ramp = processor.speed_profile(moves).speeds
+    steps = max((int(processor.max_speed) - int(processor.start_speed)) // int(processor.speed_increment), 0)
+    dx = list(map(sub, route.xs[1:], route.xs))
+    dy = list(map(sub, route.ys[1:], route.ys))
+    corner_stitches = set()
+    for index, level in enumerate(feed_planner.corner_levels(dx, dy, steps)):
+        if level < steps:
+            corner_stitches.update((index, index + 1))
+    faster = sorted(index for index in corner_stitches if planned[index] > ramp[index])
+    if len(planned) != len(ramp) or faster:
+        raise AssertionError(f"Hız planı {len(faster)} köşe dikişinde rampayı aşıyor (ilk: {faster[:5]})")
+
+    if kind in FASTER_FEED_KINDS:
+        # Köşelerdeki yavaşlama her iki profilde de aynıdır; fark düz bölümlerdeki hızlanmadır
+        baseline = array('l', ramp)
+        for index in corner_stitches:
+            baseline[index] = planned[index]
+        planned_seconds = stitch_cycle_time(processor, route, planned)
+        baseline_seconds = stitch_cycle_time(processor, route, baseline)
+        if planned_seconds >= baseline_seconds:
+            raise AssertionError(f"Hız planı {kind} rotasında çalışma süresini kısaltmıyor "
+                                 f"({planned_seconds:.2f} s >= {baseline_seconds:.2f} s)")
+
+def bench_apply_punteriz(kind, points):
+    xs, ys = generate_route(kind, points)
+    processor = make_processor()
+    route = Route(xs, ys, 1, None, *processor.calibration_offset())
+    return lambda: processor.apply_punteriz(route)
+
+def bench_process_routes(kind, points):
+    # Noktalar POINTS_PER_ROUTE_FILE büyüklüğünde rota dosyalarına bölünür
+    route_count = max(1, math.ceil(points / POINTS_PER_ROUTE_FILE))
+    folder = tempfile.TemporaryDirectory(prefix="gcode_bench_")
+    write_routes_folder(folder.name, route_count, min(points, POINTS_PER_ROUTE_FILE), kind)
+    processor = make_processor()
+
+    def run():
+        # Her çalıştırma soğuktur: yeni rota deposu, önbellek kapalı
+        multi_processor = MultiRouteProcessor()
+        multi_processor.processor = processor
+        multi_processor.routes_folder = folder.name
+        multi_processor.route_cache = None
+        multi_processor.process_routes()
+    run.folder = folder  # Geçici klasör benchmark bitene kadar silinmesin
+    return run
+
+BENCHMARKS = {
+    'load_file_content': bench_load_file_content,
+    'apply_calibration': bench_apply_calibration,
+    'calculate_speed': bench_calculate_speed,
+    'speed_profile': bench_speed_profile,
+    'feed_plan': bench_feed_plan,
+    'apply_punteriz': bench_apply_punteriz,
+    'process_routes': bench_process_routes,
+}
+
+def best_time(function, repeat):
+    """Fonksiyonu repeat kez çalıştırır ve en iyi süreyi (saniye) döndürür."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(functions=None, kinds=None, sizes=None, repeat=3, progress=None):
+    """Seçilen benchmark'ları çalıştırır; {"fonksiyon/tür/boyut": saniye} döndürür."""
+    results = {}
+    for name in functions or BENCHMARKS:
+        for kind in kinds or GENERATORS:
+            for size in sizes or DEFAULT_SIZES:
+                benchmark = BENCHMARKS[name](kind, SIZES[size])
+                key = f"{name}/{kind}/{size}"
+                results[key] = best_time(benchmark, repeat)
+                if progress is not None:
+                    progress(key, results[key])
+    return results
+
+def format_comparison(comparison):
+    """Karşılaştırma sonuçlarını tablo olarak biçimlendirir."""
+    lines = [f"{'Benchmark':<36} {'Süre (ms)':>11} {'Önceki (ms)':>12} {'Oran':>7}"]
+    for key, (seconds, before, ratio) in comparison.items():
+        before_text = f"{before * 1000:12.2f}" if before is not None else f"{'-':>12}"
+        ratio_text = f"x{ratio:6.2f}" if ratio is not None else f"{'-':>7}"
+        lines.append(f"{key:<36} {seconds * 1000:11.2f} {before_text} {ratio_text}")
+    return '\n'.join(lines)
+
+def parse_list(value, choices):
+    """Virgülle ayrılmış seçimi doğrular ("all" tüm seçenekleri seçer)."""
+    if value == 'all':
+        return list(choices)
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen seçim: {', '.join(unknown)} (seçenekler: {', '.join(choices)})")
+    return items
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_processing",
+                                     description="İşleme yolundaki fonksiyonları sentetik rotalarla ölçer.")
+    parser.add_argument('--functions', type=lambda v: parse_list(v, BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--kinds', type=lambda v: parse_list(v, GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--sizes', type=lambda v: parse_list(v, SIZES), default=DEFAULT_SIZES,
+                        help=f"Nokta sayıları: {', '.join(SIZES)} veya all (varsayılan: {','.join(DEFAULT_SIZES)})")
+    parser.add_argument('--repeat', type=int, default=3, help="Her ölçümün tekrar sayısı (en iyisi alınır)")
+    parser.add_argument('--history', default=history.HISTORY_FILE, help="Sonuç geçmişi dosyası")
+    parser.add_argument('--no-save', action='store_true', help="Sonuçları geçmiş dosyasına ekleme")
+    args = parser.parse_args(argv)
+
+    results = run(args.functions, args.kinds, args.sizes, args.repeat,
+                  progress=lambda key, seconds: print(f"  {key:<36} {seconds * 1000:11.2f} ms", file=sys.stderr))
+
+    previous = history.previous_run(SUITE, args.history)
+    print(format_comparison(history.compare(results, previous)))
+    if previous is not None:
+        print(f"Önceki çalıştırma: {previous['timestamp']} ({previous.get('commit') or '-'})")
+
+    if not args.no_save:
+        history.append_run(history.make_run(SUITE, results, repeat=args.repeat), args.history)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
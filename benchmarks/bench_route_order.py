@@ -0,0 +1,102 @@
+"""
+Rota sıralaması (models/route_order.py) için ölçekleme benchmark'ı.
+
+    python -m benchmarks.bench_route_order
+    python -m benchmarks.bench_route_order --sizes 1000,5000,20000,40000 --layouts hoop
+
+Her yerleşim ve rota sayısı için ters çevirme kapalı ve açıkken planlama süresini ve
+planlanan sıradaki toplam boş geçişi yazdırır. Ölçekleme üssü en küçük ve en büyük
+boyut arasındaki süre oranından hesaplanır (1.0 = doğrusal).
+"""
+import argparse
+import math
+import random
+import sys
+import time
+
+from models.route_order import plan_route_order
+
+# Kasnak boyutu (mm)
+HOOP_SIZE = 300.0
+
+def scatter_layout(count, rng):
+    """Alana eşit dağılmış kısa rotalar (rota başına ~900 mm² alan)."""
+    side = math.sqrt(count) * 30.0
+    routes = []
+    for _ in range(count):
+        x, y = rng.uniform(0, side), rng.uniform(0, side)
+        routes.append(((x, y), (x + rng.uniform(-20, 20), y + rng.uniform(-20, 20))))
+    return routes
+
+def cluster_layout(count, rng, clusters=20):
+    """Birkaç motifte yoğunlaşmış kısa rotalar; rota sayısı arttıkça motifler yoğunlaşır."""
+    centers = [(rng.uniform(0, 2000), rng.uniform(0, 2000)) for _ in range(clusters)]
+    routes = []
+    for _ in range(count):
+        cx, cy = rng.choice(centers)
+        x, y = rng.gauss(cx, 30), rng.gauss(cy, 30)
+        routes.append(((x, y), (x + rng.uniform(-5, 5), y + rng.uniform(-5, 5))))
+    return routes
+
+def hoop_layout(count, rng):
+    """Tek kasnak içinde başı ve sonu rastgele uzun rotalar (ters çevirmenin en çok iş yaptığı durum)."""
+    return [((rng.uniform(0, HOOP_SIZE), rng.uniform(0, HOOP_SIZE)),
+             (rng.uniform(0, HOOP_SIZE), rng.uniform(0, HOOP_SIZE))) for _ in range(count)]
+
+LAYOUTS = {
+    'scatter': scatter_layout,
+    'clusters': cluster_layout,
+    'hoop': hoop_layout,
+}
+
+DEFAULT_SIZES = [1000, 5000, 20000]
+
+def run(layouts=None, sizes=None, seed=1, progress=None):
+    """Seçilen yerleşimlerde planlamayı çalıştırır; {(yerleşim, ters, rota sayısı): (saniye, boş geçiş mm)} döndürür."""
+    results = {}
+    for layout in layouts or LAYOUTS:
+        for allow_reverse in (False, True):
+            for count in sizes or DEFAULT_SIZES:
+                endpoints = LAYOUTS[layout](count, random.Random(seed))
+                start = time.perf_counter()
+                ordering = plan_route_order(endpoints, (0.0, 0.0), (0.0, 0.0), allow_reverse)
+                seconds = time.perf_counter() - start
+                results[layout, allow_reverse, count] = (seconds, ordering.optimized_mm)
+                if progress is not None:
+                    progress(layout, allow_reverse, count, seconds, ordering.optimized_mm)
+    return results
+
+def scaling_exponent(results, layout, allow_reverse, sizes):
+    """En küçük ve en büyük boyut arasındaki süre oranının üssünü döndürür."""
+    small, large = min(sizes), max(sizes)
+    if small == large:
+        return None
+    ratio = results[layout, allow_reverse, large][0] / results[layout, allow_reverse, small][0]
+    return math.log(ratio) / math.log(large / small)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_route_order",
+                                     description="Rota sıralamasının süresini rota sayısıyla ölçer.")
+    parser.add_argument('--layouts', default=','.join(LAYOUTS),
+                        help=f"Virgülle ayrılmış yerleşimler: {', '.join(LAYOUTS)}")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help="Virgülle ayrılmış rota sayıları")
+    args = parser.parse_args(argv)
+    layouts = [layout.strip() for layout in args.layouts.split(',') if layout.strip()]
+    unknown = [layout for layout in layouts if layout not in LAYOUTS]
+    if unknown:
+        parser.error(f"Bilinmeyen yerleşim: {', '.join(unknown)}")
+    sizes = sorted(int(size) for size in args.sizes.split(','))
+
+    print(f"{'Yerleşim':<10} {'Ters':<6} {'Rota':>7} {'Süre (s)':>9} {'Boş geçiş (m)':>14}")
+    results = run(layouts, sizes, progress=lambda layout, allow_reverse, count, seconds, travel_mm: print(
+        f"{layout:<10} {'açık' if allow_reverse else 'kapalı':<6} {count:>7} {seconds:9.2f} {travel_mm / 1000:14.1f}", flush=True))
+
+    for layout in layouts:
+        for allow_reverse in (False, True):
+            exponent = scaling_exponent(results, layout, allow_reverse, sizes)
+            if exponent is not None:
+                print(f"Ölçekleme üssü {layout} (ters {'açık' if allow_reverse else 'kapalı'}): {exponent:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
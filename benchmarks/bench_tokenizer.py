@@ -0,0 +1,43 @@
+import random
+import re
+import timeit
+from models.gcode_tokenizer import parse_xy, tokenize
+
+# Eski GCodeProcessor.is_coordinate_line deseni (her çağrıda derlenmemiş desenle re.match)
+LEGACY_PATTERN = r'^X\d+\.?\d*\s+Y\d+\.?\d*(?:\s+Z\d+\.?\d*)?$'
+
+def legacy_parse_xy(line):
+    """Eski satır başı yol: re.match + str.split + float()"""
+    line = line.strip()
+    if not (line.startswith('X') and ' Y' in line):
+        return None
+    if not re.match(LEGACY_PATTERN, line):
+        return None
+    parts = line.split()
+    return float(parts[0][1:]), float(parts[1][1:])
+
+def make_lines(count, seed=0):
+    """Tipik bir CAM çıktısına benzeyen koordinat satırları üretir."""
+    rng = random.Random(seed)
+    return [f"X{rng.uniform(0, 500):.2f} Y{rng.uniform(0, 500):.2f}" for _ in range(count)]
+
+def run(count=100000, repeat=5):
+    """Eski regex yolu ile yeni ayrıştırıcıyı karşılaştırır ve süreleri (saniye) döndürür."""
+    lines = make_lines(count)
+    results = {
+        'legacy_regex': min(timeit.repeat(lambda: [legacy_parse_xy(l) for l in lines], number=1, repeat=repeat)),
+        'parse_xy': min(timeit.repeat(lambda: [parse_xy(l) for l in lines], number=1, repeat=repeat)),
+        'tokenize': min(timeit.repeat(lambda: [tokenize(l) for l in lines], number=1, repeat=repeat)),
+    }
+    return results
+
+def main():
+    count = 100000
+    results = run(count)
+    baseline = results['legacy_regex']
+    print(f"{count} koordinat satırı (en iyi süre):")
+    for name, seconds in results.items():
+        print(f"  {name:<14} {seconds * 1000:8.1f} ms  {seconds / count * 1e6:6.2f} µs/satır  x{baseline / seconds:4.2f}")
+
+if __name__ == "__main__":
+    main()
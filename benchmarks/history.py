@@ -0,0 +1,66 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+# Varsayılan sonuç geçmişi dosyası
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.json")
+
+def current_commit():
+    """Çalışma dizinindeki git commit kimliğini döndürür (bulunamazsa None)."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                cwd=os.path.dirname(HISTORY_FILE),
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+def load_history(path=HISTORY_FILE):
+    """Kayıtlı çalıştırmaları eskiden yeniye liste olarak döndürür."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def make_run(suite, results, **extra):
+    """Bir benchmark çalıştırması için geçmiş kaydı oluşturur."""
+    run = {
+        'suite': suite,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': current_commit(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results,
+    }
+    run.update(extra)
+    return run
+
+def append_run(run, path=HISTORY_FILE):
+    """Çalıştırmayı geçmiş dosyasına ekler."""
+    history = load_history(path)
+    history.append(run)
+    with open(path, 'w') as file:
+        json.dump(history, file, indent=4)
+
+def previous_run(suite, path=HISTORY_FILE):
+    """Aynı benchmark takımının en son kaydedilen çalıştırmasını döndürür (yoksa None)."""
+    for run in reversed(load_history(path)):
+        if run.get('suite') == suite:
+            return run
+    return None
+
+def compare(results, previous):
+    """
+    Sonuçları önceki çalıştırmayla karşılaştırır.
+    Her anahtar için (şimdiki süre, önceki süre, oran) döndürür; oran > 1 yavaşlama demektir.
+    """
+    previous_results = previous['results'] if previous else {}
+    comparison = {}
+    for key, seconds in results.items():
+        before = previous_results.get(key)
+        ratio = seconds / before if before else None
+        comparison[key] = (seconds, before, ratio)
+    return comparison
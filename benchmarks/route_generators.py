@@ -0,0 +1,102 @@
+import math
+import os
+import random
+from array import array
+
+# Tüm rotaların sığdığı çalışma alanı (mm)
+FIELD_SIZE = 500.0
+
+# Benchmark'larda kullanılan nokta sayıları
+SIZES = {
+    '1k': 1000,
+    '10k': 10000,
+    '100k': 100000,
+    '1M': 1000000,
+    '5M': 5000000,
+}
+
+def spiral_route(points, seed=0):
+    """Merkezden dışa doğru açılan Arşimet spirali (sabit dikiş uzunluğuna yakın)."""
+    rng = random.Random(seed)
+    center_x = rng.uniform(0.4, 0.6) * FIELD_SIZE
+    center_y = rng.uniform(0.4, 0.6) * FIELD_SIZE
+    max_radius = 0.4 * FIELD_SIZE
+    xs = array('d')
+    ys = array('d')
+    for i in range(points):
+        # Yarıçap kareköke göre büyür, böylece ardışık noktalar arası mesafe yaklaşık sabit kalır
+        t = math.sqrt(i / max(points - 1, 1))
+        radius = max_radius * t
+        angle = 2 * math.pi * math.sqrt(i) * 0.9
+        xs.append(center_x + radius * math.cos(angle))
+        ys.append(center_y + radius * math.sin(angle))
+    return xs, ys
+
+def satin_route(points, seed=0, width=4.0, spacing=0.4):
+    """Saten dolgu: yavaşça ilerleyen bir eksen boyunca iki kenar arasında zikzak."""
+    rng = random.Random(seed)
+    x = rng.uniform(0.1, 0.2) * FIELD_SIZE
+    y = rng.uniform(0.1, 0.9) * FIELD_SIZE
+    heading = rng.uniform(0, 2 * math.pi)
+    xs = array('d')
+    ys = array('d')
+    for i in range(points):
+        # Eksen yönü hafifçe kıvrılır ve alanın dışına çıkmaz
+        heading += rng.uniform(-0.02, 0.02)
+        x += spacing * math.cos(heading)
+        y += spacing * math.sin(heading)
+        if not (0 < x < FIELD_SIZE and 0 < y < FIELD_SIZE):
+            heading += math.pi
+            x = min(max(x, 0.0), FIELD_SIZE)
+            y = min(max(y, 0.0), FIELD_SIZE)
+        side = width / 2 if i % 2 else -width / 2
+        xs.append(min(max(x - side * math.sin(heading), 0.0), FIELD_SIZE))
+        ys.append(min(max(y + side * math.cos(heading), 0.0), FIELD_SIZE))
+    return xs, ys
+
+def running_route(points, seed=0, stitch_length=2.5):
+    """Yoğun düz dikiş: sabit uzunlukta, yönü yavaşça değişen dikişler."""
+    rng = random.Random(seed)
+    x = rng.uniform(0, FIELD_SIZE)
+    y = rng.uniform(0, FIELD_SIZE)
+    heading = rng.uniform(0, 2 * math.pi)
+    xs = array('d')
+    ys = array('d')
+    for _ in range(points):
+        xs.append(x)
+        ys.append(y)
+        heading += rng.gauss(0, 0.15)
+        x += stitch_length * math.cos(heading)
+        y += stitch_length * math.sin(heading)
+        # Alan kenarında geri dön
+        if not (0 < x < FIELD_SIZE and 0 < y < FIELD_SIZE):
+            heading += math.pi
+            x = min(max(x, 0.0), FIELD_SIZE)
+            y = min(max(y, 0.0), FIELD_SIZE)
+    return xs, ys
+
+GENERATORS = {
+    'spiral': spiral_route,
+    'satin': satin_route,
+    'running': running_route,
+}
+
+def generate_route(kind, points, seed=0):
+    """Belirtilen türde, aynı tohum için her zaman aynı olan (x, y) dizilerini döndürür."""
+    return GENERATORS[kind](points, seed)
+
+def route_lines(xs, ys):
+    """Koordinatları CAM çıktısındaki gibi "X.. Y.." satırlarına çevirir."""
+    return [f"X{round(x, 2)} Y{round(y, 2)} " for x, y in zip(xs, ys)]
+
+def write_routes_folder(folder, route_count, points_per_route, kind='running', seed=0):
+    """Klasöre route_count adet .nc rota dosyası yazar ve dosya yollarını döndürür."""
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for index in range(route_count):
+        xs, ys = generate_route(kind, points_per_route, seed + index)
+        path = os.path.join(folder, f"route-{index + 1:05d}.nc")
+        with open(path, 'w') as file:
+            file.write('\n'.join(route_lines(xs, ys)))
+        paths.append(path)
+    return paths
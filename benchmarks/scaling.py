@@ -0,0 +1,247 @@
+"""
+Yükle -> Oluştur -> Kaydet döngüsü için uçtan uca ölçekleme testi.
+
+    python -m benchmarks.scaling                    # varsayılan boyutlar (10k - 1M nokta)
+    python -m benchmarks.scaling --scale large      # 5M noktaya kadar
+    python -m benchmarks.scaling --update-golden    # çıktı özetlerini yeniden kaydet
+
+Her boyut ayrı bir süreçte GCodeModel ile çalıştırılır; aşama süreleri, en yüksek
+bellek kullanımı (RSS) ve çıktı boyutu ölçülür. Aşağıdaki durumlarda çıkış kodu 1 olur:
+  - bir aşama önceki çalıştırmaya göre --max-regression oranından fazla yavaşladıysa,
+  - bir aşamanın ölçekleme üssü --max-exponent değerini aştıysa (doğrusal üstü büyüme),
+  - çıktı benchmarks/golden/scaling.json dosyasındaki özetle bayt bayt aynı değilse.
+"""
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import history
+from benchmarks.route_generators import write_routes_folder
+
+SUITE = "scaling"
+
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden", "scaling.json")
+
+STAGES = ('load', 'generate', 'save')
+
+# (rota sayısı, rota başına nokta sayısı)
+SCALES = {
+    'small': [(10, 1000), (10, 10000), (50, 10000), (100, 10000)],
+    'large': [(10, 1000), (10, 10000), (100, 10000), (100, 20000), (100, 50000)],
+}
+
+# Ölçümde kullanılan sabit parametreler (parameters.json biçiminde)
+PARAMETERS = {
+    "start_params": ["% G-Code Starting Parameters", "M115", "G04 P200", "X5 Y26"],
+    "route_start_params": ["G01 G90 F10000", "M114", "G04 P200"],
+    "thread_cut_params": ["% Cutting Parameters", "Z28", "G04 P50", "M124", "G04 P50", "M112"],
+    "end_params": ["% G-Code End Parameters", "F10000", "X5 Y26", "M111", "M2"],
+    "z_positions": {"needle_down": "Z3", "needle_up": "Z30"},
+    "machine_calibration": {"x_value": "21.57", "y_value": "388.60"},
+    "punteriz_enabled": True,
+    "punteriz_start": "2",
+    "punteriz_end": "2",
+    "bobbin_enabled": True,
+    "bobbin_reset_value": "1",
+}
+
+def case_name(route_count, points_per_route):
+    return f"{route_count}x{points_per_route}"
+
+def peak_rss_bytes():
+    """Sürecin en yüksek bellek kullanımını bayt olarak döndürür (desteklenmiyorsa None)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def file_digest(path):
+    """Dosyanın SHA-256 özetini döndürür."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def run_cycle(work_dir, output_path):
+    """Yeni bir GCodeModel ile Yükle -> Oluştur -> Kaydet döngüsünü bir kez çalıştırır ve aşama sürelerini döndürür."""
+    from models.gcode_model import GCodeModel
+
+    model = GCodeModel(parameters_file=os.path.join(work_dir, "parameters.json"),
+                       routes_folder=os.path.join(work_dir, "routes"),
+                       output_folder=work_dir)
+    model.apply_parameters(GCodeModel.parameters_from_file(model.load_default_parameters()))
+
+    seconds = {}
+    start = time.perf_counter()
+    model.load_route_files()
+    seconds['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.process_gcode()
+    seconds['generate'] = time.perf_counter() - start
+
+    # Arayüzdeki gibi: düzenlenmemiş çıktı kaydedilir
+    start = time.perf_counter()
+    model.save_generated_gcode(output_path)
+    seconds['save'] = time.perf_counter() - start
+    return seconds
+
+def run_case(work_dir, repeat=1):
+    """
+    Tek bir boyutu çalıştırır (ayrı süreçte çağrılır, böylece RSS ölçümü boyuta özeldir).
+    Her aşamanın en iyi süresini, en yüksek RSS değerini, çıktı boyutunu ve özetini döndürür.
+    """
+    output_path = os.path.join(work_dir, "output.nc")
+    runs = [run_cycle(work_dir, output_path) for _ in range(repeat)]
+
+    return {
+        'seconds': {stage: min(run[stage] for run in runs) for stage in STAGES},
+        'peak_rss': peak_rss_bytes(),
+        'bytes': os.path.getsize(output_path),
+        'sha256': file_digest(output_path),
+    }
+
+def prepare_case(work_dir, route_count, points_per_route, **overrides):
+    """Klasöre boyutun rota dosyalarını ve parametre dosyasını (overrides ile değiştirilmiş) yazar."""
+    write_routes_folder(os.path.join(work_dir, "routes"), route_count, points_per_route)
+    with open(os.path.join(work_dir, "parameters.json"), 'w') as file:
+        json.dump(dict(PARAMETERS, **overrides), file, indent=4)
+
+def measure(route_count, points_per_route, repeat=1):
+    """Rota klasörünü oluşturur ve boyutu yeni bir süreçte ölçer."""
+    with tempfile.TemporaryDirectory(prefix="gcode_scaling_") as work_dir:
+        prepare_case(work_dir, route_count, points_per_route)
+
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(processes=1) as pool:
+            result = pool.apply(run_case, (work_dir, repeat))
+
+    result['points'] = route_count * points_per_route
+    return result
+
+def fit_exponent(points, seconds):
+    """log(süre) = a + b * log(nokta) doğrusuna en küçük kareler uydurur ve b üssünü döndürür."""
+    pairs = [(math.log(n), math.log(t)) for n, t in zip(points, seconds) if n > 0 and t > 0]
+    if len(pairs) < 2:
+        return None
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    variance = sum((x - mean_x) ** 2 for x, _ in pairs)
+    if variance == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in pairs) / variance
+
+def load_golden(path=GOLDEN_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as file:
+        return json.load(file)
+
+def save_golden(golden, path=GOLDEN_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        json.dump(golden, file, indent=4, sort_keys=True)
+
+def check(cases, previous, golden, max_regression, max_exponent, min_seconds):
+    """Gerilemeleri, doğrusal üstü büyümeyi ve çıktı farklarını denetler; hata mesajlarını döndürür."""
+    failures = []
+
+    # Çıktı bayt bayt aynı olmalı
+    for name, case in cases.items():
+        expected = golden.get(name)
+        if expected is not None and (case['sha256'], case['bytes']) != (expected['sha256'], expected['bytes']):
+            failures.append(f"{name}: çıktı altın dosyadan farklı ({case['bytes']} / {expected['bytes']} bayt)")
+
+    # Önceki çalıştırmaya göre gerileme (çok kısa ölçümler gürültü sayılır)
+    previous_cases = previous.get('cases', {}) if previous else {}
+    for name, case in cases.items():
+        before = previous_cases.get(name)
+        if before is None:
+            continue
+        for stage in STAGES:
+            now, then = case['seconds'][stage], before['seconds'].get(stage)
+            if then and now > then * (1 + max_regression) and now - then > min_seconds:
+                failures.append(f"{name}/{stage}: {then:.3f} s -> {now:.3f} s (x{now / then:.2f})")
+
+    # Ölçekleme üssü
+    points = [case['points'] for case in cases.values()]
+    for stage in STAGES:
+        exponent = fit_exponent(points, [case['seconds'][stage] for case in cases.values()])
+        if exponent is not None and exponent > max_exponent:
+            failures.append(f"{stage}: ölçekleme üssü {exponent:.2f} > {max_exponent:.2f} (doğrusal üstü)")
+
+    return failures
+
+def format_report(cases):
+    lines = [f"{'Boyut':<10} {'Nokta':>9} {'Yükle (s)':>10} {'Oluştur (s)':>12} {'Kaydet (s)':>11} "
+             f"{'RSS (MB)':>9} {'Çıktı (MB)':>11}"]
+    for name, case in cases.items():
+        rss = f"{case['peak_rss'] / 2 ** 20:9.1f}" if case['peak_rss'] else f"{'-':>9}"
+        lines.append(f"{name:<10} {case['points']:9d} {case['seconds']['load']:10.3f} "
+                     f"{case['seconds']['generate']:12.3f} {case['seconds']['save']:11.3f} "
+                     f"{rss} {case['bytes'] / 2 ** 20:11.2f}")
+    points = [case['points'] for case in cases.values()]
+    exponents = []
+    for stage in STAGES:
+        exponent = fit_exponent(points, [case['seconds'][stage] for case in cases.values()])
+        exponents.append(f"{stage} {exponent:.2f}" if exponent is not None else f"{stage} -")
+    lines.append("Ölçekleme üssü (1.0 = doğrusal): " + ", ".join(exponents))
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scaling",
+                                     description="Yükle -> Oluştur -> Kaydet döngüsünün ölçeklenmesini ölçer.")
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help="Önceki çalıştırmaya göre izin verilen yavaşlama oranı (varsayılan: 0.25)")
+    parser.add_argument('--max-exponent', type=float, default=1.2,
+                        help="İzin verilen en yüksek ölçekleme üssü (varsayılan: 1.2)")
+    parser.add_argument('--min-seconds', type=float, default=0.1,
+                        help="Bu süreden küçük farklar gerileme sayılmaz (varsayılan: 0.1)")
+    parser.add_argument('--repeat', type=int, default=3, help="Her boyut için tekrar sayısı (en iyisi alınır)")
+    parser.add_argument('--history', default=history.HISTORY_FILE)
+    parser.add_argument('--update-golden', action='store_true', help="Çıktı özetlerini altın dosyaya yaz")
+    parser.add_argument('--no-save', action='store_true', help="Sonuçları geçmiş dosyasına ekleme")
+    args = parser.parse_args(argv)
+
+    cases = {}
+    for route_count, points_per_route in SCALES[args.scale]:
+        name = case_name(route_count, points_per_route)
+        cases[name] = measure(route_count, points_per_route, args.repeat)
+        print(f"  {name} tamamlandı", file=sys.stderr)
+
+    print(format_report(cases))
+
+    golden = load_golden()
+    if args.update_golden:
+        golden.update({name: {'sha256': case['sha256'], 'bytes': case['bytes']} for name, case in cases.items()})
+        save_golden(golden)
+        print(f"Altın dosya güncellendi: {GOLDEN_FILE}")
+
+    previous = history.previous_run(SUITE, args.history)
+    failures = check(cases, previous, golden, args.max_regression, args.max_exponent, args.min_seconds)
+
+    if not args.no_save:
+        results = {f"{name}/{stage}": case['seconds'][stage] for name, case in cases.items() for stage in STAGES}
+        history.append_run(history.make_run(SUITE, results, cases=cases), args.history)
+
+    if failures:
+        print("BAŞARISIZ:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("Tüm denetimler geçti.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+G-CODE Editor komut satırı arayüzü - rota klasörlerini arayüz açmadan G-Code'a dönüştürür.
+
+Örnekler:
+    python -m cli routes -p parameters.json -o cikti.nc
+    python -m cli gece/rota_* -p parameters.json -o gece_cikti -j 4
+
+Bu modül PyQt5 içe aktarmaz; yalnızca model katmanını kullanır.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from models.cycle_time import format_duration
+from models.gcode_model import GCodeModel
+from utils.memory_profile import start_memory_profile, stop_memory_profile
+from utils.run_trace import RunLog, RunTrace, activate
+
+# Çıktı yolu verilmediğinde kullanılan klasör
+DEFAULT_OUTPUT_FOLDER = "gcode_output"
+
+def run_job(routes_folder, parameters_file, output_path, overrides=None, memory=False, log_run=True):
+    """
+    Tek bir rota klasörünü işler ve iş raporunu sözlük olarak döndürür.
+    overrides, parameters.json değerlerinin üzerine yazılan parametrelerdir (get_parameters biçiminde).
+    memory True ise aşamaların bellek kullanımı da ölçülür (belirgin şekilde yavaştır).
+    log_run False ise çalıştırma kaydı günlüğe yazılmaz, raporun 'run_record' alanında döndürülür
+    (çalışan süreçler günlük dosyasına kendileri yazmaz, bkz. record_runs).
+    """
+    report = {
+        'routes': routes_folder,
+        'output': output_path,
+        'route_count': 0,
+        'bytes': 0,
+        'seconds': 0.0,
+        'stages': {},
+        'error': None
+    }
+    if memory:
+        start_memory_profile()
+    start = time.perf_counter()
+    model = None
+    trace = RunTrace('batch')
+    try:
+        with activate(trace):
+            model = GCodeModel(parameters_file=parameters_file, routes_folder=routes_folder)
+            params = GCodeModel.parameters_from_file(model.load_default_parameters())
+            params.update(overrides or {})
+            # Komut satırında parameters.json dosyasına yazılmaz
+            model.apply_parameters(params)
+
+            report['route_count'] = len(model.multi_processor.load_route_files())
+            model.save_gcode(model.iter_gcode(), output_path)
+        report['bytes'] = os.path.getsize(output_path)
+        compaction = model.compaction_summary()
+        if compaction is not None:
+            report['compaction'] = compaction
+        simplification = model.simplification_summary()
+        if simplification is not None:
+            report['simplification'] = simplification
+        ordering = model.ordering_summary()
+        if ordering is not None:
+            report['ordering'] = ordering
+        report['cycle_time'] = model.cycle_time_summary()
+    except Exception as e:
+        report['error'] = str(e)
+    report['seconds'] = time.perf_counter() - start
+    report['stages'] = {stage: round(entry['seconds'], 6) for stage, entry in trace.breakdown()}
+    if memory:
+        report['memory'] = stop_memory_profile().stages
+    if model is not None:
+        status = 'failed' if report['error'] else 'ok'
+        if log_run:
+            model.record_run(trace, status, routes_folder=routes_folder, output=output_path)
+        else:
+            report['run_record'] = RunLog.make_record(trace, status=status, routes_folder=routes_folder,
+                                                      output=output_path)
+    return report
+
+def _run_job(job):
+    """Süreç havuzu için run_job sarmalayıcısı"""
+    return run_job(*job)
+
+def build_jobs(routes_folders, parameters_file, output=None):
+    """Her rota klasörü için (klasör, parametre dosyası, çıktı yolu) işlerini oluşturur."""
+    if output is not None and len(routes_folders) == 1 and not os.path.isdir(output):
+        return [(routes_folders[0], parameters_file, output)]
+
+    # Çıktı bir klasördür, dosya adları rota klasörünün adından gelir
+    output = output or DEFAULT_OUTPUT_FOLDER
+    jobs = []
+    for routes_folder in routes_folders:
+        name = os.path.basename(os.path.normpath(routes_folder))
+        jobs.append((routes_folder, parameters_file, os.path.join(output, f"{name}.nc")))
+    return jobs
+
+def run_jobs(jobs, workers=1, overrides=None, memory=False):
+    """İşleri sırayla ya da birden fazla süreçte çalıştırır; raporları iş sırasıyla döndürür."""
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job + (overrides, memory)) for job in jobs]
+    # Çalışan süreçler çalıştırma kayıtlarını raporla döndürür; günlüğe yalnızca bu süreç yazar
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        reports = list(executor.map(_run_job, [job + (overrides, memory, False) for job in jobs]))
+    record_runs(reports)
+    return reports
+
+def record_runs(reports, run_log=None):
+    """Raporlardaki çalıştırma kayıtlarını çıkarır ve sırayla çalıştırma günlüğüne ekler."""
+    run_log = run_log or RunLog()
+    for report in reports:
+        record = report.pop('run_record', None)
+        if record is None:
+            continue
+        try:
+            run_log.append_record(record)
+        except OSError as e:
+            # Günlük yazılamaması işi başarısız saymaz
+            print(f"Çalıştırma günlüğü yazılamadı: {str(e)}")
+
+def format_report(reports, wall_seconds):
+    """İş raporlarını okunabilir tablo olarak biçimlendirir."""
+    lines = [f"{'Süre (s)':>9}  {'Rota':>5}  {'Boyut (KB)':>10}  Klasör -> Çıktı"]
+    for report in reports:
+        if report['error']:
+            lines.append(f"{report['seconds']:9.3f}  {'-':>5}  {'-':>10}  {report['routes']}: HATA: {report['error']}")
+        else:
+            lines.append(
+                f"{report['seconds']:9.3f}  {report['route_count']:5d}  {report['bytes'] / 1024:10.1f}  "
+                f"{report['routes']} -> {report['output']}"
+            )
+    for report in reports:
+        if report.get('cycle_time') is not None:
+            cycle_time = report['cycle_time']
+            lines.append(f"  {report['routes']}: tahmini çalışma süresi {format_duration(cycle_time['total_seconds'])} "
+                         f"(hareket {format_duration(cycle_time['motion_seconds'])}, "
+                         f"bekleme {format_duration(cycle_time['dwell_seconds'])})")
+        if 'compaction' in report:
+            compaction = report['compaction']
+            lines.append(f"  {report['routes']}: sıkıştırma {compaction['lines_in'] - compaction['lines_out']} satır, "
+                         f"{compaction['bytes_saved'] / 1024:.1f} KB kazandı")
+        if 'simplification' in report:
+            simplification = report['simplification']
+            lines.append(f"  {report['routes']}: sadeleştirme {simplification['points_removed']} nokta, "
+                         f"{simplification['lines_removed']} satır attı")
+        if 'ordering' in report:
+            ordering = report['ordering']
+            lines.append(f"  {report['routes']}: rota sıralaması boş geçişi {ordering['saved_mm']:.1f} mm "
+                         f"(~{ordering['saved_seconds']:.1f} s) kısalttı, {ordering['reversed']} rota ters")
+        # Bellek ölçümü açıksa her işin aşama bellek kullanımı
+        for stage, usage in report.get('memory', {}).items():
+            lines.append(f"  {report['routes']} / {stage}: net {usage['net'] / 2 ** 20:.2f} MB, "
+                         f"tepe {usage['peak'] / 2 ** 20:.2f} MB")
+            for entry in usage['top'][:3]:
+                lines.append(f"      {entry['bytes'] / 2 ** 20:8.2f} MB  {entry['line']}")
+    failed = sum(1 for report in reports if report['error'])
+    lines.append(f"{len(reports)} iş, {failed} hata, toplam süre {wall_seconds:.3f} s")
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Rota klasörlerini arayüz açmadan G-Code dosyalarına dönüştürür."
+    )
+    parser.add_argument('routes', nargs='+', help="İşlenecek rota klasör(ler)i (.nc dosyaları)")
+    parser.add_argument('-p', '--parameters', default="parameters.json", help="Parametre dosyası (varsayılan: parameters.json)")
+    parser.add_argument('-o', '--output',
+                        help="Tek klasör için çıktı dosyası; birden fazla klasör için çıktı klasörü "
+                             f"(varsayılan: {DEFAULT_OUTPUT_FOLDER}/<klasör adı>.nc)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Aynı anda çalışacak iş (süreç) sayısı")
+    parser.add_argument('--parallel-routes', action='store_true', help="Her işin rotalarını da paralel işle")
+    parser.add_argument('--compact', action='store_true', help="Çıktıdaki gereksiz kelime ve satırları at")
+    parser.add_argument('--merge-needle-up', action='store_true',
+                        help="İğne kaldırma satırını sonraki XY satırına birleştir (--compact ile birlikte)")
+    parser.add_argument('--simplify', action='store_true',
+                        help="Hız profilinden önce yinelenen ve doğrusal dikiş noktalarını at")
+    parser.add_argument('--tolerance', type=float, metavar="MM",
+                        help="Sadeleştirme toleransı, mm (--simplify ile birlikte; varsayılan parameters.json)")
+    parser.add_argument('--min-stitch', type=float, metavar="MM",
+                        help="Bundan kısa dikişleri at, mm (--simplify ile birlikte)")
+    parser.add_argument('--plan-feed', action='store_true',
+                        help="Hızı nokta sırası yerine dikiş uzunluğu ve köşe açısına göre planla")
+    parser.add_argument('--optimize-order', action='store_true',
+                        help="Rotaları aralarındaki boş geçişi kısaltacak sırayla işle")
+    parser.add_argument('--allow-reverse', action='store_true',
+                        help="Sıralamada rotaların sondan başa dikilmesine izin ver (--optimize-order ile birlikte)")
+    parser.add_argument('--memory', action='store_true',
+                        help="Aşamaların bellek kullanımını ve en çok bellek ayıran satırları raporla (yavaş)")
+    parser.add_argument('--json', action='store_true', help="Raporu JSON olarak yazdır")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.parameters):
+        parser.error(f"Parametre dosyası bulunamadı: {args.parameters}")
+    # Komut satırı seçenekleri parameters.json değerlerinin üzerine yazılır
+    overrides = {}
+    if args.parallel_routes:
+        overrides['parallel_processing'] = True
+    if args.compact or args.merge_needle_up:
+        overrides['compact_output'] = True
+        overrides['merge_needle_up'] = args.merge_needle_up
+    if args.simplify or args.tolerance is not None or args.min_stitch is not None:
+        overrides['simplify_enabled'] = True
+        if args.tolerance is not None:
+            overrides['simplify_tolerance'] = str(args.tolerance)
+        if args.min_stitch is not None:
+            overrides['min_stitch_length'] = str(args.min_stitch)
+    if args.plan_feed:
+        overrides['feed_planning'] = True
+    if args.optimize_order or args.allow_reverse:
+        overrides['optimize_route_order'] = True
+        overrides['allow_route_reversal'] = args.allow_reverse
+
+    start = time.perf_counter()
+    reports = run_jobs(build_jobs(args.routes, args.parameters, args.output), args.jobs,
+                       overrides, args.memory)
+    wall_seconds = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({'jobs': reports, 'seconds': wall_seconds}, indent=4, ensure_ascii=False))
+    else:
+        print(format_report(reports, wall_seconds))
+
+    return 1 if any(report['error'] for report in reports) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+from models.multi_route_processor import RouteProcessingCancelled
+from utils import run_trace
+
+class GCodeWorker(QThread):
+    """
+    Uzun süren rota işlemlerini (yükleme, G-Code oluşturma) arayüz iş parçacığının
+    dışında çalıştıran sınıf. İş fonksiyonu job(progress, is_cancelled) şeklinde çağrılır.
+    trace verilirse iş süresince bu iş parçacığında etkin çalışma izlemesi olur.
+    """
+    progress = pyqtSignal(int, int)  # Tamamlanan rota, toplam rota
+    succeeded = pyqtSignal(object)   # İşin sonucu
+    failed = pyqtSignal(str)         # Hata mesajı
+    cancelled = pyqtSignal()
+
+    def __init__(self, job, trace=None, parent=None):
+        super().__init__(parent)
+        self.job = job
+        self.trace = trace
+        self.status = None  # 'ok', 'failed' veya 'cancelled'
+
+    def run(self):
+        """İşi çalıştırır ve sonucu sinyallerle arayüz iş parçacığına iletir."""
+        try:
+            with run_trace.activate(self.trace):
+                result = self.job(self.progress.emit, self.isInterruptionRequested)
+        except RouteProcessingCancelled:
+            self.status = 'cancelled'
+            self.cancelled.emit()
+        except Exception as e:
+            self.status = 'failed'
+            self.failed.emit(str(e))
+        else:
+            self.status = 'ok'
+            self.succeeded.emit(result)
+
+    def cancel(self):
+        """Bir sonraki rotadan önce durması için işe iptal isteği gönderir."""
+        self.requestInterruption()
@@ -1,6 +1,13 @@
+import os
+from PyQt5.QtWidgets import QApplication
+from models.cycle_time import format_duration
 from models.gcode_model import GCodeModel
 from views.main_view import MainView
+from controllers.gcode_worker import GCodeWorker
 from utils.language import LanguageManager
+from utils.run_trace import RunTrace, activate, span
+from utils.profiler import PROFILE_FOLDER, RunProfiler, profiling_enabled
+from utils.memory_profile import memory_profiling_enabled, memory_stage, start_memory_profile
 
 class MainController:
     """
@@ -10,12 +17,23 @@ class MainController:
     def __init__(self, model, view):
         self.model = model
         self.view = view
+        self.showing_generated = False  # Editörde oluşturulmuş G-Code'un gösterilip gösterilmediği
+        self.worker = None  # Arka planda çalışan yükleme / oluşturma işi
+        self.profile_next_run = False  # Bir sonraki Yükle / Oluştur işlemi profillensin mi
+        self.profiler = None  # Çalışan işin profilleyicisi
+        
+        # Bellek ölçümü açıksa aşama bellek kullanımları çalıştırma izlemesine eklenir
+        if memory_profiling_enabled():
+            start_memory_profile()
         
         # View olaylarını bağla
         self.connect_signals()
         
-        # Varsayılan parametreleri yükle
-        self.load_default_parameters()
+        # Parametre panelleri hazır olduğunda varsayılan parametreleri yükle
+        if self.view.parameter_panels_built:
+            self.init_parameter_panels()
+        else:
+            self.view.panels_ready.connect(self.init_parameter_panels)
         
     def connect_signals(self):
         """View'daki butonları controller fonksiyonlarına bağlar."""
@@ -23,10 +41,25 @@ class MainController:
         self.view.reset_btn.clicked.connect(self.reset_parameters)
         self.view.load_btn.clicked.connect(self.load_file)
         self.view.save_btn.clicked.connect(self.save_file)
+        self.view.cancel_btn.clicked.connect(self.cancel_job)
+        self.view.profile_action.triggered.connect(self.arm_profiler)
         
+        # Uygulama kapanırken çalışan işi durdur
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+    
+    def init_parameter_panels(self):
+        """Parametre paneli olaylarını bağlar ve varsayılan parametreleri yükler."""
         # Checkbox olaylarını bağla
         self.view.punteriz_enabled.stateChanged.connect(self.toggle_punteriz_input)
         self.view.bobbin_enabled.stateChanged.connect(self.toggle_bobbin_input)
+        self.view.compact_output.stateChanged.connect(self.toggle_compaction_input)
+        self.view.optimize_route_order.stateChanged.connect(self.toggle_ordering_input)
+        self.view.simplify_points.stateChanged.connect(self.toggle_simplify_input)
+        
+        # Varsayılan parametreleri yükle
+        self.load_default_parameters()
     
     def load_default_parameters(self):
         """Varsayılan parametreleri yükler."""
@@ -37,7 +70,9 @@ class MainController:
             self.view.show_error(str(e))
     
     def update_parameters(self):
-        """Parametreleri günceller ve G-CODE'u işler."""
+        """Parametreleri günceller ve G-CODE'u arka planda işler."""
+        if self.is_busy():
+            return
         try:
             # Arayüzdeki parametreleri al
             params = self.view.get_parameters()
@@ -46,48 +81,194 @@ class MainController:
             self.model.update_processor_parameters(params)
             
             # Mevcut içeriği kontrol et
-            content = self.view.get_gcode_content()
-            if not content:
+            if not self.view.has_gcode_content():
                 self.view.show_warning(LanguageManager.get_text('msg_no_content', self.view.current_language))
                 return
             
-            # İçeriği işle
-            processed_content = self.model.process_gcode()
-            
-            # İşlenmiş içeriği görüntüle
-            self.view.set_gcode_content(processed_content)
-            
-            self.view.show_info(LanguageManager.get_text('msg_gcode_generated', self.view.current_language))
+            # İçeriği arka planda işle
+            self.start_job(
+                lambda progress, is_cancelled: self.model.process_gcode(progress, is_cancelled),
+                'label_generating_routes',
+                self.generation_finished,
+                'generate'
+            )
                 
         except Exception as e:
             self.view.show_error(f"{str(e)}")
     
-    def load_file(self):
-        """Rota dosyalarını yükler."""
-        try:
-            # Dosyaları yükle ve işle
-            content = self.model.load_route_files()
-            
-            # İçeriği görüntüle
+    def generation_finished(self, processed_content):
+        """Arka planda oluşturulan G-Code'u görüntüler."""
+        self.display_content(processed_content)
+        self.showing_generated = True
+        
+        message = LanguageManager.get_text('msg_gcode_generated', self.view.current_language)
+        compaction = self.model.compaction_summary()
+        if compaction is not None:
+            saved_percent = 100.0 * compaction['bytes_saved'] / compaction['bytes_in'] if compaction['bytes_in'] else 0.0
+            message += "\n" + LanguageManager.get_text('msg_compaction_saved', self.view.current_language).format(
+                compaction['lines_in'] - compaction['lines_out'], compaction['bytes_saved'], saved_percent
+            )
+        simplification = self.model.simplification_summary()
+        if simplification is not None:
+            message += "\n" + LanguageManager.get_text('msg_simplification_saved', self.view.current_language).format(
+                simplification['points_removed'], simplification['lines_removed']
+            )
+        ordering = self.model.ordering_summary()
+        if ordering is not None:
+            message += "\n" + LanguageManager.get_text('msg_ordering_saved', self.view.current_language).format(
+                ordering['saved_mm'], ordering['saved_seconds'], ordering['reversed']
+            )
+        cycle_time = self.model.cycle_time_summary()
+        if cycle_time is not None:
+            message += "\n" + LanguageManager.get_text('msg_cycle_time', self.view.current_language).format(
+                format_duration(cycle_time['total_seconds']), len(cycle_time['routes'])
+            )
+            self.view.show_cycle_time(cycle_time)
+        self.view.show_info(message)
+    
+    def display_content(self, content):
+        """İçeriği editörde gösterir; süre ve bellek kullanımı işin 'display' aşamasına yazılır."""
+        with activate(self.worker.trace), span('display'), memory_stage('display'):
             self.view.set_gcode_content(content)
-            
-            self.view.show_info(LanguageManager.get_text('msg_file_loaded', self.view.current_language))
-            
-        except Exception as e:
-            self.view.show_error(f"{str(e)}")
+    
+    def load_file(self):
+        """Rota dosyalarını arka planda yükler."""
+        if self.is_busy():
+            return
+        self.start_job(
+            lambda progress, is_cancelled: self.model.load_route_files(progress, is_cancelled),
+            'label_loading_routes',
+            self.loading_finished,
+            'load'
+        )
+    
+    def loading_finished(self, content):
+        """Yüklenen rota içeriğini görüntüler."""
+        self.display_content(content)
+        self.showing_generated = False
+        
+        self.view.show_info(LanguageManager.get_text('msg_file_loaded', self.view.current_language))
+    
+    def is_busy(self):
+        """Arka planda çalışan bir iş olup olmadığını döndürür."""
+        return self.worker is not None
+    
+    def start_job(self, job, progress_key, on_success, operation):
+        """
+        Uzun süren işi arayüzü dondurmadan arka planda başlatır.
+        İlerleme durum çubuğunda rota rota gösterilir; iş bitene kadar
+        Oluştur, Yükle ve Kaydet devre dışıdır. Aşama süreleri operation adıyla kaydedilir.
+        """
+        # Profil modu açıksa iş, çalıştığı iş parçacığında profillenir
+        if self.profile_next_run or profiling_enabled():
+            self.profile_next_run = False
+            self.profiler = RunProfiler(operation, os.path.join(self.model.output_folder, PROFILE_FOLDER))
+            job = self.profiled_job(job, self.profiler)
+        
+        self.worker = GCodeWorker(job, RunTrace(operation))
+        self.worker.progress.connect(lambda done, total: self.job_progress(progress_key, done, total))
+        self.worker.succeeded.connect(on_success)
+        self.worker.failed.connect(self.job_failed)
+        self.worker.cancelled.connect(self.job_cancelled)
+        self.worker.finished.connect(self.job_finished)
+        
+        self.view.set_busy(True)
+        self.worker.start()
+    
+    def job_failed(self, message):
+        """
+        İş hata verdiğinde hatayı gösterir. Parametreler işten önce uygulandığından
+        editördeki içerik artık modeldeki çıktıyla eşleşmeyebilir; kaydetme editördeki metni yazar.
+        """
+        self.showing_generated = False
+        self.view.show_error(message)
+    
+    def job_cancelled(self):
+        """İş iptal edildiğinde bilgi verir; kaydetme editördeki metni yazar (bkz. job_failed)."""
+        self.showing_generated = False
+        self.view.show_info(LanguageManager.get_text('msg_operation_cancelled', self.view.current_language))
+    
+    def job_progress(self, progress_key, done, total):
+        """Tamamlanan rota sayısını durum çubuğunda gösterir."""
+        # İptal istendikten sonra gelen ilerleme bildirimleri "İptal ediliyor" mesajını ezmesin
+        if self.worker is None or self.worker.isInterruptionRequested():
+            return
+        self.view.show_progress(
+            LanguageManager.get_text(progress_key, self.view.current_language).format(done, total)
+        )
+    
+    def job_finished(self):
+        """İş bittiğinde (başarı, hata veya iptal) arayüzü yeniden etkinleştirir."""
+        if self.worker is not None:
+            self.record_run(self.worker.trace, self.worker.status)
+            self.worker.deleteLater()
+            self.worker = None
+        self.view.set_busy(False)
+        
+        # Profil kaydedildiyse yolunu durum çubuğunda göster
+        if self.profiler is not None:
+            if self.profiler.stats_path is not None:
+                self.view.show_progress(
+                    LanguageManager.get_text('label_profile_saved', self.view.current_language).format(self.profiler.stats_path)
+                )
+            self.profiler = None
+    
+    def arm_profiler(self):
+        """Bir sonraki Yükle veya Oluştur işlemini profillemek üzere işaretler."""
+        self.profile_next_run = True
+        self.view.show_info(LanguageManager.get_text('msg_profile_armed', self.view.current_language))
+    
+    @staticmethod
+    def profiled_job(job, profiler):
+        """İşi profilleyici içinde çalıştıran ve bitince profili kaydeden iş fonksiyonunu döndürür."""
+        def run(progress, is_cancelled):
+            try:
+                with profiler:
+                    return job(progress, is_cancelled)
+            finally:
+                try:
+                    profiler.save()
+                except OSError as e:
+                    # Profil yazılamaması işlemi başarısız saymaz
+                    print(f"Profil kaydedilemedi: {str(e)}")
+        return run
+    
+    def record_run(self, trace, status):
+        """Çalıştırmanın aşama sürelerini günlüğe ekler ve durum çubuğunda gösterir."""
+        self.model.record_run(trace, status)
+        self.view.show_run_trace(trace)
+    
+    def cancel_job(self):
+        """Çalışan işten bir sonraki rotadan önce durmasını ister."""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.view.cancel_btn.setEnabled(False)
+            self.view.show_progress(LanguageManager.get_text('label_cancelling', self.view.current_language))
+    
+    def shutdown(self):
+        """Uygulama kapanırken çalışan işi iptal eder ve bitmesini bekler."""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
     
     def save_file(self):
         """G-CODE içeriğini dosyaya kaydeder."""
+        if self.is_busy():
+            return
         try:
-            # Mevcut içeriği al
-            content = self.view.get_gcode_content()
-            
-            if not content.strip():
+            # İçerik olup olmadığını metni kopyalamadan kontrol et
+            if not self.view.has_gcode_content():
                 self.view.show_warning(LanguageManager.get_text('msg_no_content_save', self.view.current_language))
                 return
             
-            # İçeriği kaydet
-            filepath = self.model.save_gcode(content)
+            # Düzenlenmemiş G-Code'u editörden kopyalamadan doğrudan diske yaz
+            trace = RunTrace('save')
+            with activate(trace):
+                if self.showing_generated and not self.view.is_gcode_modified():
+                    filepath = self.model.save_generated_gcode()
+                else:
+                    filepath = self.model.save_gcode(self.view.get_gcode_content())
+            self.record_run(trace, 'ok')
             
             # Başarı mesajı göster
             self.view.show_info(LanguageManager.get_text('msg_file_saved', self.view.current_language).format(filepath))
@@ -113,6 +294,29 @@ class MainController:
         if self.view.bobbin_enabled.isChecked() and not self.view.bobbin_reset_value.text().strip():
             self.view.bobbin_reset_value.setText("1")
     
+    def toggle_compaction_input(self):
+        """Sıkıştırma kapalıyken iğne kaldırma birleştirme seçeneğini devre dışı bırak"""
+        self.view.merge_needle_up.setEnabled(self.view.compact_output.isChecked())
+        if not self.view.compact_output.isChecked():
+            self.view.merge_needle_up.setChecked(False)
+    
+    def toggle_simplify_input(self):
+        """Checkbox durumuna göre sadeleştirme değerlerini etkinleştir/devre dışı bırak"""
+        self.view.simplify_tolerance.setEnabled(self.view.simplify_points.isChecked())
+        self.view.min_stitch_length.setEnabled(self.view.simplify_points.isChecked())
+        
+        if self.view.simplify_points.isChecked():
+            if not self.view.simplify_tolerance.text().strip():
+                self.view.simplify_tolerance.setText("0.05")
+            if not self.view.min_stitch_length.text().strip():
+                self.view.min_stitch_length.setText("0")
+    
+    def toggle_ordering_input(self):
+        """Rota sıralaması kapalıyken ters çevirme seçeneğini devre dışı bırak"""
+        self.view.allow_route_reversal.setEnabled(self.view.optimize_route_order.isChecked())
+        if not self.view.optimize_route_order.isChecked():
+            self.view.allow_route_reversal.setChecked(False)
+    
     def toggle_punteriz_input(self):
         """Checkbox durumuna göre input alanlarını etkinleştir/devre dışı bırak"""
         self.view.punteriz_start.setEnabled(self.view.punteriz_enabled.isChecked())
@@ -1,3 +1,8 @@
+from utils.startup_timer import StartupTimer
+
+# Açılış süresi ölçümü - içe aktarmalar dahil
+startup_timer = StartupTimer()
+
 import sys
 import os
 from PyQt5.QtWidgets import QApplication
@@ -9,6 +14,8 @@ from utils.styles import StyleManager
 
 def main():
     """Ana uygulama fonksiyonu."""
+    startup_timer.mark('imports')
+    
     # QApplication oluştur
     app = QApplication(sys.argv)
     
@@ -18,14 +25,19 @@ def main():
     # Uygulama fontunu ayarla
     font = QFont("Segoe UI", 9)
     app.setFont(font)
+    startup_timer.mark('application')
     
     # Gerekli klasörlerin varlığını kontrol et
     check_required_directories()
     
-    # MVC bileşenlerini oluştur
+    # MVC bileşenlerini oluştur - parametre panelleri ilk çizimden sonra oluşturulur
     model = GCodeModel()
-    view = MainView()
+    view = MainView(defer_panels=True)
     controller = MainController(model, view)
+    startup_timer.mark('main_window')
+    
+    # İlk çizimden sonra ertelenen işleri tamamla
+    view.first_painted.connect(lambda: finish_startup(app, view))
     
     # Uygulamayı tam ekran göster
     view.showMaximized()
@@ -33,6 +45,24 @@ def main():
     # Uygulama döngüsünü başlat
     sys.exit(app.exec_())
 
+def finish_startup(app, view):
+    """İlk çizimden sonra pencere simgesini ve parametre panellerini yükler."""
+    startup_timer.mark('first_paint')
+    
+    view.load_window_icon()
+    view.ensure_parameter_panels()
+    startup_timer.mark('deferred_ui')
+    
+    if StartupTimer.reporting_enabled():
+        print(startup_timer.report())
+    elif not startup_timer.within_budget():
+        print(f"Uyarı: açılış süresi bütçeyi aştı "
+              f"({startup_timer.elapsed_until('first_paint'):.0f} ms > {startup_timer.budget_ms} ms)")
+    
+    # Ölçüm modunda açılıştan sonra çık (çıkış kodu bütçe aşımını belirtir)
+    if os.environ.get('GCODE_EDITOR_STARTUP_CHECK'):
+        app.exit(0 if startup_timer.within_budget() else 1)
+
 def check_required_directories():
     """Gerekli klasörlerin varlığını kontrol eder ve yoksa oluşturur."""
     # Rotalar klasörü
@@ -48,4 +78,4 @@ def check_required_directories():
         print(f"'{gcode_output_dir}' klasörü oluşturuldu.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
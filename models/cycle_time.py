@@ -0,0 +1,267 @@
+import math
+import re
+from itertools import islice, repeat
+from operator import sub
+
+# G04 P değerinin birimi (saniye): P200 = 200 ms
+DWELL_UNIT = 0.001
+
+# Her M kodu için eklenen sabit süre (saniye); makineye göre ayarlanabilir
+M_CODE_SECONDS = 0.0
+
+# Eksen kelimesi içermeyen ya da yalnızca Z içeren, tekrar eden satırların (Z30, G04 P200, M114...)
+# çözümleme önbelleği sınırı
+PARSE_CACHE_LIMIT = 4096
+
+# Art arda dikiş satırları: "X.. Y.. Z..[ F..]" (rota gövdelerindeki satırların büyük çoğunluğu).
+# Sayıların geçerliliğini float() denetler.
+_STITCH = r'X-?[\d.]+ Y-?[\d.]+ Z-?[\d.]+(?: F[\d.]+)?'
+_STITCH_RUN = re.compile(rf'{_STITCH}(?:\n{_STITCH})*')
+_FEED_WORD = re.compile(r' F([\d.]+)')
+_AXIS_LETTERS = str.maketrans('', '', 'XYZ')
+
+def format_duration(seconds):
+    """Süreyi 'sa:dk:sn' (bir saatten kısaysa 'dk:sn') olarak biçimlendirir."""
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+class CycleTimeEstimator:
+    """
+    Üretilen G-Code satırlarını makine gibi izleyerek çalışma süresini tahmin eden sınıf.
+    Her hareket (X, Y, Z birlikte, doğrusal) o anki F değeriyle (mm/dk) sürer; G04 P..
+    beklemeleri ve M kodları için sabit süre eklenir. G90/G91 desteklenir; konum henüz
+    bilinmiyorsa ilk hareketin süresi sayılmaz. Satırlar bölüm bölüm verilir (başlangıç,
+    her rota ve ip kesme bloğu, sonlandırma); her bölümün süresi ayrıca tutulur.
+
+    Rota gövdelerindeki "dikiş satırı / iğne kaldırma satırı" dizileri tek seferde
+    çözümlenir ve süreleri satır satır değil dizi işlemleriyle hesaplanır.
+    """
+    def __init__(self, dwell_unit=DWELL_UNIT, m_code_seconds=M_CODE_SECONDS):
+        self.dwell_unit = dwell_unit
+        self.m_code_seconds = m_code_seconds
+        self.position = {}  # Eksen harfi -> konum (mm)
+        self.feed = None
+        self.absolute = True
+        self.sections = []  # (bölüm adı, saniye)
+        self.motion_seconds = 0.0
+        self.dwell_seconds = 0.0
+        self._parse_cache = {}
+
+    @property
+    def total_seconds(self):
+        return sum(seconds for _, seconds in self.sections)
+
+    def add_section(self, name, lines):
+        """Bölümün satırlarını izler, süresini kaydeder ve döndürür."""
+        seconds = self.walk(lines)
+        self.sections.append((name, seconds))
+        return seconds
+
+    @staticmethod
+    def parse_line(line):
+        """
+        Satırı (eksenler, F, G kodları, bekleme, M kodu sayısı) olarak çözümler.
+        Eksenler (harf, değer) çiftlerinden oluşan bir demettir.
+        """
+        axes = []
+        feed = None
+        g_codes = []
+        dwell = None
+        m_codes = 0
+        for word in line.split():
+            letter = word[0].upper()
+            if letter in '%;(':
+                # Satırın geri kalanı yorum
+                break
+            try:
+                value = float(word[1:])
+            except ValueError:
+                continue
+            if letter in 'XYZ':
+                axes.append((letter, value))
+            elif letter == 'F':
+                feed = value
+            elif letter == 'G':
+                g_codes.append(value)
+            elif letter == 'P':
+                dwell = value
+            elif letter == 'M':
+                m_codes += 1
+        return tuple(axes), feed, tuple(g_codes), dwell, m_codes
+
+    def parsed(self, line):
+        """Satırın çözümlemesini döndürür; eksensiz ve yalnızca Z içeren satırlar önbelleğe alınır."""
+        result = self._parse_cache.get(line)
+        if result is None:
+            result = self.parse_line(line)
+            if len(self._parse_cache) < PARSE_CACHE_LIMIT and all(letter == 'Z' for letter, _ in result[0]):
+                self._parse_cache[line] = result
+        return result
+
+    def walk(self, lines):
+        """Satırları sırayla izler ve toplam süreyi (saniye) döndürür."""
+        motion = 0.0
+        dwell_total = 0.0
+        index = 0
+        count = len(lines)
+        while index < count:
+            line = lines[index]
+            if line[:1] == 'X' and self.absolute:
+                run = self.stitch_run(lines, index)
+                if run is not None:
+                    index, seconds = run
+                    motion += seconds
+                    continue
+            index += 1
+
+            axes, feed, g_codes, dwell, m_codes = self.parsed(line)
+            is_dwell = False
+            for code in g_codes:
+                if code == 90:
+                    self.absolute = True
+                elif code == 91:
+                    self.absolute = False
+                elif code == 4:
+                    is_dwell = True
+            if feed is not None:
+                self.feed = feed
+            if is_dwell:
+                if dwell is not None:
+                    dwell_total += dwell * self.dwell_unit
+                continue
+            dwell_total += m_codes * self.m_code_seconds
+            if axes:
+                motion += self.move(axes)
+
+        self.motion_seconds += motion
+        self.dwell_seconds += dwell_total
+        return motion + dwell_total
+
+    def move(self, axes):
+        """Tek bir hareketi uygular ve süresini döndürür."""
+        position = self.position
+        distance = 0.0
+        known = True
+        for letter, value in axes:
+            current = position.get(letter)
+            if not self.absolute:
+                # Artımlı harekette konum bilinmese de mesafe bellidir
+                distance += value * value
+                if current is not None:
+                    position[letter] = current + value
+            elif current is None:
+                known = False
+                position[letter] = value
+            else:
+                distance += (value - current) ** 2
+                position[letter] = value
+        if not known or not self.feed:
+            return 0.0
+        return math.sqrt(distance) * 60.0 / self.feed
+
+    def stitch_run(self, lines, index):
+        """
+        lines[index]'ten başlayan "dikiş, iğne kaldırma, dikiş, ..." dizisinin süresini
+        dizi işlemleriyle hesaplar. (dizinin bittiği indeks, saniye) ya da dizi yoksa None döndürür.
+        """
+        line_count = len(lines)
+        if index + 1 >= line_count:
+            return None
+        needle_up = lines[index + 1]
+        axes, feed, g_codes, dwell, m_codes = self.parsed(needle_up)
+        if len(axes) != 1 or axes[0][0] != 'Z' or feed is not None or g_codes or m_codes:
+            return None
+        up_z = axes[0][1]
+
+        # Tek indekslerde aynı iğne kaldırma satırı tekrar eder
+        end = index + 1
+        while end < line_count and lines[end] == needle_up:
+            end += 2
+        stitches = lines[index:end:2]
+        text = '\n'.join(stitches)
+        if _STITCH_RUN.fullmatch(text) is None:
+            # Dizi, dikiş satırı olmayan ilk satırda biter
+            valid = 0
+            for line in stitches:
+                if _STITCH_RUN.fullmatch(line) is None:
+                    break
+                valid += 1
+            if not valid:
+                return None
+            stitches = stitches[:valid]
+            text = '\n'.join(stitches)
+        stitch_count = len(stitches)
+        ups = min((end - index - 1) // 2, stitch_count)
+
+        # F yalnızca değiştiği satırlarda yazılır: hız aralıkları (ilk dikiş, hız) olarak tutulur
+        spans = [(0, self.feed)]
+        line_number = 0
+        position = 0
+        try:
+            for match in _FEED_WORD.finditer(text):
+                line_number += text.count('\n', position, match.start())
+                position = match.start()
+                if line_number == spans[-1][0]:
+                    spans.pop()
+                spans.append((line_number, float(match.group(1))))
+            if len(spans) > 1:
+                text = _FEED_WORD.sub('', text)
+            numbers = list(map(float, text.translate(_AXIS_LETTERS).split()))
+        except ValueError:
+            return None
+        if any(not feed for _, feed in spans):
+            return None
+        xs = numbers[0::3]
+        ys = numbers[1::3]
+        zs = numbers[2::3]
+
+        # İlk dikiş bulunulan konumdan, sonrakiler bir önceki dikişin iğne kaldırılmış konumundan başlar
+        axis_position = self.position
+        start_x = axis_position.get('X')
+        start_y = axis_position.get('Y')
+        start_z = axis_position.get('Z')
+        if start_x is None or start_y is None or start_z is None:
+            start_x, start_y, start_z = xs[0], ys[0], zs[0]
+        hypot = math.hypot
+        distances = [hypot(xs[0] - start_x, ys[0] - start_y, zs[0] - start_z)]
+        dx = map(sub, islice(xs, 1, None), xs)
+        dy = map(sub, islice(ys, 1, None), ys)
+        if zs.count(zs[0]) == stitch_count:
+            # İğne her dikişte aynı Z'ye iner (olağan durum)
+            distances.extend(map(hypot, dx, dy, repeat(zs[0] - up_z)))
+            up_distances = repeat(abs(up_z - zs[0]))
+        else:
+            distances.extend(map(hypot, dx, dy, map(sub, islice(zs, 1, None), repeat(up_z))))
+            up_distances = map(abs, map(sub, repeat(up_z), zs))
+        up_distances = list(islice(up_distances, ups))
+
+        # Her hız aralığının süresi: toplam mesafe / hız
+        seconds = 0.0
+        bounds = [first for first, _ in spans[1:]] + [stitch_count]
+        for (first, feed), last in zip(spans, bounds):
+            seconds += (sum(distances[first:last]) + sum(up_distances[first:last])) / feed
+
+        axis_position['X'] = xs[-1]
+        axis_position['Y'] = ys[-1]
+        axis_position['Z'] = up_z if ups == stitch_count else zs[-1]
+        self.feed = spans[-1][1]
+        return index + stitch_count + ups, seconds * 60.0
+
+    def route_seconds(self):
+        """Rota bölümlerinin (adı sayı olan bölümler) sürelerini (rota no, saniye) listesi olarak döndürür."""
+        return [(name, seconds) for name, seconds in self.sections if isinstance(name, int)]
+
+    def summary(self):
+        """Tahmin sonucunu sözlük olarak döndürür."""
+        sections = dict(self.sections)
+        return {
+            'total_seconds': round(self.total_seconds, 3),
+            'motion_seconds': round(self.motion_seconds, 3),
+            'dwell_seconds': round(self.dwell_seconds, 3),
+            'start_seconds': round(sections.get('start', 0.0), 3),
+            'end_seconds': round(sections.get('end', 0.0), 3),
+            'routes': [{'number': number, 'seconds': round(seconds, 3)} for number, seconds in self.route_seconds()],
+        }
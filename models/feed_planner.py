@@ -0,0 +1,105 @@
+import math
+from array import array
+from itertools import repeat
+from operator import add, floordiv, mul, sub
+
+# Hız artışının (speed_increment) bir adımda katedildiği hareket uzunluğu (mm). Bir dikişin
+# hareketi XY dikiş uzunluğu ile iğnenin inip kalkma yolunun (stroke) toplamıdır; bundan
+# uzun hareketlerde hız bir dikişte birden fazla kademe değişebilir.
+REFERENCE_STITCH_MM = 3.0
+
+# Bu açıdan (derece) küçük dönüşler hızı düşürmez; daha keskin köşelerde hız açıyla
+# doğrusal olarak azalır ve geri dönüşte (180°) başlangıç hızına iner.
+CORNER_FREE_DEGREES = 45.0
+
+# Kayan nokta hatası yüzünden hız bir kademe düşmesin diye eklenen pay
+_LEVEL_EPSILON = 1e-9
+
+def corner_levels(dx, dy, steps, free_degrees=CORNER_FREE_DEGREES):
+    """
+    Her köşe (ardışık iki dikiş arası) için izin verilen en yüksek hız kademesini döndürür:
+    dönüş açısı free_degrees'e kadar steps (maksimum hız), 180°'de 0 (başlangıç hızı).
+    Uzunluğu sıfır olan dikişin yanındaki köşe düz sayılır.
+    """
+    scale = steps / (math.pi - math.radians(free_degrees))
+    crosses = map(sub, map(mul, dx, dy[1:]), map(mul, dy, dx[1:]))
+    dots = map(add, map(mul, dx, dx[1:]), map(mul, dy, dy[1:]))
+    # Kalan açı (pi - dönüş açısı) ölçeklenip kademeye yuvarlanır ve steps ile sınırlanır
+    remaining = map(sub, repeat(math.pi), map(abs, map(math.atan2, crosses, dots)))
+    levels = map(int, map(add, map(mul, remaining, repeat(scale)), repeat(_LEVEL_EPSILON)))
+    return list(map(min, levels, repeat(steps)))
+
+def step_budgets(lengths, reference=REFERENCE_STITCH_MM, stroke=0.0):
+    """
+    Ardışık iki dikiş arasında hızın değişebileceği en fazla kademe sayısını döndürür.
+    Her dikişin hareketine iğnenin inip kalkma yolu (stroke) da eklenir.
+    """
+    moves = map(add, map(min, lengths, lengths[1:]), repeat(stroke))
+    steps = map(int, map(floordiv, moves, repeat(reference)))
+    return list(map(max, steps, repeat(1)))
+
+def plan_levels(limits, budgets):
+    """
+    Her dikişin üst sınırından (limits) ve ardışık dikişler arasındaki en büyük kademe
+    farkından (budgets) uygulanabilir en yüksek hız kademelerini bulur. Geriye doğru geçiş
+    yavaşlamayı önceden başlatır (ileriye bakış), ileri geçiş hızlanmayı sınırlar.
+    """
+    levels = list(limits)
+    for index in range(len(levels) - 2, -1, -1):
+        reachable = levels[index + 1] + budgets[index]
+        if reachable < levels[index]:
+            levels[index] = reachable
+    for index in range(1, len(levels)):
+        reachable = levels[index - 1] + budgets[index - 1]
+        if reachable < levels[index]:
+            levels[index] = reachable
+    return levels
+
+def ramp_levels(moves, steps):
+    """
+    build_speed_profile'daki indekse göre rampanın her dikiş için kademesini döndürür:
+    ilk steps dikişte hızlanma, son steps dikişte yavaşlama (hızlanma bölgesi önceliklidir).
+    """
+    levels = [steps] * moves
+    decelerate_from = max(steps, moves - steps)
+    levels[decelerate_from:] = range(moves - decelerate_from - 1, -1, -1)
+    levels[:min(steps, moves)] = range(min(steps, moves))
+    return levels
+
+def plan_feeds(xs, ys, start_speed, max_speed, speed_increment, reference=REFERENCE_STITCH_MM, stroke=0.0):
+    """
+    xs/ys noktalarını sırayla birleştiren len(xs) - 1 dikişin F değerlerini hesaplar.
+    Hızlar build_speed_profile ile aynı kademelerdedir (start_speed + k * speed_increment,
+    en fazla max_speed). İlk ve son dikiş başlangıç hızındadır. Köşelerde hız açıya göre
+    düşer; köşenin iki yanındaki dikiş bu sınırı ve indekse göre rampanın o dikişteki hızını
+    aşmaz. Düz bölümlerde hız max_speed'e kadar çıkar ve ardışık dikişler arasında hareket
+    uzunluğuna (dikiş + stroke) göre en fazla birkaç kademe değişir; böylece rampadan daha
+    hızlı hızlanabilir. Rampa yoksa (steps == 0) ya da dikiş sayısı çok azsa rampa olduğu
+    gibi döndürülür.
+    """
+    moves = len(xs) - 1
+    if moves <= 1:
+        return array('l', [start_speed])
+    steps = max((max_speed - start_speed) // speed_increment, 0)
+    speed_of_level = [min(start_speed + speed_increment * level, max_speed) for level in range(steps)] + [max_speed]
+    ramp = ramp_levels(moves, steps)
+    if moves <= 2 or not steps:
+        return array('l', map(speed_of_level.__getitem__, ramp))
+
+    dx = list(map(sub, xs[1:], xs))
+    dy = list(map(sub, ys[1:], ys))
+    lengths = list(map(math.hypot, dx, dy))
+
+    # Her dikiş, iki ucundaki köşenin sınırını aşmaz; rota başı ve sonu başlangıç hızındadır.
+    # Serbest açıdan keskin köşelerin iki yanındaki dikişler rampanın hızını da aşmaz.
+    corners = corner_levels(dx, dy, steps)
+    limits = [0]
+    limits.extend(map(min, corners, corners[1:]))
+    limits.append(0)
+    for index, level in enumerate(corners):
+        if level < steps:
+            limits[index] = min(limits[index], ramp[index])
+            limits[index + 1] = min(limits[index + 1], ramp[index + 1])
+
+    levels = plan_levels(limits, step_budgets(lengths, reference, stroke))
+    return array('l', map(speed_of_level.__getitem__, levels))
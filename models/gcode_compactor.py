@@ -0,0 +1,212 @@
+import re
+
+# Modal durumu izleyerek G-Code çıktısındaki gereksiz kelime ve satırları atan sıkıştırıcı.
+# Makine hareketi değişmez: yalnızca konumu, Z'yi, F'yi ya da G kipini değiştirmeyen kelimeler atılır.
+
+# Hareket satırında bulunabilecek harfler; başka harf içeren satırlar olduğu gibi bırakılır
+_MOTION_LETTERS = frozenset('GXYZF')
+
+# Sayı kelimelerinde geçebilecek karakterler
+_NUMBER_CHARS = "0123456789+-."
+
+# Yalnızca tek boşlukla ayrılmış X, Y, Z ve F kelimelerinden oluşan satır (dikiş ve iğne satırları)
+_SIMPLE_MOTION_LINE = re.compile(r'[XYZF][+-]?[0-9.]+(?: [XYZF][+-]?[0-9.]+)*')
+
+# Modal olarak izlenen G kodları: hareket kipi ve mutlak / artımlı konumlandırma
+_MOTION_MODES = {0: 'G0', 1: 'G1'}
+_DISTANCE_MODES = {90: True, 91: False}
+
+class GCodeCompactor:
+    """
+    G-Code satırlarını akış halinde sıkıştıran sınıf.
+    Konum (X, Y, Z), F ve G0/G1, G90/G91 kipleri izlenir; değeri değişmeyen kelimeler ve
+    tüm kelimeleri atılan satırlar çıkarılır. Yorum satırları, bekleme (G04) ve M kodları
+    olduğu gibi bırakılır. M kodlarından sonra konum bilinmiyor sayılır (makine ekseni
+    hareket ettirmiş olabilir), bu yüzden ardından gelen ilk konum kelimeleri korunur.
+
+    merge_needle_up açıksa, tek başına duran iğne kaldırma satırı (örn. "Z30") iğneyi
+    indiren bir sonraki XY satırına birleştirilir (atılır). Bu, XY hareketinden önce iğneyi
+    kendiliğinden kaldıran kontrolörler içindir; diğer makinelerde hareketi değiştirir.
+    """
+    def __init__(self, needle_down="Z3", needle_up="Z30", merge_needle_up=False):
+        self.needle_down = needle_down.strip()
+        self.needle_up = needle_up.strip()
+        self.merge_needle_up = merge_needle_up
+        self.reset()
+
+    def reset(self):
+        """Modal durumu ve sayaçları sıfırlar (program başı: her şey bilinmiyor)."""
+        self.axes = {}  # Eksen harfi -> son yazılan değer metni (mutlak kipte)
+        self.feed = None
+        self.motion_mode = None
+        self.absolute = None  # None: G90/G91 henüz görülmedi
+        self.lines_in = 0
+        self.lines_out = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @property
+    def bytes_saved(self):
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def lines_removed(self):
+        return self.lines_in - self.lines_out
+
+    def compact_line(self, line):
+        """
+        Tek bir satırı sıkıştırır ve modal durumu günceller.
+        Satır tamamen gereksizse None döndürür.
+        """
+        # Hızlı yol: mutlak kipte yalnızca X, Y, Z ve F içeren satırlar
+        if self.absolute and _SIMPLE_MOTION_LINE.fullmatch(line):
+            axes = self.axes
+            words = line.split(' ')
+            result = []
+            for word in words:
+                letter = word[0]
+                value = word[1:]
+                if letter == 'F':
+                    if value == self.feed:
+                        continue
+                    self.feed = value
+                elif axes.get(letter) == value:
+                    continue
+                else:
+                    axes[letter] = value
+                result.append(word)
+            if not result:
+                return None
+            if len(result) == len(words):
+                return line
+            return ' '.join(result)
+
+        words = line.split()
+        if not words or words[0][0] in '%;(':
+            # Boş ve yorum satırları
+            return line
+        return self._compact_words(line, words)
+
+    def _compact_words(self, line, words):
+        """compact_line için genel yol: G kipleri, küçük harfler ve hareket olmayan satırlar."""
+        kept = []
+        updates = []
+        for word in words:
+            letter = word[0].upper()
+            value = word[1:]
+            if letter not in _MOTION_LETTERS or not value or value.strip(_NUMBER_CHARS):
+                # Hareket satırı değil (M kodu, değişken, yorum...)
+                return self._pass_through(line, words)
+
+            if letter == 'G':
+                try:
+                    code = float(value)
+                except ValueError:
+                    return self._pass_through(line, words)
+                if code in _MOTION_MODES:
+                    mode = _MOTION_MODES[code]
+                    if mode != self.motion_mode:
+                        kept.append(word)
+                        updates.append(('motion', mode))
+                elif code in _DISTANCE_MODES:
+                    absolute = _DISTANCE_MODES[code]
+                    if absolute != self.absolute:
+                        kept.append(word)
+                        updates.append(('absolute', absolute))
+                else:
+                    # Diğer G kodları (bekleme, koordinat sistemi...) olduğu gibi bırakılır
+                    return self._pass_through(line, words)
+            elif letter == 'F':
+                if value != self.feed:
+                    kept.append(word)
+                    updates.append(('feed', value))
+            else:
+                kept.append(word)
+                updates.append(('axis', (letter, value)))
+
+        # G kipi değişiklikleri aynı satırdaki eksen kelimelerinden önce uygulanır
+        for kind, value in updates:
+            if kind == 'motion':
+                self.motion_mode = value
+            elif kind == 'absolute':
+                self.absolute = value
+                if not value:
+                    self.axes.clear()
+
+        result = []
+        for word in kept:
+            letter = word[0].upper()
+            if letter in 'XYZ':
+                value = word[1:]
+                if self.absolute:
+                    if self.axes.get(letter) == value:
+                        continue
+                    self.axes[letter] = value
+                else:
+                    # Artımlı ya da bilinmeyen kipte her eksen kelimesi hareket eder
+                    self.axes.pop(letter, None)
+            elif letter == 'F':
+                self.feed = word[1:]
+            result.append(word)
+
+        if not result:
+            return None
+        if len(result) == len(words):
+            return line
+        return ' '.join(result)
+
+    def _pass_through(self, line, words):
+        """Hareket satırı olmayan satırı değiştirmeden bırakır ve etkilediği durumu günceller."""
+        letters = {word[0].upper() for word in words}
+        if letters == {'G', 'P'} and all(word[0].upper() != 'G' or word[1:].lstrip('0') == '4' for word in words):
+            # G04 bekleme: konum değişmez
+            return line
+        # M kodları vb. ekseni hareket ettirmiş olabilir
+        self.axes.clear()
+        for word in words:
+            if word[0].upper() == 'F':
+                self.feed = word[1:]
+        return line
+
+    def compact(self, lines):
+        """Satırları akış halinde sıkıştırır; atılan satırlar üretilmez."""
+        compact_line = self.compact_line
+        merge_needle_up = self.merge_needle_up
+        pending_up = None  # Birleştirilmek üzere bekletilen iğne kaldırma satırı
+        for line in lines:
+            self.lines_in += 1
+            self.bytes_in += len(line) + 1
+            compacted = compact_line(line)
+            if compacted is None:
+                continue
+
+            if merge_needle_up:
+                if pending_up is not None:
+                    words = compacted.split()
+                    if not (self.needle_down in words and any(word[0] in 'XY' for word in words)):
+                        self.lines_out += 1
+                        self.bytes_out += len(pending_up) + 1
+                        yield pending_up
+                    pending_up = None
+                if compacted == self.needle_up:
+                    pending_up = compacted
+                    continue
+
+            self.lines_out += 1
+            self.bytes_out += len(compacted) + 1
+            yield compacted
+
+        if pending_up is not None:
+            self.lines_out += 1
+            self.bytes_out += len(pending_up) + 1
+            yield pending_up
+
+    def summary(self):
+        """Sıkıştırma sonucunu sözlük olarak döndürür."""
+        return {
+            'lines_in': self.lines_in,
+            'lines_out': self.lines_out,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'bytes_saved': self.bytes_saved,
+        }
@@ -1,22 +1,36 @@
 import json
 import os
 import shutil
+import time
 from datetime import datetime
 from models.gcode_processor import GCodeProcessor
-from models.multi_route_processor import MultiRouteProcessor
+from models.multi_route_processor import MultiRouteProcessor, RouteProcessingCancelled
+from utils import run_trace
+from utils.memory_profile import memory_stage
+from utils.run_trace import RunLog
+
+# Dosyaya yazarken kullanılacak tampon boyutu ve tek seferde yazılacak satır sayısı
+WRITE_BUFFER_SIZE = 1024 * 1024
+WRITE_CHUNK_LINES = 10000
 
 class GCodeModel:
     """
     G-CODE verilerini ve işlemlerini yöneten model sınıfı.
     """
-    def __init__(self):
+    def __init__(self, parameters_file=None, routes_folder="routes", output_folder="gcode_output"):
         self.processor = GCodeProcessor()
         self.multi_processor = MultiRouteProcessor()
+        # Yükleme ve G-Code oluşturma aynı işlemciyi ve aynı rota deposunu kullanır
+        self.multi_processor.processor = self.processor
         self.content = ""
-        self.parameters_file = self._get_parameters_file_path()
-        
-        # Parametreler dosyasını kopyala (eğer yoksa)
-        self._ensure_parameters_file_exists()
+        self.parameters = {}  # Son uygulanan parametreler
+        self.generated_parameters = None  # content'i oluşturan parametreler (content oluşturulmuş G-Code değilse None)
+        self.parameters_file = parameters_file or self._get_parameters_file_path()
+        self.routes_folder = routes_folder
+        self.output_folder = output_folder
+        self.multi_processor.routes_folder = routes_folder
+        self.run_log = RunLog()  # Her çalıştırmanın aşama süreleri logs/runs.jsonl dosyasına eklenir
+        self.last_trace = None  # Son çalıştırmanın aşama süreleri
         
     def _get_parameters_file_path(self):
         """parameters.json dosyasının yolunu döndürür."""
@@ -108,6 +122,8 @@ class GCodeModel:
         
     def load_default_parameters(self):
         """Varsayılan parametreleri parameters.json dosyasından yükler."""
+        # Parametreler dosyası ilk kullanımda oluşturulur (eğer yoksa)
+        self._ensure_parameters_file_exists()
         try:
             with open(self.parameters_file, 'r') as file:
                 return json.load(file)
@@ -138,6 +154,19 @@ class GCodeModel:
             current_params['machine_calibration']['x_value'] = params.get('calibration_x', current_params['machine_calibration'].get('x_value', '21.57'))
             current_params['machine_calibration']['y_value'] = params.get('calibration_y', current_params['machine_calibration'].get('y_value', '388.60'))
             
+            # Çıktı optimizasyonu (sıkıştırma, sadeleştirme, hız planlama, rota sıralaması)
+            current_params['compact_output'] = params.get('compact_output', current_params.get('compact_output', False))
+            current_params['merge_needle_up'] = params.get('merge_needle_up', current_params.get('merge_needle_up', False))
+            current_params['simplify_enabled'] = params.get('simplify_enabled', current_params.get('simplify_enabled', False))
+            current_params['simplify_tolerance'] = params.get('simplify_tolerance', current_params.get('simplify_tolerance', '0.05'))
+            current_params['min_stitch_length'] = params.get('min_stitch_length', current_params.get('min_stitch_length', '0'))
+            current_params['feed_planning'] = params.get('feed_planning', current_params.get('feed_planning', False))
+            current_params['optimize_route_order'] = params.get('optimize_route_order', current_params.get('optimize_route_order', False))
+            current_params['allow_route_reversal'] = params.get('allow_route_reversal', current_params.get('allow_route_reversal', False))
+            
+            # Paralel rota işleme
+            current_params['parallel_processing'] = params.get('parallel_processing', current_params.get('parallel_processing', False))
+            
             # Dosyaya kaydet
             with open(self.parameters_file, 'w') as file:
                 json.dump(current_params, file, indent=4)
@@ -146,8 +175,58 @@ class GCodeModel:
         except Exception as e:
             raise Exception(f"Parametreler kaydedilirken hata oluştu: {str(e)}")
     
+    @staticmethod
+    def parameters_from_file(file_params):
+        """
+        parameters.json biçimindeki parametreleri arayüzün get_parameters() ile
+        ürettiği düz biçime çevirir (varsayılanlar MainView.set_parameters ile aynıdır).
+        """
+        def lines(key):
+            # Arayüzdeki metin kutusundan okunmuş gibi normalleştir
+            return '\n'.join(file_params.get(key, [])).strip().split('\n')
+        
+        z_positions = file_params.get('z_positions', {"needle_down": "Z3", "needle_up": "Z30"})
+        machine_calibration = file_params.get('machine_calibration', {"x_value": "21.57001", "y_value": "388.6"})
+        return {
+            'start_params': lines('start_params'),
+            'route_start_params': lines('route_start_params'),
+            'thread_cut_params': lines('thread_cut_params'),
+            'end_params': lines('end_params'),
+            'calibration_x': machine_calibration["x_value"].strip(),
+            'calibration_y': machine_calibration["y_value"].strip(),
+            'needle_down': z_positions["needle_down"].strip(),
+            'needle_up': z_positions["needle_up"].strip(),
+            'bobbin_enabled': file_params.get('bobbin_enabled', False),
+            'bobbin_reset_value': file_params.get('bobbin_reset_value', "1").strip(),
+            'punteriz_enabled': file_params.get('punteriz_enabled', False),
+            'punteriz_start': file_params.get('punteriz_start', "0").strip(),
+            'punteriz_end': file_params.get('punteriz_end', "0").strip(),
+            'start_speed': file_params.get('start_speed', "10000").strip(),
+            'max_speed': file_params.get('max_speed', "50000").strip(),
+            'speed_increment': file_params.get('speed_increment', "5000").strip(),
+            'compact_output': file_params.get('compact_output', False),
+            'merge_needle_up': file_params.get('merge_needle_up', False),
+            'simplify_enabled': file_params.get('simplify_enabled', False),
+            'simplify_tolerance': file_params.get('simplify_tolerance', "0.05").strip(),
+            'min_stitch_length': file_params.get('min_stitch_length', "0").strip(),
+            'feed_planning': file_params.get('feed_planning', False),
+            'optimize_route_order': file_params.get('optimize_route_order', False),
+            'allow_route_reversal': file_params.get('allow_route_reversal', False),
+            'parallel_processing': file_params.get('parallel_processing', False)
+        }
+    
     def update_processor_parameters(self, params):
-        """Processor parametrelerini günceller."""
+        """Processor parametrelerini günceller ve parameters.json dosyasına kaydeder."""
+        self.apply_parameters(params)
+        
+        # Parametreleri kaydet
+        self.save_parameters(params)
+    
+    def apply_parameters(self, params):
+        """Processor parametrelerini dosyaya yazmadan günceller."""
+        # Bellekteki çıktı generated_parameters ile eşleşir; yeni parametreler ayrıca saklanır
+        self.parameters = dict(params)
+        
         # Kalibrasyon değerleri
         self.processor.update_calibration_values(
             params.get('calibration_x', '0'), 
@@ -179,6 +258,20 @@ class GCodeModel:
             params.get('max_speed', '50000'), 
             params.get('speed_increment', '5000')
         )
+        self.processor.update_feed_planning(params.get('feed_planning', False))
+        
+        # Dikiş noktası sadeleştirme
+        self.processor.update_simplify_settings(
+            params.get('simplify_enabled', False),
+            params.get('simplify_tolerance', '0.05'),
+            params.get('min_stitch_length', '0')
+        )
+        
+        # Çıktı sıkıştırma
+        self.processor.update_compaction_settings(
+            params.get('compact_output', False),
+            params.get('merge_needle_up', False)
+        )
         
         # Diğer parametreler
         self.processor.start_params = params.get('start_params', [])
@@ -186,14 +279,23 @@ class GCodeModel:
         self.processor.thread_cut_params = params.get('thread_cut_params', [])
         self.processor.end_params = params.get('end_params', [])
         
-        # Parametreleri kaydet
-        self.save_parameters(params)
+        # Paralel rota işleme (isteğe bağlı)
+        self.multi_processor.parallel = params.get('parallel_processing', False)
+        
+        # Rota sıralaması (isteğe bağlı)
+        self.multi_processor.optimize_order = params.get('optimize_route_order', False)
+        self.multi_processor.allow_route_reversal = params.get('allow_route_reversal', False)
     
-    def load_route_files(self):
-        """Rota dosyalarını yükler ve işler."""
+    @memory_stage('load')
+    def load_route_files(self, progress=None, is_cancelled=None):
+        """
+        Rota dosyalarını yükler ve işler.
+        progress(tamamlanan, toplam) her rotadan sonra çağrılır; is_cancelled() True
+        döndürürse yükleme bir sonraki rotadan önce RouteProcessingCancelled ile durur.
+        """
         try:
             # Rotalar klasörünü ayarla
-            self.multi_processor.routes_folder = "routes"
+            self.multi_processor.routes_folder = self.routes_folder
             
             # Rotaları yükle
             self.multi_processor.load_route_files()
@@ -204,76 +306,141 @@ class GCodeModel:
             # G-Code başlangıç parametreleri
             raw_content.extend(self.processor.start_params)
             
-            # Her rotayı işle
-            for index, route_file in enumerate(self.multi_processor.route_files, 1):
-                with open(route_file, 'r') as file:
-                    content = file.read()
+            # Her rotayı ortak depodan al (değişmemiş dosyalar yeniden okunmaz)
+            route_files = self.multi_processor.route_files
+            for index, route_file in enumerate(route_files, 1):
+                self.multi_processor.check_cancelled(is_cancelled)
+                start = time.perf_counter()
+                with run_trace.span('route'):
+                    route = self.multi_processor.get_route(route_file, index)
                     
-                    # Rota başlığını ekle
+                    # Rota başlığını ve kalibre edilmiş koordinatları ekle
                     raw_content.append(f"% Rota No {index}")
-                    
-                    # Koordinatları ayıkla ve ekle
-                    for line in content.strip().split('\n'):
-                        if line.strip().startswith('X') and ' Y' in line:
-                            # Koordinatları kalibre et
-                            calibrated_content = self.processor.load_file_content(line)
-                            raw_content.append(calibrated_content)
+                    with run_trace.span('format', points=len(route)):
+                        raw_content.extend(route.formatted())
+                self.multi_processor.record_route(index, route_file, len(route) + 1, time.perf_counter() - start)
+                
+                if progress is not None:
+                    progress(index, len(route_files))
             
             # İçeriği kaydet
-            self.content = '\n'.join(raw_content)
+            with run_trace.span('join', lines=len(raw_content)):
+                self.content = '\n'.join(raw_content)
+            run_trace.add_counts('join', bytes=len(self.content))
+            self.generated_parameters = None
             return self.content
             
+        except RouteProcessingCancelled:
+            raise
         except Exception as e:
             raise Exception(f"Dosya yüklenirken hata oluştu: {str(e)}")
     
-    def process_gcode(self):
-        """G-CODE içeriğini işler."""
+    @memory_stage('generate')
+    def process_gcode(self, progress=None, is_cancelled=None):
+        """G-CODE içeriğini işler. İlerleme ve iptal geri çağrıları load_route_files ile aynıdır."""
         try:
-            # MultiRouteProcessor'a güncel parametreleri aktar
-            self.multi_processor.processor.start_params = self.processor.start_params
-            self.multi_processor.processor.route_start_params = self.processor.route_start_params
-            self.multi_processor.processor.thread_cut_params = self.processor.thread_cut_params
-            self.multi_processor.processor.end_params = self.processor.end_params
-            self.multi_processor.processor.z_positions = self.processor.z_positions
-            self.multi_processor.processor.calibration_values = self.processor.calibration_values
-            self.multi_processor.processor.bobbin_enabled = self.processor.bobbin_enabled
-            self.multi_processor.processor.bobbin_reset_value = self.processor.bobbin_reset_value
-            self.multi_processor.processor.punteriz_enabled = self.processor.punteriz_enabled
-            self.multi_processor.processor.punteriz_start = self.processor.punteriz_start
-            self.multi_processor.processor.punteriz_end = self.processor.punteriz_end
-            self.multi_processor.processor.start_speed = self.processor.start_speed
-            self.multi_processor.processor.max_speed = self.processor.max_speed
-            self.multi_processor.processor.speed_increment = self.processor.speed_increment
-            self.multi_processor.processor.current_speed = None  # Hız takibi için değişkeni sıfırla
-            
             # Rotaları işle
-            final_content = self.multi_processor.process_routes()
+            final_content = self.multi_processor.process_routes(progress, is_cancelled)
             self.content = final_content
+            self.generated_parameters = self.parameters
             return final_content
             
+        except RouteProcessingCancelled:
+            raise
         except Exception as e:
             raise Exception(f"İşlem sırasında hata oluştu: {str(e)}")
     
-    def save_gcode(self, content):
-        """G-CODE içeriğini dosyaya kaydeder."""
+    def record_run(self, trace, status='ok', **extra):
+        """Çalıştırma izlemesini bitirir, son çalıştırma olarak saklar ve çalıştırma günlüğüne ekler."""
+        self.last_trace = trace.finish()
         try:
-            # Şu anki tarihi al ve formatla
-            current_time = datetime.now()
-            filename = current_time.strftime("%y_%m_%d_%H_%M_%S.nc")
+            self.run_log.append(trace, status=status, **extra)
+        except OSError as e:
+            # Günlük yazılamaması işlemi başarısız saymaz
+            print(f"Çalıştırma günlüğü yazılamadı: {str(e)}")
+        return trace
+    
+    def compaction_summary(self):
+        """Son oluşturmanın sıkıştırma sonucunu döndürür (sıkıştırma kapalıysa None)."""
+        compactor = self.multi_processor.last_compaction
+        return compactor.summary() if compactor is not None else None
+    
+    def simplification_summary(self):
+        """Son oluşturmanın dikiş noktası sadeleştirme sonucunu döndürür (sadeleştirme kapalıysa None)."""
+        return self.multi_processor.last_simplification
+    
+    def ordering_summary(self):
+        """Son oluşturmanın rota sıralaması sonucunu döndürür (sıralama kapalıysa None)."""
+        ordering = self.multi_processor.last_ordering
+        return ordering.summary() if ordering is not None else None
+
+    def cycle_time_summary(self):
+        """Son oluşturmanın makine çalışma süresi tahminini döndürür (henüz oluşturulmadıysa None)."""
+        estimator = self.multi_processor.last_cycle_time
+        return estimator.summary() if estimator is not None else None
+
+    def iter_gcode(self):
+        """G-CODE satırlarını tüm çıktıyı bellekte tutmadan rota rota üretir."""
+        return self.multi_processor.iter_gcode_lines()
+    
+    def save_generated_gcode(self, filepath=None):
+        """
+        Son oluşturulan G-CODE'u (editörde gösterilen programı) kopyalamadan kaydeder.
+        Parametreler sonradan değişmiş olsa da generated_parameters ile oluşturulmuş çıktı
+        yazılır; rotalar güncel parametrelerle yeniden işlenmez.
+        """
+        if self.generated_parameters is None:
+            raise Exception("Kaydedilecek oluşturulmuş G-Code yok")
+        return self.save_gcode(self.content, filepath)
+    
+    @memory_stage('save')
+    def save_gcode(self, content, filepath=None):
+        """
+        G-CODE içeriğini dosyaya kaydeder. İçerik metin ya da satır üreteci olabilir.
+        Dosya yolu verilmezse çıktı klasöründe tarih-saat adlı bir dosya oluşturulur.
+        """
+        try:
+            if filepath is None:
+                # Şu anki tarihi al ve formatla
+                current_time = datetime.now()
+                filename = current_time.strftime("%y_%m_%d_%H_%M_%S.nc")
+                
+                # Tam dosya yolunu oluştur
+                filepath = os.path.join(self.output_folder, filename)
             
-            # gcode_output klasörünü kontrol et ve yoksa oluştur
-            gcode_dir = "gcode_output"
-            if not os.path.exists(gcode_dir):
+            # Çıktı klasörünü kontrol et ve yoksa oluştur
+            gcode_dir = os.path.dirname(filepath)
+            if gcode_dir and not os.path.exists(gcode_dir):
                 os.makedirs(gcode_dir)
             
-            # Tam dosya yolunu oluştur
-            filepath = os.path.join(gcode_dir, filename)
-            
-            # İçeriği kaydet
-            with open(filepath, 'w') as file:
-                file.write(content)
+            # İçeriği büyük tamponlu yazımlarla kaydet (akıtılan satırların işlenme süresi rota aşamalarına yazılır)
+            with run_trace.span('write', files=1):
+                with open(filepath, 'w', buffering=WRITE_BUFFER_SIZE) as file:
+                    if isinstance(content, str):
+                        file.write(content)
+                    else:
+                        self._write_lines(file, content)
+            run_trace.add_counts('write', bytes=os.path.getsize(filepath))
             
             return filepath
             
         except Exception as e:
-            raise Exception(f"Dosya kaydedilirken hata oluştu: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Dosya kaydedilirken hata oluştu: {str(e)}")
+    
+    @staticmethod
+    def _write_lines(file, lines):
+        """Satırları parça parça birleştirerek dosyaya yazar ('\\n'.join ile aynı çıktı)."""
+        chunk = []
+        first_chunk = True
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= WRITE_CHUNK_LINES:
+                if not first_chunk:
+                    file.write('\n')
+                file.write('\n'.join(chunk))
+                first_chunk = False
+                chunk = []
+        if chunk:
+            if not first_chunk:
+                file.write('\n')
+            file.write('\n'.join(chunk))
@@ -1,5 +1,46 @@
 import json
-import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from models.gcode_tokenizer import parse_xy
+from models.route import Route
+from models import feed_planner, route_simplify
+from utils import run_trace
+
+# Bir rotanın hız profili: her nokta için F değeri ve yalnızca hızın değiştiği
+# noktalarda " F.." olan, diğer noktalarda boş olan satır sonekleri
+SpeedProfile = namedtuple('SpeedProfile', ['speeds', 'suffixes'])
+
+@lru_cache(maxsize=128)
+def build_speed_profile(total_points, start_speed, max_speed, speed_increment):
+    """N noktalı bir rota için tüm F değerlerini tek geçişte hesapla (calculate_speed ile aynı sonuç)"""
+    if total_points <= 1:
+        return SpeedProfile(array('l', [start_speed]), (f" F{start_speed}",))
+    
+    # Hız artışı için gereken adım sayısı - hızlanma ve yavaşlama için aynı
+    steps = max((max_speed - start_speed) // speed_increment, 0)
+    speeds = array('l', [max_speed]) * total_points
+    
+    # Hızlanma bölgesi
+    for i in range(min(steps, total_points)):
+        speeds[i] = min(start_speed + speed_increment * i, max_speed)
+    
+    # Yavaşlama bölgesi - son noktalardan geriye doğru (hızlanma bölgesi önceliklidir)
+    for i in range(max(steps, total_points - steps), total_points):
+        remaining_steps = total_points - i - 1
+        speeds[i] = max(start_speed + speed_increment * remaining_steps, start_speed)
+    
+    return SpeedProfile(speeds, speed_suffixes(speeds))
+
+def speed_suffixes(speeds):
+    """Hız dizisinin satır soneklerini oluştur: F yalnızca ilk noktada ve hızın değiştiği noktalarda yazılır"""
+    suffixes = [""] * len(speeds)
+    previous = None
+    for i, speed in enumerate(speeds):
+        if speed != previous:
+            suffixes[i] = f" F{speed}"
+            previous = speed
+    return tuple(suffixes)
 
 class GCodeProcessor:
     def __init__(self):
@@ -12,8 +53,8 @@ class GCodeProcessor:
         self.z_positions = {"needle_down": "Z3", "needle_up": "Z30"}
         self.calibration_values = {"x_value": "21.57001", "y_value": "388.6"}
         self.previous_calibration = {"x_value": "21.57001", "y_value": "388.6"}
-        self.initial_coordinates = []
-        self.processed_coordinates = []
+        self.initial_coordinates = Route()
+        self.processed_coordinates = Route()
         self.previous_route_start_params = []
         self.bobbin_enabled = False
         self.bobbin_reset_value = "1"
@@ -24,6 +65,12 @@ class GCodeProcessor:
         self.max_speed = "50000"
         self.speed_increment = "5000"
         self.current_speed = None  # Mevcut hız değerini takip etmek için yeni değişken
+        self.compact_output = False  # Çıktıdaki gereksiz kelime ve satırları at
+        self.merge_needle_up = False  # İğne kaldırma satırını sonraki XY satırına birleştir
+        self.simplify_enabled = False  # Hız profilinden önce gereksiz dikiş noktalarını at
+        self.simplify_tolerance = "0.05"  # Atılan noktanın çizgiye en büyük uzaklığı (mm)
+        self.min_stitch_length = "0"  # Bundan kısa dikişler atılır (mm, 0: yalnızca yinelenen noktalar)
+        self.feed_planning = False  # Hızı nokta sırası yerine dikiş uzunluğu ve köşe açısına göre planla
         
     def load_parameters(self, filename):
         with open(filename, 'r') as file:
@@ -40,9 +87,8 @@ class GCodeProcessor:
         self.z_positions["needle_up"] = needle_up
 
     def is_coordinate_line(self, line):
-        # X ve Y koordinatlarını içeren satırları kontrol et (Z değeri opsiyonel)
-        pattern = r'^X\d+\.?\d*\s+Y\d+\.?\d*(?:\s+Z\d+\.?\d*)?$'
-        return bool(re.match(pattern, line.strip()))
+        # X ve Y kelimelerini içeren satırları kontrol et (işaretli sayılar, Z/F/G kelimeleri ve yorumlar desteklenir)
+        return parse_xy(line) is not None
 
     def update_calibration_values(self, x_value, y_value):
         # Önceki değerleri kaydet
@@ -75,6 +121,48 @@ class GCodeProcessor:
         return (self.calibration_values["x_value"] != self.previous_calibration["x_value"] or 
                 self.calibration_values["y_value"] != self.previous_calibration["y_value"])
 
+    def parse_coordinates(self, lines):
+        """Satırlardaki koordinatları tek geçişte X/Y dizilerine ayır"""
+        points = [point for point in map(parse_xy, lines) if point is not None]
+        xs = array('d', [point[0] for point in points])
+        ys = array('d', [point[1] for point in points])
+        return xs, ys
+
+    def calibration_offset(self):
+        """Kalibrasyon değerlerini (x, y) kaydırma değerleri olarak döndür"""
+        try:
+            return (float(self.calibration_values["x_value"]),
+                    float(self.calibration_values["y_value"]))
+        except ValueError as e:
+            raise ValueError(f"Kalibrasyon değerleri uygulanırken hata: {str(e)}")
+
+    def parse_route(self, lines, number=0, source_file=None):
+        """Rota satırlarını tek seferde ayrıştır ve kalibre edilmiş Route nesnesi döndür"""
+        xs, ys = self.parse_coordinates(lines)
+        x_offset, y_offset = self.calibration_offset()
+        return Route(xs, ys, number, source_file, x_offset, y_offset)
+
+    def recalibrate_route(self, route):
+        """Rotayı yeniden ayrıştırmadan güncel kalibrasyona taşı - noktalar yeniden yazılmaz"""
+        return route.set_offset(*self.calibration_offset())
+
+    def calibrate_lines(self, lines):
+        """Satırları toplu olarak işle - tüm koordinatları tek seferde kalibre et"""
+        lines = [line for line in map(str.strip, lines) if line]
+        points = list(map(parse_xy, lines))
+        
+        # Koordinatları ayrıştır ve kalibre et
+        xs = array('d', [point[0] for point in points if point is not None])
+        ys = array('d', [point[1] for point in points if point is not None])
+        self.initial_coordinates = Route(xs, ys, 0, None, *self.calibration_offset())
+        
+        # İşlenmiş koordinatları sakla
+        self.processed_coordinates = self.initial_coordinates.copy()
+        
+        # Koordinat olmayan satırları olduğu gibi koru
+        formatted = iter(self.initial_coordinates.formatted())
+        return [next(formatted) if point is not None else line for line, point in zip(lines, points)]
+
     def load_file_content(self, content):
         """Dosya içeriğini ilk yükleme sırasında işle - koordinatları kalibre et"""
         if isinstance(content, str):
@@ -82,31 +170,23 @@ class GCodeProcessor:
         else:
             lines = [content]  # Tek satır geldiğinde
         
-        calibrated_lines = []
-        self.initial_coordinates = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:
-                if self.is_coordinate_line(line):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        x_val = float(parts[0][1:])  # X'ten sonraki değer
-                        y_val = float(parts[1][1:])  # Y'den sonraki değer
-                        
-                        # Kalibrasyon değerlerini ekle
-                        calibrated_coords = self.apply_calibration(x_val, y_val, True)
-                        calibrated_lines.append(calibrated_coords)
-                        self.initial_coordinates.append(calibrated_coords)
-                else:
-                    calibrated_lines.append(line)
-        
-        # İşlenmiş koordinatları sakla
-        self.processed_coordinates = self.initial_coordinates.copy()
+        calibrated_lines = self.calibrate_lines(lines)
         
         # Kalibre edilmiş koordinatları döndür
         return '\n'.join(calibrated_lines) if len(lines) > 1 else calibrated_lines[0]
 
+    def route_fingerprint(self):
+        """Rota gövdesini etkileyen parametrelerin parmak izini döndür"""
+        return (
+            self.calibration_values["x_value"], self.calibration_values["y_value"],
+            self.z_positions["needle_down"], self.z_positions["needle_up"],
+            self.bobbin_enabled, self.bobbin_reset_value,
+            self.punteriz_enabled, self.punteriz_start, self.punteriz_end,
+            self.start_speed, self.max_speed, self.speed_increment,
+            self.simplify_enabled, self.simplify_tolerance, self.min_stitch_length,
+            self.feed_planning,
+        )
+
     def has_parameters_changed(self):
         """Herhangi bir parametrenin değişip değişmediğini kontrol et"""
         calibration_changed = self.has_calibration_changed()
@@ -124,6 +204,35 @@ class GCodeProcessor:
         self.punteriz_start = start_value
         self.punteriz_end = end_value
 
+    def update_compaction_settings(self, enabled, merge_needle_up=False):
+        """Çıktı sıkıştırma ayarlarını güncelle"""
+        self.compact_output = enabled
+        self.merge_needle_up = merge_needle_up
+
+    def update_simplify_settings(self, enabled, tolerance, min_stitch_length):
+        """Dikiş noktası sadeleştirme ayarlarını güncelle ve doğrula"""
+        try:
+            tolerance_value = float(tolerance)
+            min_length_value = float(min_stitch_length)
+            
+            if tolerance_value < 0 or min_length_value < 0:
+                raise ValueError("Sadeleştirme değerleri negatif olamaz")
+            
+            self.simplify_enabled = enabled
+            self.simplify_tolerance = str(tolerance).strip()
+            self.min_stitch_length = str(min_stitch_length).strip()
+            
+        except ValueError as e:
+            raise ValueError(f"Geçersiz sadeleştirme değeri: {str(e)}")
+
+    def simplify_route(self, route):
+        """Sadeleştirme açıksa rotanın gereksiz noktalarını at; (rota, atılan nokta sayısı) döndür"""
+        if not self.simplify_enabled:
+            return route, 0
+        with run_trace.span('simplify', points=len(route)):
+            return route_simplify.simplify_route(route, float(self.simplify_tolerance),
+                                                 float(self.min_stitch_length))
+
     def update_speed_settings(self, start_speed, max_speed, speed_increment):
         """Hız ayarlarını güncelle ve doğrula"""
         try:
@@ -181,124 +290,132 @@ class GCodeProcessor:
         self.current_speed = new_speed
         return str(new_speed)
 
-    def apply_punteriz(self, coordinates):
+    def speed_profile(self, total_points):
+        """Güncel hız ayarlarıyla N noktalı rota için önbellekli hız profilini döndür"""
+        with run_trace.span('speed_ramp', points=total_points):
+            return build_speed_profile(total_points, int(self.start_speed),
+                                       int(self.max_speed), int(self.speed_increment))
+
+    def update_feed_planning(self, enabled):
+        """Geometriye göre hız planlamasını aç/kapat"""
+        self.feed_planning = enabled
+
+    def needle_stroke(self):
+        """İğnenin bir dikişte inip kalkarken katettiği Z yolu (mm); Z değerleri okunamazsa 0"""
+        try:
+            down = float(self.z_positions['needle_down'].strip()[1:])
+            up = float(self.z_positions['needle_up'].strip()[1:])
+        except (ValueError, AttributeError):
+            return 0.0
+        return 2 * abs(up - down)
+
+    def route_speed_profile(self, route, first, last):
+        """
+        Rotanın first..last noktalarını birleştiren (last - first) dikişin hız profilini döndür.
+        Hız planlaması kapalıysa (ya da dikiş sayısı çok azsa) nokta sırasına göre rampa kullanılır.
+        """
+        total_points = last - first
+        if not self.feed_planning or total_points <= 1:
+            return self.speed_profile(total_points)
+        with run_trace.span('feed_plan', points=total_points):
+            speeds = feed_planner.plan_feeds(route.xs[first:last + 1], route.ys[first:last + 1],
+                                             int(self.start_speed), int(self.max_speed),
+                                             int(self.speed_increment), stroke=self.needle_stroke())
+            return SpeedProfile(speeds, speed_suffixes(speeds))
+
+    def stitch_lines(self, coordinates, suffixes, trailing_needle_up=False):
+        """Koordinatları hız sonekleriyle birlikte iğne batma/geri çekilme satırlarına dönüştür"""
+        with run_trace.span('stitch', points=len(coordinates)):
+            needle_down = self.z_positions['needle_down']
+            stitches = [f"{coord} {needle_down}{suffix}" for coord, suffix in zip(coordinates, suffixes)]
+            if not stitches:
+                return []
+            
+            # Her dikişten sonra Z30 (son dikişten sonra isteğe bağlı)
+            lines = [self.z_positions["needle_up"]] * (2 * len(stitches) - (0 if trailing_needle_up else 1))
+            lines[0::2] = stitches
+            return lines
+
+    def apply_punteriz(self, route):
         """Punteriz işlemini uygula"""
-        if not coordinates:
-            return []
+        with run_trace.span('punteriz', points=len(route)):
+            if not route:
+                return []
+                
+            result = []
+            start_value = int(self.punteriz_start)
+            end_value = int(self.punteriz_end)
             
-        result = []
-        start_value = int(self.punteriz_start)
-        end_value = int(self.punteriz_end)
-        
-        # Koordinatları 2 ondalık basamağa yuvarla
-        formatted_coordinates = []
-        for coord in coordinates:
-            parts = coord.split()
-            x_val = round(float(parts[0][1:]), 2)  # X değeri
-            y_val = round(float(parts[1][1:]), 2)  # Y değeri
-            formatted_coordinates.append(f"X{x_val:.2f} Y{y_val:.2f}")
-        
-        # Hız takibi için değişkeni sıfırla
-        self.current_speed = None
-        
-        # Dikiş Başı Punteriz
-        if start_value > 0:
-            # İlk indeks rota başlangıcında olduğu için direkt ikinci indeksle başla
-            result.extend([
-                f"{formatted_coordinates[1]} {self.z_positions['needle_down']}",   # İkinci indeks
-                self.z_positions["needle_up"]
-            ])
+            # Koordinatları 2 ondalık basamakla formatla
+            with run_trace.span('format', points=len(route)):
+                formatted_coordinates = route.formatted()
             
-            # Punteriz sayısı kadar git-gel yap
-            for _ in range(start_value):
+            # Dikiş Başı Punteriz
+            if start_value > 0:
+                # İlk indeks rota başlangıcında olduğu için direkt ikinci indeksle başla
                 result.extend([
-                    f"{formatted_coordinates[0]} {self.z_positions['needle_down']}", # İlk indekse git
-                    self.z_positions["needle_up"],
-                    f"{formatted_coordinates[1]} {self.z_positions['needle_down']}"  # İkinci indekse dön
+                    f"{formatted_coordinates[1]} {self.z_positions['needle_down']}",   # İkinci indeks
+                    self.z_positions["needle_up"]
                 ])
-                result.append(self.z_positions["needle_up"])
-        
-        # Orta kısım - normal ilerleme
-        start_idx = 2 if start_value > 0 else 1  # İlk indeks rota başlangıcında olduğu için 1'den başla
-        end_idx = len(formatted_coordinates) - 2 if end_value > 0 else len(formatted_coordinates) - 1
-        
-        # Normal ilerleme için hız kontrolü
-        effective_length = end_idx - start_idx + 1  # +1 eklendi çünkü end_idx dahil
-        
-        # İlk nokta - başlangıç hızı ile
-        first_speed = self.calculate_speed(0, effective_length)
-        first_coord = f"{formatted_coordinates[start_idx]} {self.z_positions['needle_down']} F{first_speed}"
-        result.extend([first_coord, self.z_positions["needle_up"]])
-        
-        # Diğer noktalar
-        for i in range(start_idx + 1, end_idx + 1):  # end_idx dahil
-            current_pos = i - start_idx
-            speed = self.calculate_speed(current_pos, effective_length)
-            coord_line = f"{formatted_coordinates[i]} {self.z_positions['needle_down']}"
+                
+                # Punteriz sayısı kadar git-gel yap
+                for _ in range(start_value):
+                    result.extend([
+                        f"{formatted_coordinates[0]} {self.z_positions['needle_down']}", # İlk indekse git
+                        self.z_positions["needle_up"],
+                        f"{formatted_coordinates[1]} {self.z_positions['needle_down']}"  # İkinci indekse dön
+                    ])
+                    result.append(self.z_positions["needle_up"])
             
-            # Hız değişmişse F parametresini ekle
-            if speed is not None:
-                coord_line += f" F{speed}"
+            # Orta kısım - normal ilerleme
+            start_idx = 2 if start_value > 0 else 1  # İlk indeks rota başlangıcında olduğu için 1'den başla
+            end_idx = len(formatted_coordinates) - 2 if end_value > 0 else len(formatted_coordinates) - 1
             
-            # Z30 ekle
-            result.extend([coord_line, self.z_positions["needle_up"]])
-        
-        # Dikiş Sonu Punteriz
-        if end_value > 0:
-            last_idx = len(formatted_coordinates) - 1
-            second_last_idx = last_idx - 1
+            # Normal ilerleme için hız profili (ilk dikiş bir önceki noktadan başlar)
+            suffixes = self.route_speed_profile(route, start_idx - 1, end_idx).suffixes
             
-            # Son noktaya git
-            result.append(f"{formatted_coordinates[last_idx]} {self.z_positions['needle_down']}")
+            # İlk nokta - başlangıç hızı ile (F her zaman yazılır)
+            first_coord = f"{formatted_coordinates[start_idx]} {self.z_positions['needle_down']}{suffixes[0]}"
+            result.extend([first_coord, self.z_positions["needle_up"]])
             
-            # Punteriz sayısı (n) kadar git-gel yap
-            for i in range(end_value):
-                # Sondan bir önceki noktaya git
-                result.extend([
-                    self.z_positions["needle_up"],
-                    f"{formatted_coordinates[second_last_idx]} {self.z_positions['needle_down']}"
-                ])
+            # Diğer noktalar - F yalnızca hız değiştiğinde, her dikişten sonra Z30
+            result.extend(self.stitch_lines(formatted_coordinates[start_idx + 1:end_idx + 1],
+                                            suffixes[1:], trailing_needle_up=True))
+            
+            # Dikiş Sonu Punteriz
+            if end_value > 0:
+                last_idx = len(formatted_coordinates) - 1
+                second_last_idx = last_idx - 1
                 
-                # Son noktaya dön
-                result.extend([
-                    self.z_positions["needle_up"],
-                    f"{formatted_coordinates[last_idx]} {self.z_positions['needle_down']}"
-                ])
-        
-        return result
+                # Son noktaya git
+                result.append(f"{formatted_coordinates[last_idx]} {self.z_positions['needle_down']}")
+                
+                # Punteriz sayısı (n) kadar git-gel yap
+                for i in range(end_value):
+                    # Sondan bir önceki noktaya git
+                    result.extend([
+                        self.z_positions["needle_up"],
+                        f"{formatted_coordinates[second_last_idx]} {self.z_positions['needle_down']}"
+                    ])
+                    
+                    # Son noktaya dön
+                    result.extend([
+                        self.z_positions["needle_up"],
+                        f"{formatted_coordinates[last_idx]} {self.z_positions['needle_down']}"
+                    ])
+            
+            return result
 
     def process_gcode(self, content):
         """G-Code içeriğini işle"""
         if not self.processed_coordinates:
             raise ValueError("İşlenecek koordinat bulunamadı")
             
-        final_lines = []
-        coordinates = self.processed_coordinates
-        
-        # Hız takibi için değişkeni sıfırla
-        self.current_speed = None
+        coordinates = self.processed_coordinates.formatted()
         
-        # Koordinatları işle
-        for i in range(len(coordinates)):
-            # Hız hesapla
-            speed = self.calculate_speed(i, len(coordinates))
-            
-            # Koordinat satırını oluştur
-            coord_line = coordinates[i]
-            
-            # Z pozisyonunu ekle
-            coord_line += f" {self.z_positions['needle_down']}"
-            
-            # Hız değerini ekle (ilk koordinat veya hız değiştiğinde)
-            if i == 0 or speed is not None:
-                coord_line += f" F{speed if speed else self.start_speed}"
-            
-            # Satırı ekle
-            final_lines.append(coord_line)
-            
-            # Son koordinat değilse Z30 ekle
-            if i < len(coordinates) - 1:
-                final_lines.append(self.z_positions["needle_up"])
+        # Koordinatları hız profiliyle işle (F ilk koordinatta ve hız değiştiğinde yazılır)
+        suffixes = self.speed_profile(len(coordinates)).suffixes
+        final_lines = self.stitch_lines(coordinates, suffixes)
         
         return '\n'.join(final_lines)
 
@@ -0,0 +1,134 @@
+# G-Code satırlarını (harf, sayı) kelimelerine ayıran tek geçişli ayrıştırıcı.
+# Rota dosyası okuyucusu, GCodeProcessor ve MultiRouteProcessor bu modülü ortak kullanır.
+
+# Sayı kelimelerinde geçebilecek karakterler (işaret, ondalık ayırıcı ve üs dahil)
+_NUMBER_CHARS = "0123456789+-.eE"
+
+def strip_comments(line):
+    """Satırdaki ';' ve '( )' yorumlarını, '%' ile başlayan satırları temizler."""
+    line = line.strip()
+    if not line or line[0] == '%':
+        return ''
+
+    semicolon = line.find(';')
+    if semicolon >= 0:
+        line = line[:semicolon]
+
+    # Parantez içi yorumlar
+    start = line.find('(')
+    while start >= 0:
+        end = line.find(')', start)
+        if end < 0:
+            line = line[:start]
+            break
+        line = line[:start] + ' ' + line[end + 1:]
+        start = line.find('(')
+
+    return line
+
+def _scan_line(line):
+    """Satırı karakter karakter ayrıştır - bitişik ("X1Y2") ve aralıklı ("X 12") kelimeler için."""
+    words = []
+    i = 0
+    n = len(line)
+    while i < n:
+        char = line[i]
+        if char.isspace():
+            i += 1
+            continue
+        if not char.isalpha():
+            raise ValueError(f"Geçersiz G-Code karakteri: {char!r}")
+        letter = char.upper()
+        i += 1
+
+        # Harf ile sayı arasındaki boşlukları atla
+        while i < n and line[i] in ' \t':
+            i += 1
+
+        # İşaret, tam kısım ve ondalık kısım
+        j = i
+        if j < n and line[j] in '+-':
+            j += 1
+        digits_start = j
+        while j < n and (line[j].isdigit() or line[j] == '.'):
+            j += 1
+        if j == digits_start or line[digits_start:j] == '.':
+            raise ValueError(f"'{letter}' kelimesi için sayı bulunamadı")
+
+        # Üs (yalnızca ardından rakam geliyorsa - aksi halde E bir sonraki kelimenin harfidir)
+        if j < n and line[j] in 'eE':
+            k = j + 1
+            if k < n and line[k] in '+-':
+                k += 1
+            if k < n and line[k].isdigit():
+                while k < n and line[k].isdigit():
+                    k += 1
+                j = k
+
+        words.append((letter, float(line[i:j])))
+        i = j
+    return words
+
+def tokenize(line):
+    """
+    G-Code satırını tek geçişte (harf, sayı) kelimelerine ayırır.
+    İşaretli sayılar, üslü gösterim ve yorumlar desteklenir; geçersiz satırlarda ValueError fırlatır.
+    """
+    if ';' in line or '(' in line or '%' in line:
+        line = strip_comments(line)
+
+    words = []
+    try:
+        for word in line.split():
+            # Hızlı yol: "X12.5" biçimindeki tek kelime
+            number = word[1:]
+            if not number or number.strip(_NUMBER_CHARS) or not word[0].isalpha():
+                break
+            words.append((word[0].upper(), float(number)))
+        else:
+            return words
+    except ValueError:
+        pass
+
+    # Yavaş yol: bitişik kelimeler ("X1Y2") veya "X 12" gibi yazımlar
+    return _scan_line(line)
+
+def parse_xy(line):
+    """Satırda X ve Y kelimeleri varsa (x, y) döndürür, aksi halde None döndürür."""
+    # Hızlı yol: yalnızca X ve Y kelimelerinin değerleri dönüştürülür. Yorum, bitişik kelime
+    # ya da sayı olmayan karakter içeren her kelime tam ayrıştırıcıya düşer.
+    x = y = None
+    try:
+        for word in line.split():
+            number = word[1:]
+            if not number or number.strip(_NUMBER_CHARS):
+                break
+            letter = word[0]
+            if letter == 'X' or letter == 'x':
+                x = float(number)
+            elif letter == 'Y' or letter == 'y':
+                y = float(number)
+            elif not letter.isalpha():
+                break
+        else:
+            if x is None or y is None:
+                return None
+            return x, y
+    except ValueError:
+        pass
+
+    # Yavaş yol: tam ayrıştırıcı
+    try:
+        words = tokenize(line)
+    except ValueError:
+        return None
+
+    x = y = None
+    for letter, value in words:
+        if letter == 'X':
+            x = value
+        elif letter == 'Y':
+            y = value
+    if x is None or y is None:
+        return None
+    return x, y
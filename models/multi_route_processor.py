@@ -1,12 +1,59 @@
 import os
 import glob
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from models.cycle_time import CycleTimeEstimator
+from models.gcode_compactor import GCodeCompactor
 from models.gcode_processor import GCodeProcessor
+from models.gcode_tokenizer import parse_xy
+from models.route import Route
+from models.route_cache import RouteCache
+from models.route_order import plan_route_order
+from models.route_simplify import LINES_PER_POINT
+from models.route_reader import read_route_coordinates
+from models.route_store import RouteStore, file_fingerprint
+from utils import run_trace
+
+class RouteProcessingCancelled(Exception):
+    """Rota işleme kullanıcı tarafından rotalar arasında iptal edildiğinde fırlatılır."""
+
+# Paralel işlemde her çalışan süreçte kullanılan rota işleyicisi
+_worker_processor = None
+
+def _init_worker(processor):
+    """Çalışan sürecin rota işleyicisini ana süreçteki parametrelerle hazırla"""
+    global _worker_processor
+    _worker_processor = MultiRouteProcessor()
+    _worker_processor.processor = processor
+
+def _process_route_file(route_file, route_number, reverse=False):
+    """Çalışan süreçte rota dosyasını oku, ayrıştır ve rota gövdesini işle"""
+    route = _worker_processor.read_route_file(route_file, route_number)
+    prepared, removed = _worker_processor.prepare_route(route, reverse)
+    return route, _worker_processor.emit_route_body(prepared), removed
+
+def _emit_route_body(route, reverse=False):
+    """Çalışan süreçte önceden ayrıştırılmış rotanın gövdesini işle"""
+    prepared, removed = _worker_processor.prepare_route(route, reverse)
+    return None, _worker_processor.emit_route_body(prepared), removed
 
 class MultiRouteProcessor:
     def __init__(self):
         self.processor = GCodeProcessor()
         self.routes_folder = "routes"
         self.route_files = []
+        self.parallel = False  # Rotaları birden fazla süreçte işle
+        self.max_workers = None  # None: işlemci çekirdeği sayısı kadar
+        self.route_cache = RouteCache()  # None: önbellek devre dışı
+        self.route_store = RouteStore()  # Yükleme ve G-Code oluşturma için ortak rota deposu
+        self.last_compaction = None  # Son oluşturmanın sıkıştırma sonucu (sıkıştırma kapalıysa None)
+        self.optimize_order = False  # Rotaları boş geçişi kısaltacak sırayla işle
+        self.allow_route_reversal = False  # Sıralamada rotaların sondan başa dikilmesine izin ver
+        self.last_ordering = None  # Son oluşturmanın sıralama sonucu (sıralama kapalıysa None)
+        self.last_simplification = None  # Son oluşturmanın sadeleştirme sonucu (sadeleştirme kapalıysa None)
+        self.simplified_points = {}  # Rota dosyası -> (önbellek anahtarı, atılan nokta sayısı)
+        self.last_cycle_time = None  # Son oluşturmanın çalışma süresi tahmini (CycleTimeEstimator)
         
     def load_route_files(self):
         """Rota klasöründeki tüm .nc dosyalarını yükle"""
@@ -18,21 +65,48 @@ class MultiRouteProcessor:
         if not self.route_files:
             raise FileNotFoundError("İşlenecek .nc dosyası bulunamadı")
             
+        # Klasörden kaldırılan dosyaların rotalarını depodan çıkar
+        self.route_store.retain(self.route_files)
+        route_files = set(self.route_files)
+        self.simplified_points = {route_file: entry for route_file, entry in self.simplified_points.items()
+                                  if route_file in route_files}
+            
         return self.route_files
         
-    def process_single_route(self, content, route_number):
+    def parse_route_content(self, content, route_number, source_file=None):
+        """Rota içeriğindeki koordinatları ayıkla ve tek seferde kalibre et"""
+        return self.processor.parse_route(content.split('\n'), route_number, source_file)
+        
+    def process_single_route(self, content, route_number, source_file=None):
         """Tek bir rotayı işle"""
-        # Koordinatları ayıkla ve kalibre et
-        coordinates = []
-        for line in content.strip().split('\n'):
-            if line.strip().startswith('X') and ' Y' in line:
-                # Koordinatları kalibre et
-                calibrated_line = self.processor.load_file_content(line.strip())
-                coordinates.append(calibrated_line)
-                
-        if not coordinates:
+        return self.emit_route(self.parse_route_content(content, route_number, source_file))
+        
+    def emit_route(self, route):
+        """Route nesnesinden rota G-Code satırlarını üret"""
+        route_content = self.emit_route_body(self.prepare_route(route)[0])
+        
+        # 7. İp kesme parametreleri
+        route_content.extend(self.processor.thread_cut_params)
+        
+        return route_content
+        
+    def prepare_route(self, route, reverse=False):
+        """Rotayı çıktıya hazırla: gerekirse ters çevir ve hız profilinden önce sadeleştir"""
+        if reverse:
+            route = route.reversed()
+        return self.processor.simplify_route(route)
+        
+    def emit_route_body(self, route):
+        """Route nesnesinden ip kesme parametreleri hariç rota gövdesini üret"""
+        route_number = route.number
+        
+        if not route:
             raise ValueError(f"Rota {route_number}: İşlenecek koordinat bulunamadı")
-            
+        
+        # Koordinat metinleri yalnızca çıktı aşamasında oluşturulur
+        with run_trace.span('format', points=len(route)):
+            coordinates = route.formatted()
+        
         # Rota içeriğini oluştur
         route_content = []
         
@@ -54,9 +128,6 @@ class MultiRouteProcessor:
             "G04 P200"
         ])
         
-        # Hız takibi için değişkeni sıfırla
-        self.processor.current_speed = None
-        
         # 5. Üst İp Sıkma Bobini kontrolü
         if self.processor.bobbin_enabled:
             route_content.append("M118")
@@ -75,58 +146,290 @@ class MultiRouteProcessor:
         # 6. Koordinatları işle
         if self.processor.punteriz_enabled:
             # Punteriz işlemi
-            punteriz_lines = self.processor.apply_punteriz(coordinates)
+            punteriz_lines = self.processor.apply_punteriz(route)
             route_content.extend(punteriz_lines)
         else:
-            # Normal işlem - hız kontrolü ile
-            for i in range(1, len(coordinates)):  # İlk koordinat zaten eklendi
-                # Hız hesapla
-                speed = self.processor.calculate_speed(i-1, len(coordinates)-1)
-                
-                # Koordinat satırı
-                coord_line = coordinates[i]
-                
-                # Z pozisyonu ekle
-                coord_line += f" {self.processor.z_positions['needle_down']}"
-                
-                # Hız değeri ekle (sadece ilk koordinat veya hız değiştiğinde)
-                if i == 1 or speed is not None:
-                    coord_line += f" F{speed if speed else self.processor.start_speed}"
-                
-                # Satırı ekle
-                route_content.append(coord_line)
+            # Normal işlem - önceden hesaplanmış hız profili ile (ilk koordinat zaten eklendi)
+            suffixes = self.processor.route_speed_profile(route, 0, len(coordinates) - 1).suffixes
+            route_content.extend(self.processor.stitch_lines(coordinates[1:], suffixes))
+        
+        return route_content
+        
+    def read_route_file(self, route_file, route_number):
+        """Rota dosyasını belleğe eşleyerek oku ve koordinatları doğrudan baytlardan ayrıştır"""
+        with run_trace.span('read_parse', files=1):
+            xs, ys = read_route_coordinates(route_file)
+        run_trace.add_counts('read_parse', points=len(xs))
+        x_offset, y_offset = self.processor.calibration_offset()
+        return Route(xs, ys, route_number, route_file, x_offset, y_offset)
+        
+    def stored_route(self, route_file, fingerprint):
+        """Dosya değişmediyse depodaki rotayı güncel kalibrasyonla döndür"""
+        route = self.route_store.get(route_file, fingerprint)
+        if route is not None:
+            self.processor.recalibrate_route(route)
+        return route
+        
+    def get_route(self, route_file, route_number, fingerprint=None):
+        """Rotayı depodan döndür; yoksa ya da dosya değiştiyse yeniden ayrıştırıp depola"""
+        if fingerprint is None:
+            fingerprint = file_fingerprint(route_file)
+        route = self.stored_route(route_file, fingerprint)
+        if route is None:
+            route = self.read_route_file(route_file, route_number)
+            self.route_store.put(route, fingerprint)
+        route.number = route_number
+        return route
+        
+    def recalibrate_routes(self):
+        """Kalibrasyon değiştiyse depodaki tüm rotaları yeniden ayrıştırmadan güncelle"""
+        changed = 0
+        with run_trace.span('calibration'):
+            for route in self.route_store.routes():
+                if self.processor.recalibrate_route(route):
+                    changed += 1
+        run_trace.add_counts('calibration', routes=changed)
+        return changed
+        
+    def route_cache_key(self, route_file, route_number, fingerprint=None, reverse=False):
+        """Rota gövdesi için önbellek anahtarını döndür (önbellek kapalıysa None)"""
+        if self.route_cache is None:
+            return None
+        if fingerprint is None:
+            fingerprint = file_fingerprint(route_file)
+        return fingerprint, route_number, reverse, self.processor.route_fingerprint()
+        
+    def process_route_file(self, route_file, route_number, reverse=False):
+        """Rotayı işle - değişmemiş rotalar önbellekten, ayrıştırılmış rotalar depodan gelir"""
+        fingerprint = file_fingerprint(route_file)
+        key = self.route_cache_key(route_file, route_number, fingerprint, reverse)
+        body = self.route_cache.get(key) if key is not None else None
+        
+        if body is None:
+            route, removed = self.prepare_route(self.get_route(route_file, route_number, fingerprint), reverse)
+            body = self.emit_route_body(route)
+            if key is not None:
+                self.route_cache.put(key, body)
+            self.count_simplified(route_file, key, removed)
+        else:
+            run_trace.add_counts('route', cache_hits=1)
+            self.count_simplified(route_file, key)
                 
-                # Son koordinat değilse Z30 ekle
-                if i < len(coordinates) - 1:
-                    route_content.append(self.processor.z_positions["needle_up"])
+        return body + self.processor.thread_cut_params
         
-        # 7. İp kesme parametreleri
-        route_content.extend(self.processor.thread_cut_params)
+    def count_simplified(self, route_file, key, removed=None):
+        """
+        Rotada sadeleştirmeyle atılan nokta sayısını son oluşturmanın toplamına ekle.
+        removed None ise rota önbellekten gelmiştir; aynı anahtarla kaydedilmiş sayı kullanılır.
+        """
+        if self.last_simplification is None:
+            return
+        if removed is None:
+            stored_key, removed = self.simplified_points.get(route_file, (None, 0))
+            if stored_key != key:
+                removed = 0
+        else:
+            self.simplified_points[route_file] = (key, removed)
+        self.last_simplification['routes'] += 1
+        self.last_simplification['points_removed'] += removed
+        self.last_simplification['lines_removed'] += removed * LINES_PER_POINT
+        run_trace.add_counts('simplify', points_removed=removed)
         
-        return route_content
+    @staticmethod
+    def check_cancelled(is_cancelled):
+        """İptal istendiyse RouteProcessingCancelled fırlat"""
+        if is_cancelled is not None and is_cancelled():
+            raise RouteProcessingCancelled("İşlem iptal edildi")
         
-    def process_routes(self):
-        """Tüm rotaları işle ve tek bir G-Code oluştur"""
+    @staticmethod
+    def record_route(index, route_file, lines, seconds):
+        """Etkin çalışma izlemesine rota bazlı süre ve satır sayısını ekle"""
+        if run_trace.current_trace() is None:
+            return
+        run_trace.add_counts('route', routes=1, lines=lines)
+        run_trace.add_route(number=index, file=os.path.basename(route_file),
+                            lines=lines, seconds=round(seconds, 6))
+        
+    def plan_program_order(self):
+        """
+        Rotaların program sırasını (rota dosyası, ters mi) listesi olarak döndür.
+        Sıralama kapalıysa dosya sırası korunur; açıksa rotaların uç noktalarından
+        rotalar arası boş geçişi kısaltan sıra planlanır.
+        """
+        if not self.optimize_order or len(self.route_files) < 2:
+            self.last_ordering = None
+            return [(route_file, False) for route_file in self.route_files]
+            
+        endpoints = []
+        for index, route_file in enumerate(self.route_files, 1):
+            try:
+                route = self.get_route(route_file, index)
+                if not route:
+                    raise ValueError(f"Rota {index}: İşlenecek koordinat bulunamadı")
+            except Exception as e:
+                raise Exception(f"Rota {index} işlenirken hata: {str(e)}")
+            endpoints.append((route.point(0), route.point(-1)))
+            
+        # Makine ilk rotaya başlangıç parametrelerindeki son konumdan gelir, son rotadan sonra
+        # sonlandırma parametrelerindeki ilk konuma gider
+        start_points = [point for point in map(parse_xy, self.processor.start_params) if point is not None]
+        end_points = [point for point in map(parse_xy, self.processor.end_params) if point is not None]
+        with run_trace.span('route_order', routes=len(endpoints)):
+            self.last_ordering = plan_route_order(endpoints,
+                                                  start_points[-1] if start_points else None,
+                                                  end_points[0] if end_points else None,
+                                                  self.allow_route_reversal)
+        run_trace.add_counts('route_order', reversed=self.last_ordering.reversed_count)
+        return [(self.route_files[route], reverse) for route, reverse in self.last_ordering.order]
+        
+    def iter_route_contents(self, is_cancelled=None, program_order=None):
+        """Rotaları program sırasıyla işle ve her rotanın satırlarını sırasıyla döndür"""
+        if program_order is None:
+            program_order = [(route_file, False) for route_file in self.route_files]
+            
+        if self.parallel and len(program_order) > 1:
+            yield from self._iter_route_contents_parallel(is_cancelled, program_order)
+            return
+            
+        for index, (route_file, reverse) in enumerate(program_order, 1):
+            # İptal yalnızca rotalar arasında kontrol edilir
+            self.check_cancelled(is_cancelled)
+            start = time.perf_counter()
+            try:
+                with run_trace.span('route'):
+                    route_content = self.process_route_file(route_file, index, reverse)
+            except Exception as e:
+                raise Exception(f"Rota {index} işlenirken hata: {str(e)}")
+            self.record_route(index, route_file, len(route_content), time.perf_counter() - start)
+            yield route_content
+        
+    def _iter_route_contents_parallel(self, is_cancelled, program_order):
+        """Rotaları süreç havuzunda işle ve sonuçları program sırasıyla döndür"""
+        max_workers = self.max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.processor,)) as executor:
+            # Bellek kullanımını sınırlamak için yalnızca sınırlı sayıda rotayı önden gönder
+            window = 2 * max_workers
+            route_jobs = enumerate(program_order, 1)
+            pending = deque()
+            
+            def submit_next():
+                # Önbellekte bulunan rotalar havuza gönderilmez, bellekteki rotalar yeniden ayrıştırılmaz
+                for index, (route_file, reverse) in route_jobs:
+                    future = None
+                    try:
+                        fingerprint = file_fingerprint(route_file)
+                        key = self.route_cache_key(route_file, index, fingerprint, reverse)
+                        body = self.route_cache.get(key) if key is not None else None
+                        if body is None:
+                            route = self.stored_route(route_file, fingerprint)
+                            if route is not None:
+                                route.number = index
+                                future = executor.submit(_emit_route_body, route, reverse)
+                            else:
+                                future = executor.submit(_process_route_file, route_file, index, reverse)
+                    except Exception as e:
+                        raise Exception(f"Rota {index} işlenirken hata: {str(e)}")
+                    pending.append((index, route_file, key, fingerprint, body, future))
+                    return True
+                return False
+            
+            def cancel_pending():
+                # Henüz başlamamış rotaları havuzdan geri çek
+                for *_, remaining in pending:
+                    if remaining is not None:
+                        remaining.cancel()
+            
+            while len(pending) < window and submit_next():
+                pass
+                    
+            while pending:
+                # İptal yalnızca rotalar arasında kontrol edilir
+                if is_cancelled is not None and is_cancelled():
+                    cancel_pending()
+                    raise RouteProcessingCancelled("İşlem iptal edildi")
+                index, route_file, key, fingerprint, body, future = pending.popleft()
+                start = time.perf_counter()
+                if future is not None:
+                    try:
+                        # Çalışan süreçlerdeki aşamalar ölçülemez; ana süreçte bekleme süresi kaydedilir
+                        with run_trace.span('worker_wait'):
+                            route, body, removed = future.result()
+                    except Exception as e:
+                        cancel_pending()
+                        raise Exception(f"Rota {index} işlenirken hata: {str(e)}")
+                    if route is not None:
+                        self.route_store.put(route, fingerprint)
+                    if key is not None:
+                        self.route_cache.put(key, body)
+                    self.count_simplified(route_file, key, removed)
+                else:
+                    self.count_simplified(route_file, key)
+                    
+                # Sıradaki rotayı gönder
+                submit_next()
+                    
+                route_content = body + self.processor.thread_cut_params
+                self.record_route(index, route_file, len(route_content), time.perf_counter() - start)
+                yield route_content
+        
+    def iter_gcode_lines(self, progress=None, is_cancelled=None):
+        """
+        Tüm rotaları işle ve G-Code satırlarını rota rota üret.
+        progress(tamamlanan, toplam) her rotadan sonra çağrılır; is_cancelled() True
+        döndürürse işlem bir sonraki rotadan önce RouteProcessingCancelled ile durur.
+        Sıkıştırma açıksa satırlar modal durum izlenerek sıkıştırılır.
+        """
+        lines = self.iter_program_lines(progress, is_cancelled)
+        if not self.processor.compact_output:
+            self.last_compaction = None
+            yield from lines
+            return
+            
+        compactor = GCodeCompactor(self.processor.z_positions["needle_down"],
+                                   self.processor.z_positions["needle_up"],
+                                   self.processor.merge_needle_up)
+        self.last_compaction = compactor
+        yield from compactor.compact(lines)
+        run_trace.add_counts('compact', lines_removed=compactor.lines_removed, bytes_saved=compactor.bytes_saved)
+        
+    def iter_program_lines(self, progress=None, is_cancelled=None):
+        """Sıkıştırılmamış G-Code satırlarını rota rota üret"""
         if not self.route_files:
             self.load_route_files()
             
-        final_gcode = []
+        # Kalibrasyon değiştiyse bellekteki rotaları yeniden ayrıştırmadan güncelle
+        self.recalibrate_routes()
+        program_order = self.plan_program_order()
+        self.last_simplification = ({'routes': 0, 'points_removed': 0, 'lines_removed': 0}
+                                    if self.processor.simplify_enabled else None)
+        
+        # Çalışma süresi, satırlar üretilirken rota rota tahmin edilir
+        estimator = CycleTimeEstimator()
+        self.last_cycle_time = estimator
         
         # 1. G-Code başlangıç parametreleri (sadece bir kez)
-        final_gcode.extend(self.processor.start_params)
+        estimator.add_section('start', self.processor.start_params)
+        yield from self.processor.start_params
         
-        # 2. Her rotayı işle
-        for index, route_file in enumerate(self.route_files, 1):
-            try:
-                with open(route_file, 'r') as file:
-                    content = file.read()
-                    # Rotayı işle
-                    route_content = self.process_single_route(content, index)
-                    final_gcode.extend(route_content)
-            except Exception as e:
-                raise Exception(f"Rota {index} işlenirken hata: {str(e)}")
+        # 2. Her rotayı işle - bellekte yalnızca o anki rotalar tutulur
+        total = len(program_order)
+        for index, route_content in enumerate(self.iter_route_contents(is_cancelled, program_order), 1):
+            with run_trace.span('cycle_time'):
+                estimator.add_section(index, route_content)
+            yield from route_content
+            if progress is not None:
+                progress(index, total)
                 
         # 3. G-Code sonlandırma parametreleri
-        final_gcode.extend(self.processor.end_params)
+        estimator.add_section('end', self.processor.end_params)
+        yield from self.processor.end_params
         
-        return '\n'.join(final_gcode) 
\ No newline at end of file
+    def process_routes(self, progress=None, is_cancelled=None):
+        """Tüm rotaları işle ve tek bir G-Code oluştur"""
+        # Rota aşamaları kendi sürelerine yazılır; 'join' yalnızca birleştirme süresini içerir
+        with run_trace.span('join'):
+            content = '\n'.join(self.iter_gcode_lines(progress, is_cancelled))
+        run_trace.add_counts('join', bytes=len(content))
+        return content
@@ -0,0 +1,73 @@
+from array import array
+
+# Koordinat satırı formatı (her zaman 2 ondalık basamak)
+COORDINATE_FORMAT = "X{:.2f} Y{:.2f}"
+
+class Route:
+    """
+    Bir rotanın noktalarını paketlenmiş float dizilerinde tutan veri sınıfı.
+    Nokta başına 16 bayt yer kaplar; metin yalnızca çıktı üretilirken oluşturulur.
+    Ham koordinatlar değiştirilmeden saklanır, kalibrasyon x_offset/y_offset olarak
+    çıktı aşamasında eklenir; böylece kalibrasyon değişikliği noktaları yeniden yazmaz.
+    """
+    __slots__ = ('number', 'source_file', 'xs', 'ys', 'x_offset', 'y_offset')
+
+    def __init__(self, xs=None, ys=None, number=0, source_file=None, x_offset=0.0, y_offset=0.0):
+        self.xs = xs if xs is not None else array('d')
+        self.ys = ys if ys is not None else array('d')
+        if len(self.xs) != len(self.ys):
+            raise ValueError("X ve Y koordinat sayıları eşit olmalıdır")
+        self.number = number
+        self.source_file = source_file
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+
+    def __len__(self):
+        return len(self.xs)
+
+    def __repr__(self):
+        return f"Route(number={self.number}, points={len(self)}, source_file={self.source_file!r})"
+
+    @property
+    def bounds(self):
+        """Rotanın sınırlarını (min_x, min_y, max_x, max_y) olarak döndürür."""
+        if not self.xs:
+            return None
+        return (min(self.xs) + self.x_offset, min(self.ys) + self.y_offset,
+                max(self.xs) + self.x_offset, max(self.ys) + self.y_offset)
+
+    @property
+    def nbytes(self):
+        """Koordinat dizilerinin bellekte kapladığı bayt sayısını döndürür."""
+        return (len(self.xs) * self.xs.itemsize) + (len(self.ys) * self.ys.itemsize)
+
+    def point(self, index):
+        """Belirtilen indeksteki kalibre edilmiş noktayı (x, y) olarak döndürür."""
+        return self.xs[index] + self.x_offset, self.ys[index] + self.y_offset
+
+    def format_point(self, index):
+        """Belirtilen indeksteki noktayı 'X.. Y..' satırı olarak döndürür."""
+        return COORDINATE_FORMAT.format(*self.point(index))
+
+    def formatted(self):
+        """Tüm noktaları tek seferde 'X.. Y..' satırlarına dönüştürür."""
+        return list(map(COORDINATE_FORMAT.format,
+                        map(self.x_offset.__add__, self.xs),
+                        map(self.y_offset.__add__, self.ys)))
+
+    def set_offset(self, x_offset, y_offset):
+        """Tüm noktaların kaydırma değerlerini tek seferde günceller."""
+        changed = (x_offset, y_offset) != (self.x_offset, self.y_offset)
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        return changed
+
+    def copy(self):
+        """Rotanın bağımsız bir kopyasını döndürür."""
+        return Route(array('d', self.xs), array('d', self.ys), self.number,
+                     self.source_file, self.x_offset, self.y_offset)
+
+    def reversed(self):
+        """Noktaları ters sırada olan bağımsız bir kopya döndürür (rota sondan başa dikilir)."""
+        return Route(self.xs[::-1], self.ys[::-1], self.number,
+                     self.source_file, self.x_offset, self.y_offset)
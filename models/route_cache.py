@@ -0,0 +1,57 @@
+import sys
+from collections import OrderedDict
+
+# Önbellekteki her satır için tahmini ek bellek maliyeti (str nesnesi + liste işaretçisi)
+LINE_OVERHEAD = sys.getsizeof('') + 8
+
+class RouteCache:
+    """
+    İşlenmiş rota gövdelerini bayt cinsinden sınırlı bir LRU önbellekte tutan sınıf.
+    Anahtar; rota dosyasının durumu, rota numarası ve rota gövdesini etkileyen
+    parametrelerin parmak izinden oluşur.
+    """
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def estimate_size(lines):
+        """Satır listesinin bellekte kapladığı yaklaşık bayt sayısını döndürür."""
+        return sum(map(len, lines)) + len(lines) * LINE_OVERHEAD
+
+    def get(self, key):
+        """Önbellekteki rota gövdesini döndürür, yoksa None döndürür."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, lines):
+        """Rota gövdesini önbelleğe ekler ve gerekirse en eski kayıtları çıkarır."""
+        size = self.estimate_size(lines)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (lines, size)
+        self.current_bytes += size
+
+        # En uzun süredir kullanılmayan kayıtları çıkar
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def clear(self):
+        """Önbelleği temizler."""
+        self._entries.clear()
+        self.current_bytes = 0
@@ -0,0 +1,369 @@
+import heapq
+import math
+import time
+from collections import deque, namedtuple
+
+# Rotalar arası boş geçiş hızı (mm/dk) - rota başındaki "F10000" ile aynı
+TRAVEL_FEED = 10000
+
+# İyileştirmede her rota ucu için denenecek en yakın aday rota sayısı
+NEIGHBOR_COUNT = 8
+
+# İyileştirme hamlesi sınırı: rota sayısının bu katı kadar hamleden sonra durulur
+MOVES_PER_ROUTE = 20
+
+# Bir 2-opt hamlesi ters çevrilen bölümdeki rota sayısı kadar iş yapar. Bundan kısa
+# bölümler her zaman ters çevrilir; daha uzunları toplam iş rota sayısının WORK_PER_ROUTE
+# katını aşmadıkça. Böylece iyileştirme süresi rota sayısıyla doğrusal kalır; yaklaşık
+# 10 bin rotaya kadar sınıra ulaşılmaz.
+SHORT_MOVE_ROUTES = 64
+WORK_PER_ROUTE = 1000
+
+# Bağlı listede ilk rotadan önceki ve son rotadan sonraki konumları gösteren anahtarlar
+_HEAD = -1
+_TAIL = -2
+
+# Ters çevrilen bölümdeki rotaların yön bayraklarını (0/1) çevirir
+_FLIP_FLAGS = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+def travel_seconds(distance_mm, feed=TRAVEL_FEED):
+    """Boş geçiş mesafesinin tahmini süresini (saniye) döndürür."""
+    return distance_mm / (feed / 60.0)
+
+class RouteOrder(namedtuple('RouteOrder', ['order', 'original_mm', 'optimized_mm', 'plan_seconds'])):
+    """Planlanan rota sırası: order, program sırasıyla (rota indeksi, ters mi) çiftleridir."""
+    __slots__ = ()
+
+    @property
+    def saved_mm(self):
+        return self.original_mm - self.optimized_mm
+
+    @property
+    def reversed_count(self):
+        return sum(1 for _, reverse in self.order if reverse)
+
+    def summary(self):
+        """Sıralama sonucunu sözlük olarak döndürür."""
+        return {
+            'routes': len(self.order),
+            'reversed': self.reversed_count,
+            'original_mm': round(self.original_mm, 3),
+            'optimized_mm': round(self.optimized_mm, 3),
+            'saved_mm': round(self.saved_mm, 3),
+            'saved_seconds': round(travel_seconds(self.saved_mm), 3),
+            'plan_seconds': round(self.plan_seconds, 6),
+        }
+
+def _distance(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+class SpatialTree:
+    """
+    Noktaları yapraklarında en fazla leaf_size nokta kalana kadar uzun kenarından ikiye
+    bölen uzamsal indeks (k-d ağacı). En yakın nokta araması kutusu sorgu noktasına en
+    yakın düğümden başlar ve bulunan noktalardan uzak kutulara inmez. Bölmeler nokta
+    yoğunluğuna uyduğu için kümelenmiş rotalarda da her arama birkaç yaprağa bakar;
+    çıkarılan noktası kalmayan dallar aramaya hiç girmez.
+    """
+    def __init__(self, points, leaf_size=8):
+        self.points = points
+        self.boxes = []  # Düğümdeki noktaları çevreleyen kutu: (min x, min y, max x, max y)
+        self.children = []  # İç düğümün iki çocuğu; yapraklarda None
+        self.leaves = []  # Yaprağın (çıkarılmamış) nokta anahtarları; iç düğümlerde None
+        self.alive = []  # Düğümün altında çıkarılmamış nokta sayısı
+        self.parents = []
+        self.leaf_of = [0] * len(points)
+        pending = [(list(range(len(points))), -1)]
+        while pending:
+            keys, parent = pending.pop()
+            node = len(self.boxes)
+            xs = [points[key][0] for key in keys] or [0.0]
+            ys = [points[key][1] for key in keys] or [0.0]
+            box = (min(xs), min(ys), max(xs), max(ys))
+            self.boxes.append(box)
+            self.alive.append(len(keys))
+            self.parents.append(parent)
+            if parent >= 0:
+                self.children[parent].append(node)
+            if len(keys) <= leaf_size:
+                self.children.append(None)
+                self.leaves.append(set(keys))
+                for key in keys:
+                    self.leaf_of[key] = node
+                continue
+            axis = 0 if box[2] - box[0] >= box[3] - box[1] else 1
+            keys.sort(key=lambda key: points[key][axis])
+            half = len(keys) // 2
+            self.children.append([])
+            self.leaves.append(None)
+            pending.append((keys[half:], node))
+            pending.append((keys[:half], node))
+
+    def remove(self, key):
+        """Noktayı sonraki aramalardan çıkarır."""
+        node = self.leaf_of[key]
+        self.leaves[node].discard(key)
+        while node >= 0:
+            self.alive[node] -= 1
+            node = self.parents[node]
+
+    def nearest(self, point, count=1):
+        """Noktaya en yakın count anahtarı yakından uzağa sıralı döndürür (eşit uzaklıkta küçük anahtar önce)."""
+        x, y = point
+        hypot = math.hypot
+        found = []  # (-uzaklık, -anahtar) yığını: en uzak bulunan nokta başta
+        nodes = [(0.0, 0)]  # (kutunun noktaya uzaklığı, düğüm) yığını
+        while nodes:
+            bound, node = heapq.heappop(nodes)
+            if len(found) >= count and bound > -found[0][0]:
+                break
+            children = self.children[node]
+            if children is None:
+                for key in self.leaves[node]:
+                    px, py = self.points[key]
+                    candidate = (-hypot(px - x, py - y), -key)
+                    if len(found) < count:
+                        heapq.heappush(found, candidate)
+                    elif candidate > found[0]:
+                        heapq.heapreplace(found, candidate)
+                continue
+            for child in children:
+                if self.alive[child]:
+                    min_x, min_y, max_x, max_y = self.boxes[child]
+                    dx = min_x - x if x < min_x else (x - max_x if x > max_x else 0.0)
+                    dy = min_y - y if y < min_y else (y - max_y if y > max_y else 0.0)
+                    heapq.heappush(nodes, (hypot(dx, dy), child))
+        found.sort(reverse=True)
+        return [-key for _, key in found]
+
+class RouteOrderPlanner:
+    """
+    Rotaların başlangıç ve bitiş noktalarına bakarak rotalar arası toplam boş geçişi
+    kısaltan bir işleme sırası bulan sınıf.
+    Önce uzamsal indeksle en yakın komşu sırası kurulur, ardından aday listeli yerel
+    iyileştirme yapılır: ters çevirmeye izin varsa 2-opt (bölüm ters çevrilirken içindeki
+    rotaların yönü de çevrilir), yoksa rota yönünü koruyan tek rota taşıma (or-opt).
+    Geçişlere ilk rotadan önceki başlangıç konumu ve son rotadan sonraki bitiş konumu da dahildir.
+    """
+    def __init__(self, endpoints, start=None, end=None, allow_reverse=False,
+                 neighbor_count=NEIGHBOR_COUNT, moves_per_route=MOVES_PER_ROUTE, work_per_route=WORK_PER_ROUTE):
+        self.endpoints = endpoints  # Her rota için ((başlangıç x, y), (bitiş x, y))
+        self.start = start  # Makinenin ilk rotadan önceki konumu (bilinmiyorsa None)
+        self.end = end  # Son rotadan sonra gidilen konum (bilinmiyorsa None)
+        self.allow_reverse = allow_reverse
+        self.neighbor_count = neighbor_count
+        self.moves_per_route = moves_per_route
+        self.work_per_route = work_per_route
+
+    def entry(self, item):
+        route, reverse = item
+        return self.endpoints[route][1 if reverse else 0]
+
+    def exit(self, item):
+        route, reverse = item
+        return self.endpoints[route][0 if reverse else 1]
+
+    def travel(self, order):
+        """(rota, ters) sırasının toplam boş geçiş mesafesini (mm) döndürür."""
+        total = 0.0
+        position = self.start
+        for item in order:
+            if position is not None:
+                total += _distance(position, self.entry(item))
+            position = self.exit(item)
+        if self.end is not None and position is not None:
+            total += _distance(position, self.end)
+        return total
+
+    def plan(self):
+        """Sırayı planlar; sezgisel sıra daha kısa değilse orijinal sıra korunur."""
+        started = time.perf_counter()
+        original = [(route, False) for route in range(len(self.endpoints))]
+        original_mm = self.travel(original)
+        if len(original) < 2:
+            return RouteOrder(original, original_mm, original_mm, time.perf_counter() - started)
+
+        order = self.nearest_neighbor()
+        if self.allow_reverse:
+            order = self.two_opt(order)
+        else:
+            order = self.or_opt(order)
+
+        optimized_mm = self.travel(order)
+        if optimized_mm >= original_mm:
+            order, optimized_mm = original, original_mm
+        return RouteOrder(order, original_mm, optimized_mm, time.perf_counter() - started)
+
+    def nearest_neighbor(self):
+        """Her adımda bulunulan konuma en yakın girişi olan rotayı seçer."""
+        points = []
+        owners = []  # Nokta anahtarı -> (rota, ters)
+        for route, (start, end) in enumerate(self.endpoints):
+            points.append(start)
+            owners.append((route, False))
+            if self.allow_reverse:
+                points.append(end)
+                owners.append((route, True))
+        tree = SpatialTree(points)
+        keys_per_route = 2 if self.allow_reverse else 1
+
+        order = []
+        position = self.start if self.start is not None else points[0]
+        for _ in range(len(self.endpoints)):
+            item = owners[tree.nearest(position)[0]]
+            # Rotanın tüm uçları aramadan çıkarılır
+            for offset in range(keys_per_route):
+                tree.remove(item[0] * keys_per_route + offset)
+            order.append(item)
+            position = self.exit(item)
+        return order
+
+    def _neighbors(self, sides=(0, 1)):
+        """
+        Her rota ucu için uçları en yakın olan aday rotaları döndürür: {(rota, uç): [rota, ...]}.
+        Yalnızca sides içindeki uçlar (0 başlangıç, 1 bitiş) için aranır.
+        """
+        points = [point for start, end in self.endpoints for point in (start, end)]
+        tree = SpatialTree(points)
+        neighbors = {}
+        for key, point in enumerate(points):
+            if key % 2 not in sides:
+                continue
+            routes = []
+            for other in tree.nearest(point, 2 * self.neighbor_count + 2):
+                if other // 2 != key // 2 and other // 2 not in routes:
+                    routes.append(other // 2)
+            neighbors[key // 2, key % 2] = routes[:self.neighbor_count]
+        return neighbors
+
+    def two_opt(self, order):
+        """
+        order[i+1..j] bölümünü ters çevirerek geçişleri kısaltır.
+        Bölüm içindeki geçişler aynı kalır; yalnızca bölümün iki ucundaki geçiş değişir,
+        bu yüzden her hamlenin kazancı sabit sürede hesaplanır. Sıra, bölümler dilim
+        işlemleriyle ters çevrilebilsin diye rota listesi ve yön bayrakları olarak tutulur.
+        """
+        routes = [route for route, _ in order]
+        flags = bytearray(reverse for _, reverse in order)
+        neighbors = self._neighbors()
+        position = {route: index for index, route in enumerate(routes)}
+        # Yalnızca komşu geçişi değişen rotalar yeniden denenir ("don't look bits")
+        active = deque(routes)
+        queued = set(active)
+        moves = 0
+        limit = self.moves_per_route * len(routes)
+        work = 0
+        work_limit = self.work_per_route * len(routes)
+        while active and moves < limit:
+            route = active.popleft()
+            queued.discard(route)
+            i = position[route]
+            if i == len(routes) - 1:
+                continue
+            # Yeni geçiş routes[i] çıkışından routes[j] çıkışına olur: çıkışı yakın olan adaylar denenir
+            for candidate in neighbors[route, 1 - flags[i]]:
+                j = position[candidate]
+                low, high = min(i, j), max(i, j)
+                span = high - low
+                if span < 1 or span > SHORT_MOVE_ROUTES and work + span > work_limit:
+                    continue
+                if self._two_opt_gain(routes, flags, low, high) <= 1e-9:
+                    continue
+                routes[low + 1:high + 1] = routes[low + 1:high + 1][::-1]
+                flags[low + 1:high + 1] = flags[low + 1:high + 1][::-1].translate(_FLIP_FLAGS)
+                position.update(zip(routes[low + 1:high + 1], range(low + 1, high + 1)))
+                moves += 1
+                work += span
+                for k in (low, low + 1, high, high + 1):
+                    if k < len(routes) and routes[k] not in queued:
+                        active.append(routes[k])
+                        queued.add(routes[k])
+                break
+        return list(zip(routes, map(bool, flags)))
+
+    def _two_opt_gain(self, routes, flags, i, j):
+        """routes[i+1..j] bölümünü ters çevirmenin kısalttığı mesafe."""
+        first = (routes[i + 1], flags[i + 1])
+        last = (routes[j], flags[j])
+        before = self.exit((routes[i], flags[i]))
+        after = self.entry((routes[j + 1], flags[j + 1])) if j + 1 < len(routes) else self.end
+        # Ters çevrilen rotanın girişi eski çıkışı, çıkışı eski girişidir
+        old = _distance(before, self.entry(first))
+        new = _distance(before, self.exit(last))
+        if after is not None:
+            old += _distance(self.exit(last), after)
+            new += _distance(self.entry(first), after)
+        return old - new
+
+    def or_opt(self, order):
+        """
+        Rota yönünü değiştirmeden, bir rotayı çıkışı kendi girişine yakın bir rotanın arkasına taşır.
+        Sıra çift yönlü bağlı liste olarak tutulur; her taşıma ve kazancı sabit sürededir.
+        """
+        items = {route: (route, reverse) for route, reverse in order}
+        following = {}
+        preceding = {}
+        previous = _HEAD
+        for route, _ in order:
+            following[previous] = route
+            preceding[route] = previous
+            previous = route
+        following[previous] = _TAIL
+        preceding[_TAIL] = previous
+
+        neighbors = self._neighbors(sides=(0,))
+        active = deque(route for route, _ in order)
+        queued = set(active)
+        moves = 0
+        limit = self.moves_per_route * len(order)
+        while active and moves < limit:
+            route = active.popleft()
+            queued.discard(route)
+            for target in neighbors[route, 0]:
+                if preceding[route] == target or self._move_gain(items, preceding, following, route, target) <= 1e-9:
+                    continue
+                # Taşımadan sonra geçişi değişen rotalar: eski ve yeni komşular
+                before, after = preceding[route], following[route]
+                touched = [other for other in (before, after, target, following[target]) if other >= 0]
+                following[before] = after
+                preceding[after] = before
+                after = following[target]
+                following[target] = route
+                preceding[route] = target
+                following[route] = after
+                preceding[after] = route
+                moves += 1
+                for other in touched + [route]:
+                    if other not in queued:
+                        active.append(other)
+                        queued.add(other)
+                break
+
+        result = []
+        route = following[_HEAD]
+        while route != _TAIL:
+            result.append(items[route])
+            route = following[route]
+        return result
+
+    def _link(self, items, a, b):
+        """a rotasının çıkışından b rotasının girişine geçiş; _HEAD başlangıç, _TAIL bitiş konumudur."""
+        source = self.start if a == _HEAD else self.exit(items[a])
+        target = self.end if b == _TAIL else self.entry(items[b])
+        if source is None or target is None:
+            return 0.0
+        return _distance(source, target)
+
+    def _move_gain(self, items, preceding, following, route, target):
+        """route rotasını target rotasının arkasına taşımanın kısalttığı mesafe."""
+        before, after = preceding[route], following[route]
+        removed = self._link(items, before, route) + self._link(items, route, after) - self._link(items, before, after)
+        # Taşınan rota çıkarıldıktan sonra target'ın ardından gelen rota
+        after = following[target]
+        if after == route:
+            after = following[route]
+        return removed - (self._link(items, target, route) + self._link(items, route, after) - self._link(items, target, after))
+
+def plan_route_order(endpoints, start=None, end=None, allow_reverse=False):
+    """Rota uç noktalarından boş geçişi kısaltan sırayı planlar ve RouteOrder döndürür."""
+    return RouteOrderPlanner(endpoints, start, end, allow_reverse).plan()
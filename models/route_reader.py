@@ -0,0 +1,61 @@
+import mmap
+import re
+from array import array
+from models.gcode_tokenizer import parse_xy
+
+# Bayt düzeyinde satır deseni. Yalın "X.. Y.. [Z..]" satırları doğrudan gruplardan okunur;
+# X harfi içeren diğer satırlar (işaretli sayılar, F/G kelimeleri, yorumlar) ortak
+# G-Code ayrıştırıcısına gönderilir. X içermeyen satırlar hiç nesneye dönüştürülmez.
+COORDINATE_LINE_PATTERN = re.compile(
+    rb'^[ \t\f\v]*X(\d+\.?\d*)[ \t\f\v]+Y(\d+\.?\d*)(?:[ \t\f\v]+Z\d+\.?\d*)?[ \t\f\v\r]*$'
+    rb'|^([^\n]*[Xx][^\n]*)$',
+    re.MULTILINE
+)
+
+# Eşlenemeyen dosyalar için okuma parça boyutu
+READ_CHUNK_SIZE = 1024 * 1024
+
+def _collect(buffer, xs, ys):
+    """Tampondaki koordinat satırlarını satır listesi oluşturmadan dizilere ekle"""
+    for match in COORDINATE_LINE_PATTERN.finditer(buffer):
+        x_value, y_value, other_line = match.groups()
+        if other_line is None:
+            xs.append(float(x_value))
+            ys.append(float(y_value))
+            continue
+        point = parse_xy(other_line.decode('latin-1'))
+        if point is not None:
+            xs.append(point[0])
+            ys.append(point[1])
+
+def _read_chunked(file, xs, ys):
+    """Dosyayı büyük parçalar halinde oku - satırlar parça sınırında bölünmez"""
+    remainder = b''
+    while True:
+        chunk = file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer = remainder + chunk
+        cut = buffer.rfind(b'\n') + 1
+        _collect(memoryview(buffer)[:cut], xs, ys)
+        remainder = buffer[cut:]
+    if remainder:
+        _collect(remainder, xs, ys)
+
+def read_route_coordinates(route_file):
+    """
+    Rota dosyasındaki koordinatları (x, y) dizileri olarak okur.
+    Dosya belleğe eşlenir ve koordinatlar doğrudan bayt tamponundan taranır;
+    eşlenemeyen dosyalarda (boş dosya, özel dosyalar) parça parça okunur.
+    """
+    xs = array('d')
+    ys = array('d')
+    with open(route_file, 'rb') as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            _read_chunked(file, xs, ys)
+        else:
+            with mapped:
+                _collect(mapped, xs, ys)
+    return xs, ys
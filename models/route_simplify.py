@@ -0,0 +1,166 @@
+import math
+from array import array
+from itertools import compress, islice
+from operator import ne, or_
+from models.route import Route
+
+# Her atılan nokta çıktıdan iki satır çıkarır: dikiş satırı ve ardından gelen iğne kaldırma
+LINES_PER_POINT = 2
+
+def remove_short_stitches(xs, ys, min_length=0.0):
+    """
+    Bir önceki tutulan noktaya min_length'ten yakın noktaları (ve her durumda üst üste
+    binen noktaları) atar. İlk ve son nokta her zaman korunur.
+    """
+    count = len(xs)
+    if count < 2:
+        return xs, ys
+    if min_length <= 0:
+        # Yalnızca ardışık yinelenen noktalar: karşılaştırmalar C düzeyinde yapılır
+        moved = map(or_, map(ne, islice(xs, 1, None), xs), map(ne, islice(ys, 1, None), ys))
+        moved = list(moved)
+        if all(moved):
+            return xs, ys
+        out_x = array('d', [xs[0]])
+        out_y = array('d', [ys[0]])
+        out_x.extend(compress(islice(xs, 1, None), moved))
+        out_y.extend(compress(islice(ys, 1, None), moved))
+        return out_x, out_y
+
+    limit = min_length * min_length
+    out_x = array('d', [xs[0]])
+    out_y = array('d', [ys[0]])
+    append_x = out_x.append
+    append_y = out_y.append
+    last_x = xs[0]
+    last_y = ys[0]
+    for x, y in zip(xs, ys):
+        dx = x - last_x
+        dy = y - last_y
+        distance = dx * dx + dy * dy
+        if distance < limit or not distance:
+            continue
+        append_x(x)
+        append_y(y)
+        last_x = x
+        last_y = y
+
+    # Son nokta atıldıysa rota yine de aynı yerde bitmeli: çok yakın olan son tutulan noktanın yerini alır
+    end_x = xs[-1]
+    end_y = ys[-1]
+    if out_x[-1] != end_x or out_y[-1] != end_y:
+        if len(out_x) > 1:
+            out_x[-1] = end_x
+            out_y[-1] = end_y
+        else:
+            append_x(end_x)
+            append_y(end_y)
+    return out_x, out_y
+
+def simplify_polyline(xs, ys, tolerance):
+    """
+    Çıktı çizgisine uzaklığı tolerance'ı aşmayan ara noktaları (yinelenen noktalar dahil) tek geçişte atar.
+    Douglas-Peucker ile aynı hata sınırını sağlar ama doğrusal sürede çalışır: sabit
+    noktadan bakıldığında her ara noktanın tolerans konisinin kesişimi tutulur; sonraki
+    nokta bu açı aralığının dışına düşünce son uygun nokta yeni sabit nokta olur.
+    """
+    if len(xs) < 3 or tolerance <= 0:
+        return xs, ys
+    atan2 = math.atan2
+    asin = math.asin
+    hypot = math.hypot
+    pi = math.pi
+    tau = math.tau
+
+    out_x = array('d', [xs[0]])
+    out_y = array('d', [ys[0]])
+    append_x = out_x.append
+    append_y = out_y.append
+    anchor_x = last_x = xs[0]
+    anchor_y = last_y = ys[0]
+    base = 0.0  # Açılar bu yöne göre tutulur (açı sarmasını önlemek için)
+    low = high = 0.0  # İzin verilen yön aralığı (constrained False ise kısıt yok)
+    constrained = False
+    reach = 0.0  # Kısıt koyan ara noktaların sabit noktaya en büyük uzaklığı
+    for x, y in zip(islice(xs, 1, None), islice(ys, 1, None)):
+        dx = x - anchor_x
+        dy = y - anchor_y
+        distance = hypot(dx, dy)
+        if distance >= reach:
+            if distance <= tolerance:
+                # Sabit noktaya tolerans içinde: hiçbir doğrultuyu kısıtlamaz
+                last_x = x
+                last_y = y
+                continue
+            if not constrained:
+                base = atan2(dy, dx)
+                high = asin(tolerance / distance)
+                low = -high
+                constrained = True
+                reach = distance
+                last_x = x
+                last_y = y
+                continue
+            relative = atan2(dy, dx) - base
+            if relative > pi:
+                relative -= tau
+            elif relative < -pi:
+                relative += tau
+            if low <= relative <= high:
+                half = asin(tolerance / distance)
+                if relative - half > low:
+                    low = relative - half
+                if relative + half < high:
+                    high = relative + half
+                reach = distance
+                last_x = x
+                last_y = y
+                continue
+
+        # Nokta, son uygun noktaya giden doğrultuyla birlikte tutulamaz: son uygun nokta yeni sabit nokta olur
+        if last_x != anchor_x or last_y != anchor_y:
+            append_x(last_x)
+            append_y(last_y)
+        anchor_x = last_x
+        anchor_y = last_y
+        dx = x - anchor_x
+        dy = y - anchor_y
+        distance = hypot(dx, dy)
+        if distance <= tolerance:
+            constrained = False
+            reach = 0.0
+        else:
+            base = atan2(dy, dx)
+            high = asin(tolerance / distance)
+            low = -high
+            constrained = True
+            reach = distance
+        last_x = x
+        last_y = y
+
+    if last_x != anchor_x or last_y != anchor_y:
+        append_x(last_x)
+        append_y(last_y)
+    return out_x, out_y
+
+def simplify_route(route, tolerance=0.0, min_stitch_length=0.0):
+    """
+    Rotanın yinelenen, min_stitch_length'ten kısa dikiş oluşturan ve tolerance içinde
+    doğrusal kalan noktalarını atar. Yeni Route ve atılan nokta sayısını döndürür.
+    Rotanın başlangıç ve bitiş noktaları değişmez.
+    """
+    if len(route) < 2:
+        return route, 0
+    xs, ys = route.xs, route.ys
+    if min_stitch_length > 0 or tolerance <= 0:
+        # Tolerans geçişi yinelenen noktaları zaten atar; ayrı geçiş yalnızca gerektiğinde yapılır
+        xs, ys = remove_short_stitches(xs, ys, min_stitch_length)
+    xs, ys = simplify_polyline(xs, ys, tolerance)
+    if len(xs) < 2:
+        # Tüm noktaları aynı olan rota: başlangıç ve bitiş noktası korunur
+        xs = array('d', [route.xs[0], route.xs[-1]])
+        ys = array('d', [route.ys[0], route.ys[-1]])
+    removed = len(route) - len(xs)
+    if not removed:
+        return route, 0
+    return Route(xs, ys, route.number, route.source_file, route.x_offset, route.y_offset), removed
@@ -0,0 +1,61 @@
+import os
+
+def file_fingerprint(route_file):
+    """Dosya içeriği değiştiğinde değişen ucuz bir parmak izi döndürür (yol, mtime, boyut)."""
+    stat = os.stat(route_file)
+    return os.path.abspath(route_file), stat.st_mtime_ns, stat.st_size
+
+class RouteStore:
+    """
+    Ayrıştırılmış rotaları dosya başına bellekte tutan depo.
+    Yükleme ve G-Code oluşturma aynı depoyu kullanır; bir kayıt yalnızca
+    ilgili dosya değiştiğinde geçersiz olur.
+    """
+    def __init__(self):
+        self._routes = {}  # Dosya yolu -> (dosya parmak izi, Route)
+
+    def __len__(self):
+        return len(self._routes)
+
+    def __contains__(self, route_file):
+        return route_file in self._routes
+
+    def get(self, route_file, fingerprint=None):
+        """Dosya değişmediyse saklanan rotayı döndürür, aksi halde None döndürür."""
+        entry = self._routes.get(route_file)
+        if entry is None:
+            return None
+        if fingerprint is None:
+            fingerprint = file_fingerprint(route_file)
+        if entry[0] != fingerprint:
+            # Dosya değişmiş - kaydı geçersiz kıl
+            del self._routes[route_file]
+            return None
+        return entry[1]
+
+    def put(self, route, fingerprint):
+        """Ayrıştırılmış rotayı kaynak dosyasının parmak iziyle saklar."""
+        self._routes[route.source_file] = (fingerprint, route)
+
+    def invalidate(self, route_file):
+        """Belirtilen dosyanın kaydını siler."""
+        self._routes.pop(route_file, None)
+
+    def retain(self, route_files):
+        """Listede olmayan dosyaların kayıtlarını siler."""
+        keep = set(route_files)
+        for route_file in [f for f in self._routes if f not in keep]:
+            del self._routes[route_file]
+
+    def routes(self):
+        """Saklanan tüm rotaları döndürür."""
+        return [route for _, route in self._routes.values()]
+
+    @property
+    def nbytes(self):
+        """Saklanan koordinatların bellekte kapladığı toplam bayt sayısını döndürür."""
+        return sum(route.nbytes for _, route in self._routes.values())
+
+    def clear(self):
+        """Depoyu temizler."""
+        self._routes.clear()
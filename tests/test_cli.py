@@ -0,0 +1,49 @@
+"""
+Komut satırı arayüzünün (cli.py) çalıştırma günlüğü davranışını doğrulayan testler.
+
+    python -m unittest tests.test_cli
+"""
+import json
+import os
+import tempfile
+import unittest
+
+import cli
+from benchmarks.route_generators import write_routes_folder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class RunLogTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory(prefix="gcode_cli_test_")
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+        # Çalıştırma günlüğü çalışma klasörüne göredir (logs/runs.jsonl)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.folder)
+        self.jobs = []
+        for index in range(3):
+            routes = os.path.join(self.folder, f"routes_{index}")
+            write_routes_folder(routes, 2, 200, seed=index)
+            self.jobs.append((routes, os.path.join(ROOT, "parameters.json"),
+                              os.path.join(self.folder, f"out_{index}.nc")))
+
+    def read_log(self):
+        with open(os.path.join(self.folder, "logs", "runs.jsonl"), encoding='utf-8') as file:
+            return [json.loads(line) for line in file]
+
+    def test_parallel_jobs_are_logged_by_the_parent(self):
+        """Birden fazla süreçte her iş tek kayıt yazar; kayıtlar iş sırasındadır ve rapora sızmaz."""
+        reports = cli.run_jobs(self.jobs, workers=2)
+        self.assertEqual([report['error'] for report in reports], [None] * len(self.jobs))
+        self.assertTrue(all('run_record' not in report for report in reports))
+        records = self.read_log()
+        self.assertEqual([record['routes_folder'] for record in records], [job[0] for job in self.jobs])
+        self.assertTrue(all(record['status'] == 'ok' and record['stages'] for record in records))
+
+    def test_serial_jobs_are_logged(self):
+        cli.run_jobs(self.jobs[:1], workers=1)
+        self.assertEqual([record['routes_folder'] for record in self.read_log()], [self.jobs[0][0]])
+
+if __name__ == "__main__":
+    unittest.main()
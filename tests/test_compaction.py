@@ -0,0 +1,154 @@
+"""
+Sıkıştırılmış G-Code çıktısının sıkıştırılmamış çıktıyla aynı makine hareketini ürettiğini
+doğrulayan testler. İki çıktı da basit bir modal makine modeliyle satır satır yürütülür.
+
+    python -m unittest tests.test_compaction
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from benchmarks.scaling import prepare_case
+from models.gcode_compactor import GCodeCompactor
+from models.gcode_model import GCodeModel
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modal durumun sınır durumlarını içeren elle yazılmış program: tekrarlanan konum ve F,
+# M kodundan ve beklemeden sonra aynı konum, artımlı blok, G0/G1 geçişi ve yorum
+EDGE_CASE_PROGRAM = """G01 G90 F10000
+X1 Y2 Z3
+Z30
+X1 Y2 Z3
+F10000
+M114
+X1 Y2 Z3
+G04 P200
+X1 Y2 Z3
+Z30
+G91
+Z-5
+Z-5
+X2
+G90
+Z0
+X3 Y2
+G0 X10 Y10
+G1 X11 Y11
+G1 X11 Y11 F10000
+F2000
+X12 Y12
+% Yorum
+X12 Y12 Z3
+M112 F3000
+X12 Y12 Z3"""
+
+def replay(content):
+    """
+    G-Code metnini modal durumu (konum, F, G0/G1, G90/G91) izleyerek yürütür ve makine
+    olaylarını listeler: konumu değiştiren her hareket (hedef, F, kip), bekleme ve diğer
+    komutlar. Hareket etmeyen satırlar olay üretmez. M kodlarından sonra konum bilinmiyor
+    sayılır; ardından gelen ilk konum kelimesi hareket olarak kaydedilir.
+    """
+    events = []
+    position = {}
+    feed = None
+    mode = None
+    absolute = True
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] in '%;(':
+            events.append(('comment', line))
+            continue
+        words = [(word[0].upper(), word[1:]) for word in line.split()]
+        letters = {letter for letter, _ in words}
+        g_codes = [float(value) for letter, value in words if letter == 'G']
+        if letters == {'G', 'P'} and g_codes == [4.0]:
+            events.append(('dwell', float(dict(words)['P'])))
+            continue
+        if not letters <= set('GXYZF'):
+            # M kodu vb.: olduğu gibi kaydedilir, eksenleri hareket ettirmiş olabilir
+            events.append(('command', line))
+            position.clear()
+            feed = next((float(value) for letter, value in words if letter == 'F'), feed)
+            continue
+
+        for code in g_codes:
+            if code in (0.0, 1.0):
+                mode = code
+            elif code in (90.0, 91.0):
+                absolute = code == 90.0
+        moved = {}
+        for letter, value in words:
+            if letter == 'F':
+                feed = float(value)
+            elif letter in 'XYZ':
+                value = float(value)
+                if absolute:
+                    if position.get(letter) != value:
+                        moved[letter] = value
+                    position[letter] = value
+                elif value:
+                    moved[letter] = ('delta', value)
+                    if letter in position:
+                        position[letter] += value
+        if moved:
+            events.append(('move', tuple(sorted(moved.items())), feed, mode, absolute))
+    return events
+
+class CompactionMotionTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory(prefix="gcode_compaction_test_")
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+
+    def generate(self, parameters_file, routes_folder, **overrides):
+        model = GCodeModel(parameters_file=parameters_file, routes_folder=routes_folder, output_folder=self.folder)
+        params = GCodeModel.parameters_from_file(model.load_default_parameters())
+        params.update(overrides)
+        model.apply_parameters(params)
+        return model.process_gcode()
+
+    def assert_same_motion(self, parameters_file, routes_folder, **overrides):
+        plain = self.generate(parameters_file, routes_folder, compact_output=False, **overrides)
+        compacted = self.generate(parameters_file, routes_folder, compact_output=True, **overrides)
+        self.assertLess(len(compacted), len(plain))
+        plain_events = replay(plain)
+        self.assertTrue(any(event[0] == 'move' for event in plain_events))
+        self.assertEqual(replay(compacted), plain_events)
+
+    def test_default_parameters_and_routes(self):
+        """Depodaki parameters.json (G91 artımlı ip kesme bloğu dahil) ve örnek rotalar."""
+        parameters_file = os.path.join(self.folder, "parameters.json")
+        shutil.copy(os.path.join(ROOT, "parameters.json"), parameters_file)
+        routes_folder = os.path.join(ROOT, "routes")
+        for overrides in [{}, {'feed_planning': True}, {'punteriz_enabled': True, 'bobbin_enabled': True}]:
+            with self.subTest(**overrides):
+                self.assert_same_motion(parameters_file, routes_folder, **overrides)
+
+    def test_generated_routes(self):
+        """Punteriz ve bobin açık, kalibre edilmiş sentetik rotalar."""
+        prepare_case(self.folder, 4, 1500)
+        parameters_file = os.path.join(self.folder, "parameters.json")
+        routes_folder = os.path.join(self.folder, "routes")
+        for overrides in [{}, {'feed_planning': True, 'simplify_enabled': True}]:
+            with self.subTest(**overrides):
+                self.assert_same_motion(parameters_file, routes_folder, **overrides)
+
+    def test_edge_case_program(self):
+        compactor = GCodeCompactor()
+        compacted = '\n'.join(compactor.compact(EDGE_CASE_PROGRAM.split('\n')))
+        self.assertGreater(compactor.lines_removed, 0)
+        self.assertEqual(replay(compacted), replay(EDGE_CASE_PROGRAM))
+
+    def test_replay_detects_a_lost_move(self):
+        """Model, sıkıştırıcının atmaması gereken bir kelimenin kaybını fark eder."""
+        program = "G01 G90 F10000\nX1 Y2 Z3\nZ30\nM114\nX1 Y2 Z3\nZ30"
+        self.assertNotEqual(replay(program.replace("M114\nX1 Y2 Z3", "M114\nZ3")), replay(program))
+        self.assertEqual(replay(program.replace("X1 Y2 Z3\nZ30\nM114", "X1 Y2 Z3\nZ30\nZ30\nM114")), replay(program))
+
+if __name__ == "__main__":
+    unittest.main()
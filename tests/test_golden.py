@@ -0,0 +1,45 @@
+"""
+Uçtan uca çıktının benchmarks/golden/scaling.json özetleriyle bayt bayt aynı kaldığını ve
+paralel rota işlemenin seri işlemeyle aynı çıktıyı ürettiğini doğrulayan testler.
+
+    python -m unittest tests.test_golden
+"""
+import os
+import tempfile
+import unittest
+
+from benchmarks.scaling import case_name, file_digest, load_golden, prepare_case, run_cycle
+
+# Testlerde çalıştırılan boyutlar (rota sayısı, rota başına nokta sayısı)
+CASES = [(10, 1000), (10, 10000)]
+
+class GoldenOutputTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.golden = load_golden()
+
+    def generate(self, route_count, points_per_route, **overrides):
+        """Boyutu Yükle -> Oluştur -> Kaydet döngüsüyle işler; çıktının (bayt, özet) ikilisini döndürür."""
+        with tempfile.TemporaryDirectory(prefix="gcode_golden_test_") as work_dir:
+            prepare_case(work_dir, route_count, points_per_route, **overrides)
+            output_path = os.path.join(work_dir, "output.nc")
+            run_cycle(work_dir, output_path)
+            return os.path.getsize(output_path), file_digest(output_path)
+
+    def check_golden(self, parallel):
+        for route_count, points_per_route in CASES:
+            name = case_name(route_count, points_per_route)
+            with self.subTest(case=name, parallel=parallel):
+                size, digest = self.generate(route_count, points_per_route, parallel_processing=parallel)
+                expected = self.golden[name]
+                self.assertEqual((size, digest), (expected['bytes'], expected['sha256']))
+
+    def test_serial_output_matches_golden(self):
+        self.check_golden(parallel=False)
+
+    def test_parallel_output_matches_golden(self):
+        """Paralel işleme seri işlemeyle (ve altın özetle) bayt bayt aynı çıktıyı üretir."""
+        self.check_golden(parallel=True)
+
+if __name__ == "__main__":
+    unittest.main()
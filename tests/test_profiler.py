@@ -0,0 +1,66 @@
+"""
+Profil dosyalarının adlandırılmasını ve saklama sınırını doğrulayan testler.
+
+    python -m unittest tests.test_profiler
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from utils.profiler import RunProfiler
+
+def profile_run(folder, retention=3):
+    """Kısa bir işlemi profiller, kaydeder ve .pstats yolunu döndürür."""
+    with RunProfiler("generate", folder, retention) as profiler:
+        sum(range(1000))
+    return profiler.save()
+
+class ProfileRetentionTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory(prefix="gcode_profile_test_")
+        self.addCleanup(folder.cleanup)
+        self.folder = folder.name
+
+    def stats_files(self):
+        return sorted(name for name in os.listdir(self.folder) if name.endswith(".pstats"))
+
+    def test_profiles_in_the_same_second_are_kept_apart(self):
+        """Aynı saniyede alınan profiller birbirinin üzerine yazılmaz; en yeni retention adedi kalır."""
+        paths = [profile_run(self.folder) for _ in range(5)]
+        self.assertEqual(len(set(paths)), 5)
+        self.assertEqual(self.stats_files(), sorted(os.path.basename(path) for path in paths[-3:]))
+        for path in paths[-3:]:
+            self.assertTrue(os.path.exists(os.path.splitext(path)[0] + ".folded"))
+
+    def test_same_timestamp_gets_a_counter(self):
+        """Zaman damgası bile aynıysa ada sayaç eklenir ve sayaç sıralamada dikkate alınır."""
+        fixed = datetime(2026, 10, 18, 9, 30, 15, 123456)
+        with mock.patch('utils.profiler.datetime') as clock:
+            clock.now.return_value = fixed
+            paths = [profile_run(self.folder) for _ in range(4)]
+        self.assertEqual([os.path.basename(path) for path in paths], [
+            "generate_26_10_18_09_30_15_123456.pstats",
+            "generate_26_10_18_09_30_15_123456_1.pstats",
+            "generate_26_10_18_09_30_15_123456_2.pstats",
+            "generate_26_10_18_09_30_15_123456_3.pstats",
+        ])
+        self.assertEqual(self.stats_files(), sorted(os.path.basename(path) for path in paths[1:]))
+
+    def test_retention_follows_the_name_across_operations(self):
+        """Saklama sırası işlem adına ya da dosya değişiklik zamanına değil, addaki zaman damgasına göredir."""
+        newest = profile_run(self.folder)
+        # Daha yeni damgalı dosyanın değişiklik zamanı eskiye çekilse de korunur
+        os.utime(newest, (0, 0))
+        for _ in range(3):
+            with RunProfiler("load", self.folder, retention=3) as profiler:
+                pass
+            with mock.patch('utils.profiler.datetime') as clock:
+                clock.now.return_value = datetime(2000, 1, 1)
+                profiler.save()
+        self.assertIn(os.path.basename(newest), self.stats_files())
+        self.assertEqual(len(self.stats_files()), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Kalibrasyon değişikliğinin rotaları yeniden ayrıştırmadan, tam yeniden oluşturmayla aynı
+çıktıyı verdiğini doğrulayan testler.
+
+    python -m unittest tests.test_recalibration
+"""
+import os
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks.scaling import prepare_case
+from models.gcode_model import GCodeModel
+from models.multi_route_processor import MultiRouteProcessor
+
+# Çıktıdaki koordinat kelimeleri
+COORDINATE = re.compile(r'X(-?[\d.]+) Y(-?[\d.]+)')
+
+# Tam yeniden oluşturmaya göre izin verilen en büyük koordinat farkı (mm)
+TOLERANCE_MM = 0.01
+
+class RecalibrationTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory(prefix="gcode_recalibration_test_")
+        self.addCleanup(folder.cleanup)
+        self.work_dir = folder.name
+        prepare_case(self.work_dir, 5, 2000)
+
+    def make_model(self, calibration):
+        model = GCodeModel(parameters_file=os.path.join(self.work_dir, "parameters.json"),
+                           routes_folder=os.path.join(self.work_dir, "routes"),
+                           output_folder=self.work_dir)
+        model.apply_parameters(self.parameters(model, calibration))
+        return model
+
+    @staticmethod
+    def parameters(model, calibration):
+        params = GCodeModel.parameters_from_file(model.load_default_parameters())
+        params['calibration_x'], params['calibration_y'] = calibration
+        return params
+
+    def assert_same_motion(self, content, expected):
+        """İki çıktı satır satır aynı yapıdadır ve koordinatları TOLERANCE_MM içinde eşittir."""
+        self.assertEqual(COORDINATE.sub('XY', content), COORDINATE.sub('XY', expected))
+        pairs = zip(COORDINATE.findall(content), COORDINATE.findall(expected))
+        error = max((abs(float(a) - float(b)) for point, other in pairs for a, b in zip(point, other)), default=0.0)
+        self.assertLessEqual(error, TOLERANCE_MM)
+
+    def test_recalibration_matches_a_full_rebuild(self):
+        model = self.make_model(("21.57", "388.60"))
+        model.process_gcode()
+        for calibration in [("-3.333", "7.005"), ("0", "0"), ("21.57001", "388.6")]:
+            with self.subTest(calibration=calibration):
+                model.apply_parameters(self.parameters(model, calibration))
+                with mock.patch.object(MultiRouteProcessor, 'read_route_file',
+                                       autospec=True, side_effect=MultiRouteProcessor.read_route_file) as read:
+                    content = model.process_gcode()
+                # Depodaki rotalar yalnızca kaydırılır, dosyalar yeniden okunmaz
+                self.assertEqual(read.call_count, 0)
+                self.assert_same_motion(content, self.make_model(calibration).process_gcode())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,6 +42,10 @@ class LanguageManager:
             'tr': 'Parametreleri Sıfırla',
             'en': 'Reset Parameters'
         },
+        'menu_profile_next_run': {
+            'tr': 'Sonraki İşlemi Profille',
+            'en': 'Profile Next Run'
+        },
         'menu_about': {
             'tr': 'Hakkında',
             'en': 'About'
@@ -94,6 +98,10 @@ class LanguageManager:
             'tr': 'Makine Kalibrasyon Değerleri',
             'en': 'Machine Calibration Values'
         },
+        'group_optimization': {
+            'tr': 'Çıktı Optimizasyonu',
+            'en': 'Output Optimization'
+        },
         'group_gcode_content': {
             'tr': 'G-Code İçeriği',
             'en': 'G-Code Content'
@@ -104,6 +112,42 @@ class LanguageManager:
             'tr': 'Aktif',
             'en': 'Active'
         },
+        'label_compact_output': {
+            'tr': 'G-Code\'u sıkıştır (gereksiz kelime ve satırları at)',
+            'en': 'Compact G-Code (drop redundant words and lines)'
+        },
+        'label_merge_needle_up': {
+            'tr': 'İğne kaldırmayı sonraki XY satırına birleştir',
+            'en': 'Merge needle-up into the next XY line'
+        },
+        'label_simplify_points': {
+            'tr': 'Dikiş noktalarını sadeleştir (yinelenen ve doğrusal noktaları at)',
+            'en': 'Simplify stitch points (drop duplicate and collinear points)'
+        },
+        'label_simplify_tolerance': {
+            'tr': 'Tolerans (mm):',
+            'en': 'Tolerance (mm):'
+        },
+        'label_min_stitch_length': {
+            'tr': 'En Kısa Dikiş (mm):',
+            'en': 'Minimum Stitch (mm):'
+        },
+        'label_feed_planning': {
+            'tr': 'Hızı dikiş uzunluğu ve köşe açısına göre planla',
+            'en': 'Plan feed from stitch length and corner angle'
+        },
+        'label_optimize_route_order': {
+            'tr': 'Rota sırasını boş geçişi kısaltacak şekilde düzenle',
+            'en': 'Reorder routes to shorten travel between them'
+        },
+        'label_allow_route_reversal': {
+            'tr': 'Rotaların sondan başa dikilmesine izin ver',
+            'en': 'Allow routes to be stitched in reverse'
+        },
+        'label_parallel_processing': {
+            'tr': 'Rotaları paralel işle (birden fazla işlemci çekirdeği)',
+            'en': 'Process routes in parallel (multiple CPU cores)'
+        },
         'label_stitch_start': {
             'tr': 'Dikiş Başı:',
             'en': 'Stitch Start:'
@@ -156,6 +200,38 @@ class LanguageManager:
             'tr': 'Düzenleniyor',
             'en': 'Editing'
         },
+        'label_loading_routes': {
+            'tr': 'Rotalar yükleniyor: {}/{}',
+            'en': 'Loading routes: {}/{}'
+        },
+        'label_generating_routes': {
+            'tr': 'G-Code oluşturuluyor: {}/{}',
+            'en': 'Generating G-Code: {}/{}'
+        },
+        'label_cancelling': {
+            'tr': 'İptal ediliyor...',
+            'en': 'Cancelling...'
+        },
+        'label_profile_saved': {
+            'tr': 'Profil kaydedildi: {}',
+            'en': 'Profile saved: {}'
+        },
+        'label_last_run': {
+            'tr': 'Son işlem:',
+            'en': 'Last run:'
+        },
+        'label_cycle_time': {
+            'tr': 'Tahmini süre:',
+            'en': 'Estimated time:'
+        },
+        'tooltip_cycle_time': {
+            'tr': 'Hareket: {}, bekleme: {}, başlangıç ve bitiş: {}',
+            'en': 'Motion: {}, dwell: {}, start and end: {}'
+        },
+        'tooltip_longest_routes': {
+            'tr': 'En uzun rotalar:',
+            'en': 'Longest routes:'
+        },
         
         # Buton çevirileri
         'button_generate': {
@@ -174,6 +250,10 @@ class LanguageManager:
             'tr': 'Dosya Kaydet',
             'en': 'Save File'
         },
+        'button_cancel': {
+            'tr': 'İptal',
+            'en': 'Cancel'
+        },
         
         # Mesaj çevirileri
         'msg_language_changed': {
@@ -221,6 +301,26 @@ class LanguageManager:
             'tr': 'Parametreler varsayılan değerlere sıfırlandı.',
             'en': 'Parameters reset to default values.'
         },
+        'msg_compaction_saved': {
+            'tr': 'Sıkıştırma: {} satır ve {} bayt (%{:.1f}) kazanıldı.',
+            'en': 'Compaction saved {} lines and {} bytes ({:.1f}%).'
+        },
+        'msg_simplification_saved': {
+            'tr': 'Sadeleştirme: {} nokta ve {} satır atıldı.',
+            'en': 'Simplification removed {} points and {} lines.'
+        },
+        'msg_ordering_saved': {
+            'tr': 'Rota sıralaması: boş geçiş {:.1f} mm (yaklaşık {:.1f} s) kısaldı, {} rota ters çevrildi.',
+            'en': 'Route ordering shortened travel by {:.1f} mm (about {:.1f} s), {} routes reversed.'
+        },
+        'msg_cycle_time': {
+            'tr': 'Tahmini çalışma süresi: {} ({} rota).',
+            'en': 'Estimated cycle time: {} ({} routes).'
+        },
+        'msg_profile_armed': {
+            'tr': 'Bir sonraki Yükle veya G-Code Oluştur işlemi profillenecek.',
+            'en': 'The next Load or Generate G-Code run will be profiled.'
+        },
         'msg_error': {
             'tr': 'Hata',
             'en': 'Error'
@@ -240,6 +340,10 @@ class LanguageManager:
         'msg_no_content_save': {
             'tr': 'Kaydedilecek G-Code içeriği bulunamadı.',
             'en': 'No G-Code content found to save.'
+        },
+        'msg_operation_cancelled': {
+            'tr': 'İşlem iptal edildi.',
+            'en': 'Operation cancelled.'
         }
     }
     
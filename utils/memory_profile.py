@@ -0,0 +1,139 @@
+import os
+import tracemalloc
+from contextlib import contextmanager
+
+from utils import run_trace
+
+# Bu ortam değişkeni 1 ise arayüzde bellek ölçümü açılır
+MEMORY_ENV = "GCODE_EDITOR_MEMORY"
+
+# Her aşama için raporlanan en çok bellek ayıran satır sayısı
+TOP_LINES = 10
+
+# Ölçümün kendi ayırmaları ve içe aktarma mekanizması rapora girmez
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+# tracemalloc tüm süreci izler, bu yüzden etkin ölçüm iş parçacığına değil sürece aittir
+_active = None
+
+def resident_bytes():
+    """Sürecin şu anki fiziksel bellek kullanımını döndürür (Linux dışında None)."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def memory_profiling_enabled():
+    """Ortam değişkeniyle bellek ölçümünün açık olup olmadığını döndürür."""
+    return os.environ.get(MEMORY_ENV, "") not in ("", "0")
+
+class MemoryProfile:
+    """
+    Aşama sınırlarında tracemalloc anlık görüntüleri alarak her aşamanın net ve en yüksek
+    bellek kullanımını ve en çok bellek ayıran kaynak satırlarını kaydeden sınıf.
+    tracemalloc yalnızca Python ayırmalarını görür; Qt belgesi gibi yerel ayırmalar için
+    aşamanın fiziksel bellek (RSS) farkı da kaydedilir.
+    İç içe aşamalar ayrıca ölçülmez; ölçüm en dıştaki aşamaya aittir.
+    """
+    def __init__(self, top_lines=TOP_LINES):
+        self.top_lines = top_lines
+        self.stages = {}  # Aşama adı -> {'net': .., 'peak': .., 'rss': .., 'top': [..]}
+        self._started_tracing = False
+        self._open_stage = None
+
+    def start(self):
+        """Bellek izlemeyi başlatır (zaten açıksa dokunmaz)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        """Bellek izlemeyi bu ölçüm başlattıysa durdurur."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+
+    @contextmanager
+    def stage(self, name):
+        """Bloğun net ve en yüksek bellek kullanımını aşama adıyla kaydeder."""
+        if self._open_stage is not None or not tracemalloc.is_tracing():
+            yield
+            return
+        self._open_stage = name
+        before = self.snapshot()
+        start_rss = resident_bytes()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            end_rss = resident_bytes()
+            after = self.snapshot()
+            self._open_stage = None
+            rss = end_rss - start_rss if start_rss is not None and end_rss is not None else None
+            self.record(name, current_bytes - start_bytes, peak_bytes - start_bytes, rss,
+                        after.compare_to(before, 'lineno'))
+
+    def record(self, name, net, peak, rss, stats):
+        """Aşama sonucunu kaydeder ve etkin çalışma izlemesine ekler."""
+        top = [{'line': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'bytes': stat.size_diff, 'count': stat.count_diff}
+               for stat in stats[:self.top_lines] if stat.size_diff > 0]
+        self.stages[name] = {'net': net, 'peak': peak, 'rss': rss, 'top': top}
+
+        counts = {'memory_net': net, 'memory_peak': peak}
+        if rss is not None:
+            counts['memory_rss'] = rss
+        run_trace.add_counts(name, **counts)
+        trace = run_trace.current_trace()
+        if trace is not None:
+            trace.memory[name] = top
+
+    def report(self):
+        """Aşamaların bellek kullanımını okunabilir metin olarak döndürür."""
+        lines = [f"{'Aşama':<12} {'Net (MB)':>10} {'Tepe (MB)':>10} {'RSS (MB)':>10}"]
+        for name, stage in self.stages.items():
+            rss = f"{stage['rss'] / 2 ** 20:10.2f}" if stage['rss'] is not None else f"{'-':>10}"
+            lines.append(f"{name:<12} {stage['net'] / 2 ** 20:10.2f} {stage['peak'] / 2 ** 20:10.2f} {rss}")
+            for entry in stage['top']:
+                lines.append(f"    {entry['bytes'] / 2 ** 20:8.2f} MB  {entry['count']:>9} blok  {entry['line']}")
+        return '\n'.join(lines)
+
+def start_memory_profile(top_lines=TOP_LINES):
+    """Süreç için bellek ölçümünü başlatır ve etkin ölçümü döndürür."""
+    global _active
+    if _active is None:
+        _active = MemoryProfile(top_lines)
+        _active.start()
+    return _active
+
+def stop_memory_profile():
+    """Etkin bellek ölçümünü durdurur ve döndürür."""
+    global _active
+    profile, _active = _active, None
+    if profile is not None:
+        profile.stop()
+    return profile
+
+def current_memory_profile():
+    return _active
+
+@contextmanager
+def memory_stage(name):
+    """Bellek ölçümü açıksa bloğu aşama olarak ölçer, değilse hiçbir şey yapmaz. Dekoratör olarak da kullanılabilir."""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    with profile.stage(name):
+        yield
@@ -0,0 +1,135 @@
+import cProfile
+import glob
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+
+# Bu ortam değişkeni 1 ise her Yükle / Oluştur işlemi profillenir
+PROFILE_ENV = "GCODE_EDITOR_PROFILE"
+
+# Profiller çıktı klasörünün altındaki bu klasöre yazılır
+PROFILE_FOLDER = "profiles"
+
+# Saklanacak en fazla profil sayısı (daha eskiler silinir)
+PROFILE_RETENTION = 10
+
+# Yığın örnekleme aralığı (saniye)
+SAMPLE_INTERVAL = 0.001
+
+# Profil dosya adındaki zaman damgası (mikrosaniye dahil) ve aynı ad varsa eklenen sayaç
+PROFILE_STAMP_FORMAT = '%y_%m_%d_%H_%M_%S_%f'
+_PROFILE_STAMP = re.compile(r'_(\d{2}(?:_\d{2}){5}_\d{6})(?:_(\d+))?$')
+
+def profiling_enabled():
+    """Ortam değişkeniyle kalıcı profil modunun açık olup olmadığını döndürür."""
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+def frame_label(frame):
+    """Yığın çerçevesini 'fonksiyon (dosya:satır)' olarak adlandırır."""
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class StackSampler:
+    """
+    Hedef iş parçacığının çağrı yığınını arka planda düzenli aralıklarla örnekleyen sınıf.
+    Örnekler flamegraph araçlarının okuduğu daraltılmış yığın (collapsed stack) biçiminde toplanır.
+    """
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gcode-stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(frame_label(frame))
+                frame = frame.f_back
+            # Kökten yaprağa doğru
+            self.stacks[';'.join(reversed(labels))] += 1
+
+    def collapsed(self):
+        """Örnekleri 'kök;...;yaprak sayı' satırları olarak döndürür."""
+        return '\n'.join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+class RunProfiler:
+    """
+    Tek bir işlemi cProfile ile profiller ve aynı anda yığın örnekler.
+    Profil, çalıştığı iş parçacığında etkinleştirilmelidir (cProfile iş parçacığına özeldir).
+    Sonuç <işlem>_<tarih>.pstats ve <işlem>_<tarih>.folded dosyalarına yazılır; tarih
+    mikrosaniyeyi içerir, aynı ad yine de varsa sona bir sayaç eklenir.
+    """
+    def __init__(self, operation, folder, retention=PROFILE_RETENTION):
+        self.operation = operation
+        self.folder = folder
+        self.retention = retention
+        self.profile = cProfile.Profile()
+        self.sampler = None
+        self.stats_path = None
+        self.collapsed_path = None
+
+    def __enter__(self):
+        self.sampler = StackSampler(threading.get_ident())
+        self.sampler.start()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.sampler.stop()
+        return False
+
+    def save(self):
+        """Profil dosyalarını yazar, eski profilleri siler ve .pstats dosyasının yolunu döndürür."""
+        os.makedirs(self.folder, exist_ok=True)
+        name = f"{self.operation}_{datetime.now().strftime(PROFILE_STAMP_FORMAT)}"
+        counter = 0
+        stem = name
+        while os.path.exists(os.path.join(self.folder, f"{stem}.pstats")):
+            counter += 1
+            stem = f"{name}_{counter}"
+        self.stats_path = os.path.join(self.folder, f"{stem}.pstats")
+        self.collapsed_path = os.path.join(self.folder, f"{stem}.folded")
+
+        self.profile.dump_stats(self.stats_path)
+        with open(self.collapsed_path, 'w') as file:
+            file.write(self.sampler.collapsed())
+
+        prune_profiles(self.folder, self.retention)
+        return self.stats_path
+
+def profile_order(stats_path):
+    """
+    Profili dosya adındaki zaman damgası ve sayaca göre sıralamak için anahtar döndürür.
+    Adı bu biçimde olmayan dosyalar en eski sayılır.
+    """
+    match = _PROFILE_STAMP.search(os.path.splitext(os.path.basename(stats_path))[0])
+    if match is None:
+        return ("", 0)
+    return (match.group(1), int(match.group(2) or 0))
+
+def prune_profiles(folder, retention=PROFILE_RETENTION):
+    """Klasörde en yeni retention adet profili bırakır, daha eskilerini siler."""
+    stats_files = sorted(glob.glob(os.path.join(folder, "*.pstats")), key=profile_order, reverse=True)
+    removed = 0
+    for stats_path in stats_files[retention:]:
+        for path in (stats_path, os.path.splitext(stats_path)[0] + ".folded"):
+            if os.path.exists(path):
+                os.remove(path)
+        removed += 1
+    return removed
@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+# Çalıştırma kayıtlarının yazıldığı dosya ve döndürme ayarları
+RUN_LOG_FILE = os.path.join("logs", "runs.jsonl")
+RUN_LOG_MAX_BYTES = 5 * 1024 * 1024
+RUN_LOG_BACKUP_COUNT = 3
+
+# Etkin izleme iş parçacığına özeldir (arka plan işi ile arayüz birbirini etkilemez)
+_local = threading.local()
+
+class RunTrace:
+    """
+    Bir işlemin (yükleme, oluşturma, kaydetme) aşama sürelerini, sayaçlarını ve
+    rota bazlı sürelerini toplayan sınıf. İç içe aşamalarda her aşamaya yalnızca
+    kendi süresi yazılır; böylece aşama süreleri toplam süreyi aşmaz.
+    """
+    def __init__(self, operation):
+        self.operation = operation
+        self.started = datetime.now()
+        self.start = time.perf_counter()
+        self.end = None
+        self.stages = {}  # Aşama adı -> {'seconds': .., 'calls': .., sayaçlar}
+        self.routes = []  # Rota bazlı kayıtlar
+        self.memory = {}  # Bellek ölçümü açıksa aşama adı -> en çok bellek ayıran satırlar
+        self._stack = []  # Açık aşamaların alt aşama süreleri
+
+    @contextmanager
+    def span(self, stage, **counts):
+        """Bloğun süresini belirtilen aşamaya ekler."""
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self.add(stage, elapsed - children, **counts)
+
+    def add(self, stage, seconds=0.0, calls=1, **counts):
+        """Aşamaya süre ve sayaç (nokta, satır, bayt...) ekler."""
+        entry = self.stages.setdefault(stage, {'seconds': 0.0, 'calls': 0})
+        entry['seconds'] += seconds
+        entry['calls'] += calls
+        for name, value in counts.items():
+            entry[name] = entry.get(name, 0) + value
+
+    def add_route(self, **fields):
+        """Rota bazlı kayıt ekler (numara, nokta, satır, süre...)."""
+        self.routes.append(fields)
+
+    def finish(self):
+        """İzlemeyi bitirir; bitmiş izleme tekrar çağrıldığında değişmez."""
+        if self.end is None:
+            self.end = time.perf_counter()
+        return self
+
+    @property
+    def total_seconds(self):
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def breakdown(self):
+        """Aşamaları süreye göre büyükten küçüğe (ad, kayıt) listesi olarak döndürür."""
+        return sorted(self.stages.items(), key=lambda item: item[1]['seconds'], reverse=True)
+
+    def summary(self, limit=4):
+        """Durum çubuğu için kısa özet: en uzun süren aşamalar."""
+        timed = [(stage, entry) for stage, entry in self.breakdown() if entry['calls']]
+        parts = [f"{stage} {entry['seconds']:.2f}s" for stage, entry in timed[:limit]]
+        return f"{self.operation} {self.total_seconds:.2f}s: " + ", ".join(parts)
+
+    def details(self):
+        """Tüm aşamaları sayaçlarıyla birlikte satır satır döndürür."""
+        lines = [f"{self.operation}: {self.total_seconds:.3f} s"]
+        for stage, entry in self.breakdown():
+            counts = ", ".join(f"{name}={value}" for name, value in entry.items() if name not in ('seconds', 'calls'))
+            lines.append(f"  {stage:<14} {entry['seconds']:8.3f} s  x{entry['calls']}" + (f"  ({counts})" if counts else ""))
+        if self.routes:
+            slowest = max(self.routes, key=lambda route: route.get('seconds', 0))
+            lines.append(f"  En yavaş rota: {slowest.get('number')} ({slowest.get('seconds', 0):.3f} s)")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        record = {
+            'operation': self.operation,
+            'started': self.started.isoformat(timespec='seconds'),
+            'seconds': round(self.total_seconds, 6),
+            'stages': {stage: {name: round(value, 6) if isinstance(value, float) else value
+                               for name, value in entry.items()}
+                       for stage, entry in self.stages.items()},
+            'routes': self.routes,
+        }
+        if self.memory:
+            record['memory'] = self.memory
+        return record
+
+def current_trace():
+    """Bu iş parçacığında etkin izlemeyi döndürür (yoksa None)."""
+    return getattr(_local, 'trace', None)
+
+@contextmanager
+def activate(trace):
+    """İzlemeyi blok boyunca bu iş parçacığında etkin yapar; trace None olabilir."""
+    previous = current_trace()
+    _local.trace = trace
+    try:
+        yield trace
+    finally:
+        _local.trace = previous
+
+@contextmanager
+def span(stage, **counts):
+    """Etkin izleme varsa bloğun süresini aşamaya ekler, yoksa hiçbir şey yapmaz."""
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    with trace.span(stage, **counts):
+        yield
+
+def add_counts(stage, **counts):
+    """Etkin izlemede aşamaya süre eklemeden sayaç ekler."""
+    trace = current_trace()
+    if trace is not None:
+        trace.add(stage, calls=0, **counts)
+
+def add_route(**fields):
+    """Etkin izlemeye rota bazlı kayıt ekler."""
+    trace = current_trace()
+    if trace is not None:
+        trace.add_route(**fields)
+
+class RunLog:
+    """Her çalıştırmayı JSON satırı olarak döndürülen (rotating) bir günlük dosyasına ekler."""
+    def __init__(self, path=RUN_LOG_FILE, max_bytes=RUN_LOG_MAX_BYTES, backup_count=RUN_LOG_BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._logger = None
+
+    def _get_logger(self):
+        # Dosya ilk kayıtta açılır; aynı dosyaya yazan günlükler tek bir işleyiciyi paylaşır
+        if self._logger is None:
+            logger = logging.getLogger(f"gcode_editor.runs.{os.path.abspath(self.path)}")
+            if not logger.handlers:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes,
+                                              backupCount=self.backup_count, encoding='utf-8')
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                logger.addHandler(handler)
+                logger.propagate = False
+                logger.setLevel(logging.INFO)
+            self._logger = logger
+        return self._logger
+
+    @staticmethod
+    def make_record(trace, **extra):
+        """İzlemeyi bitirir ve günlüğe yazılacak kaydı (sözlük) döndürür."""
+        record = trace.finish().to_dict()
+        record.update(extra)
+        return record
+
+    def append(self, trace, **extra):
+        """İzlemeyi günlüğe ekler."""
+        self.append_record(self.make_record(trace, **extra))
+
+    def append_record(self, record):
+        """
+        Hazır bir kaydı günlüğe ekler. RotatingFileHandler süreçler arasında güvenli değildir;
+        başka süreçlerde oluşan kayıtlar bu yolla tek bir süreçten yazılmalıdır.
+        """
+        self._get_logger().info(json.dumps(record, ensure_ascii=False))
@@ -0,0 +1,51 @@
+import os
+import time
+
+# İlk çizime kadar izin verilen süre (ms)
+STARTUP_BUDGET_MS = 1000
+
+class StartupTimer:
+    """
+    Uygulama açılışını aşamalara bölerek ölçen yardımcı sınıf.
+    Her mark() çağrısı bir önceki işaretten bu yana geçen süreyi kaydeder.
+    PyQt5 içe aktarmaz; main.py'nin en başında oluşturulabilir.
+    """
+    def __init__(self, budget_ms=STARTUP_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []  # (aşama adı, aşama süresi ms, başlangıçtan beri ms)
+
+    def mark(self, phase):
+        """Aşamayı bitir ve süresini kaydet."""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000, (now - self.start) * 1000))
+        self.last = now
+
+    def elapsed_until(self, phase):
+        """Başlangıçtan belirtilen aşamanın sonuna kadar geçen süreyi (ms) döndürür."""
+        for name, _, total in self.phases:
+            if name == phase:
+                return total
+        return None
+
+    def within_budget(self, phase='first_paint'):
+        """Belirtilen aşamaya bütçe içinde ulaşılıp ulaşılmadığını döndürür."""
+        elapsed = self.elapsed_until(phase)
+        return elapsed is not None and elapsed <= self.budget_ms
+
+    def report(self):
+        """Aşama sürelerini tablo olarak döndürür."""
+        lines = [f"{'Aşama':<20} {'Süre (ms)':>10} {'Toplam (ms)':>12}"]
+        for name, duration, total in self.phases:
+            lines.append(f"{name:<20} {duration:10.1f} {total:12.1f}")
+        first_paint = self.elapsed_until('first_paint')
+        if first_paint is not None:
+            status = "bütçe içinde" if first_paint <= self.budget_ms else "BÜTÇE AŞILDI"
+            lines.append(f"İlk çizim: {first_paint:.1f} ms / {self.budget_ms} ms ({status})")
+        return '\n'.join(lines)
+
+    @staticmethod
+    def reporting_enabled():
+        """GCODE_EDITOR_STARTUP_TIMINGS ortam değişkeni ayarlıysa süreler yazdırılır."""
+        return bool(os.environ.get('GCODE_EDITOR_STARTUP_TIMINGS'))
@@ -5,6 +5,8 @@ class StyleManager:
     """
     Uygulama stillerini yöneten yardımcı sınıf.
     """
+    _window_style = None  # get_window_style() ile bir kez oluşturulan stil sayfası
+    
     @staticmethod
     def get_light_palette():
         """Açık tema paleti oluşturur."""
@@ -224,6 +226,26 @@ class StyleManager:
             }
         """
     
+    @staticmethod
+    def get_window_style():
+        """
+        Ana penceredeki tüm widget stillerini tek bir stil sayfası olarak döndürür.
+        Stil sayfası yalnızca bir kez oluşturulur ve pencereye bir kez uygulanır;
+        sonradan oluşturulan widget'lar da aynı stili otomatik olarak alır.
+        """
+        if StyleManager._window_style is None:
+            StyleManager._window_style = "".join([
+                StyleManager.get_scroll_bar_style(),
+                StyleManager.get_button_style(),
+                StyleManager.get_group_style(),
+                StyleManager.get_text_edit_style(),
+                StyleManager.get_line_edit_style(),
+                StyleManager.get_checkbox_style(),
+                StyleManager.get_label_style(),
+                StyleManager.get_splitter_style()
+            ])
+        return StyleManager._window_style
+    
     @staticmethod
     def apply_application_style(app):
         """Uygulamaya tüm stilleri uygular."""
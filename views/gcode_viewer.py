@@ -0,0 +1,207 @@
+from PyQt5.QtWidgets import QApplication, QAbstractScrollArea, QPlainTextEdit, QStackedWidget
+from PyQt5.QtCore import Qt, QRegularExpression, pyqtSignal
+from PyQt5.QtGui import QPainter, QPalette, QKeySequence
+
+# Bu satır sayısına kadar içerik düzenlenebilir editörde, daha büyükleri salt okunur görünümde gösterilir
+EDITABLE_LINE_LIMIT = 100000
+
+# Satırların sol kenardan uzaklığı (piksel)
+TEXT_MARGIN = 4
+
+class LargeDocumentView(QAbstractScrollArea):
+    """
+    Milyonlarca satırlık G-Code çıktısı için salt okunur görünüm.
+    Satırlar bellekteki listede tutulur; her çizimde yalnızca ekranda görünen
+    satırlar çizilir, bu yüzden kaydırma maliyeti belge boyutundan bağımsızdır.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lines = []
+        self.max_line_length = 0
+        self.anchor_line = None   # Seçimin başladığı satır
+        self.current_line = None  # Seçimin bittiği satır
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.viewport().setCursor(Qt.IBeamCursor)
+
+    def set_lines(self, lines):
+        """Görüntülenecek satırları ayarlar ve görünümü başa sarar."""
+        self.lines = lines
+        self.max_line_length = max(map(len, lines), default=0)
+        self.anchor_line = self.current_line = None
+        self.update_scroll_bars()
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self.viewport().update()
+
+    def line_height(self):
+        return max(1, self.fontMetrics().lineSpacing())
+
+    def visible_line_count(self):
+        """Görünüm alanına sığan tam satır sayısını döndürür."""
+        return max(1, self.viewport().height() // self.line_height())
+
+    def update_scroll_bars(self):
+        """Kaydırma çubuklarını satır sayısına ve en uzun satıra göre ayarlar."""
+        visible = self.visible_line_count()
+        vertical = self.verticalScrollBar()
+        vertical.setRange(0, max(0, len(self.lines) - visible))
+        vertical.setPageStep(visible)
+        vertical.setSingleStep(1)
+
+        char_width = self.fontMetrics().horizontalAdvance('0')
+        content_width = self.max_line_length * char_width + 2 * TEXT_MARGIN
+        horizontal = self.horizontalScrollBar()
+        horizontal.setRange(0, max(0, content_width - self.viewport().width()))
+        horizontal.setPageStep(self.viewport().width())
+        horizontal.setSingleStep(char_width)
+
+    def selected_range(self):
+        """Seçili satır aralığını (ilk, son) döndürür, seçim yoksa None döndürür."""
+        if self.anchor_line is None or self.current_line is None:
+            return None
+        return min(self.anchor_line, self.current_line), max(self.anchor_line, self.current_line)
+
+    def selected_text(self):
+        selection = self.selected_range()
+        if selection is None:
+            return ""
+        return '\n'.join(self.lines[selection[0]:selection[1] + 1])
+
+    def line_at(self, y):
+        """Görünüm alanındaki y konumuna denk gelen satır numarasını döndürür."""
+        line = self.verticalScrollBar().value() + y // self.line_height()
+        return min(max(line, 0), max(len(self.lines) - 1, 0))
+
+    def paintEvent(self, event):
+        """Yalnızca görünen satırları çizer."""
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        painter.fillRect(event.rect(), palette.color(QPalette.Base))
+        if not self.lines:
+            return
+
+        line_height = self.line_height()
+        ascent = self.fontMetrics().ascent()
+        width = self.viewport().width()
+        x = TEXT_MARGIN - self.horizontalScrollBar().value()
+        first = self.verticalScrollBar().value() + event.rect().top() // line_height
+        last = min(len(self.lines), self.verticalScrollBar().value() + event.rect().bottom() // line_height + 1)
+        selection = self.selected_range()
+
+        for index in range(first, last):
+            y = (index - self.verticalScrollBar().value()) * line_height
+            if selection is not None and selection[0] <= index <= selection[1]:
+                painter.fillRect(0, y, width, line_height, palette.color(QPalette.Highlight))
+                painter.setPen(palette.color(QPalette.HighlightedText))
+            else:
+                painter.setPen(palette.color(QPalette.Text))
+            painter.drawText(x, y + ascent, self.lines[index])
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_scroll_bars()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        # Yazı tipi değişince satır yüksekliği ve kaydırma aralıkları da değişir
+        self.update_scroll_bars()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.lines:
+            line = self.line_at(event.pos().y())
+            if not (event.modifiers() & Qt.ShiftModifier) or self.anchor_line is None:
+                self.anchor_line = line
+            self.current_line = line
+            self.viewport().update()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self.anchor_line is not None:
+            # Görünüm dışına sürüklenirken kaydır
+            y = event.pos().y()
+            if y < 0:
+                self.verticalScrollBar().triggerAction(self.verticalScrollBar().SliderSingleStepSub)
+            elif y > self.viewport().height():
+                self.verticalScrollBar().triggerAction(self.verticalScrollBar().SliderSingleStepAdd)
+            self.current_line = self.line_at(y)
+            self.viewport().update()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            if self.selected_range() is not None:
+                QApplication.clipboard().setText(self.selected_text())
+        elif event.matches(QKeySequence.SelectAll):
+            if self.lines:
+                self.anchor_line, self.current_line = 0, len(self.lines) - 1
+                self.viewport().update()
+        elif event.key() == Qt.Key_Home and event.modifiers() & Qt.ControlModifier:
+            self.verticalScrollBar().setValue(0)
+        elif event.key() == Qt.Key_End and event.modifiers() & Qt.ControlModifier:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        else:
+            # Ok tuşları, Page Up / Page Down
+            super().keyPressEvent(event)
+
+class GCodeViewer(QStackedWidget):
+    """
+    G-Code içerik alanı. Küçük belgeler düzenlenebilir QPlainTextEdit'te,
+    EDITABLE_LINE_LIMIT satırdan büyük belgeler LargeDocumentView'da gösterilir.
+    """
+    textChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.editor = QPlainTextEdit()
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)  # Satır kaydırma kapalı
+        self.large_view = LargeDocumentView()
+        self.addWidget(self.editor)
+        self.addWidget(self.large_view)
+        self.editor.textChanged.connect(self.textChanged)
+
+    def is_large(self):
+        """İçeriğin salt okunur büyük belge görünümünde olup olmadığını döndürür."""
+        return self.currentWidget() is self.large_view
+
+    def set_content(self, content):
+        """İçeriği satır sayısına uygun görünüme yükler."""
+        lines = content.split('\n')
+        if len(lines) > EDITABLE_LINE_LIMIT:
+            self.large_view.set_lines(lines)
+            self.setCurrentWidget(self.large_view)
+            # Editördeki eski belgeyi bırak (değişiklik sinyali bir kez gönderilir)
+            self.editor.blockSignals(True)
+            self.editor.clear()
+            self.editor.blockSignals(False)
+            self.editor.document().setModified(False)
+            self.textChanged.emit()
+        else:
+            self.large_view.set_lines([])
+            self.setCurrentWidget(self.editor)
+            self.editor.setPlainText(content)
+            self.editor.document().setModified(False)
+
+    def toPlainText(self):
+        if self.is_large():
+            return '\n'.join(self.large_view.lines)
+        return self.editor.toPlainText()
+
+    def is_empty(self):
+        """Belgenin boş ya da yalnızca boşluklardan oluşup oluşmadığını metni kopyalamadan döndürür."""
+        if self.is_large():
+            return False
+        # Arama ilk boşluk olmayan karakterde durur
+        return self.editor.document().find(QRegularExpression(r'\S')).isNull()
+
+    def is_modified(self):
+        """İçeriğin yüklendikten sonra düzenlenip düzenlenmediğini döndürür (büyük belgeler salt okunurdur)."""
+        return not self.is_large() and self.editor.document().isModified()
+
+    def line_count(self):
+        """Satır sayısını döndürür (boş belge için 0)."""
+        if self.is_large():
+            return len(self.large_view.lines)
+        if self.editor.document().isEmpty():
+            return 0
+        return self.editor.blockCount()
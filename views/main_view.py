@@ -3,25 +3,46 @@ import os
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QLineEdit, QTextEdit, QCheckBox, QFrame, QScrollArea, 
                             QPushButton, QFileDialog, QMessageBox, QGroupBox, QSplitter, QGridLayout, QAction, QActionGroup)
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette
 from utils.styles import StyleManager
 from utils.language import LanguageManager
+from models.cycle_time import format_duration
+from views.gcode_viewer import GCodeViewer
+
+# Yazarken satır sayacının güncellenmesi için beklenecek süre (ms)
+LINE_COUNT_DEBOUNCE_MS = 150
+
+# Çalışma süresi ipucunda gösterilen en uzun rota sayısı
+CYCLE_TIME_TOOLTIP_ROUTES = 10
 
 class MainView(QMainWindow):
     """
     G-CODE Editor uygulamasının ana görünüm sınıfı.
+    defer_panels=True ise parametre panelleri ve pencere simgesi ilk çizimden sonra
+    (ensure_parameter_panels / load_window_icon ile) oluşturulur.
     """
-    def __init__(self):
+    first_painted = pyqtSignal()  # Pencere ilk kez çizildikten sonra bir kez gönderilir
+    panels_ready = pyqtSignal()   # Parametre panelleri oluşturulduğunda gönderilir
+    
+    def __init__(self, defer_panels=False):
         super().__init__()
         self.current_language = 'tr'  # Varsayılan dil
+        self.shown_line_status = None  # Durum çubuğunda gösterilen (satır sayısı, durum, dil)
+        self.last_run_trace = None  # Durum çubuğunda süreleri gösterilen son işlem
+        self.last_cycle_time = None  # Durum çubuğunda gösterilen son çalışma süresi tahmini
+        self.parameter_panels_built = False
+        self.first_paint_done = False
         self.init_ui()
         
+        if not defer_panels:
+            self.load_window_icon()
+            self.ensure_parameter_panels()
+        
     def init_ui(self):
         """Ana kullanıcı arayüzünü oluşturur."""
         # Ana pencere ayarları
         self.setWindowTitle("G-CODE Editor Application")
-        self.setWindowIcon(QIcon("icon.ico"))
         self.setGeometry(100, 100, 1200, 800)
         
         # Ana widget ve layout
@@ -96,8 +117,11 @@ class MainView(QMainWindow):
         splitter.addWidget(right_panel)
         splitter.setSizes([400, 800])  # Sol panel daha dar, sağ panel daha geniş
         
-        # Sol panel içeriğini oluştur
-        self.create_parameter_inputs(left_layout)
+        # Sol panel içeriği için yer tutucu - parametre panelleri ensure_parameter_panels ile oluşturulur
+        self.parameter_panel = QWidget()
+        self.parameter_panel_layout = QVBoxLayout(self.parameter_panel)
+        self.parameter_panel_layout.setContentsMargins(0, 0, 0, 0)
+        left_layout.addWidget(self.parameter_panel)
         
         # Sağ panel içeriğini oluştur
         self.create_right_panel(right_layout)
@@ -115,6 +139,25 @@ class MainView(QMainWindow):
         # Stil ayarları
         self.apply_styles()
         
+    def ensure_parameter_panels(self):
+        """Parametre panellerini henüz oluşturulmadıysa oluşturur."""
+        if self.parameter_panels_built:
+            return
+        self.parameter_panels_built = True
+        self.create_parameter_inputs(self.parameter_panel_layout)
+        self.panels_ready.emit()
+        
+    def load_window_icon(self):
+        """Pencere simgesini yükler."""
+        self.setWindowIcon(QIcon("icon.ico"))
+        
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            # Çizim tamamlandıktan sonra olay döngüsünün bir sonraki turunda bildir
+            QTimer.singleShot(0, self.first_painted.emit)
+        
     def create_menu(self):
         """Menü çubuğunu oluşturur."""
         menubar = self.menuBar()
@@ -157,6 +200,11 @@ class MainView(QMainWindow):
         self.reset_action.triggered.connect(self.reset_btn.click)
         self.edit_menu.addAction(self.reset_action)
         
+        # Gizli eylem: bir sonraki Yükle / Oluştur işlemini profille (menüde görünmez, kısayolla çalışır)
+        self.profile_action = QAction(LanguageManager.get_text('menu_profile_next_run', self.current_language), self)
+        self.profile_action.setShortcut('Ctrl+Shift+P')
+        self.addAction(self.profile_action)
+        
         # Dil menüsü
         self.language_menu = menubar.addMenu(LanguageManager.get_text('menu_language', self.current_language))
         
@@ -208,6 +256,7 @@ class MainView(QMainWindow):
         self.edit_menu.setTitle(LanguageManager.get_text('menu_edit', self.current_language))
         self.generate_action.setText(LanguageManager.get_text('menu_generate_gcode', self.current_language))
         self.reset_action.setText(LanguageManager.get_text('menu_reset_parameters', self.current_language))
+        self.profile_action.setText(LanguageManager.get_text('menu_profile_next_run', self.current_language))
         
         self.language_menu.setTitle(LanguageManager.get_text('menu_language', self.current_language))
         
@@ -242,6 +291,7 @@ class MainView(QMainWindow):
         self.reset_btn.setText(LanguageManager.get_text('button_reset', self.current_language))
         self.load_btn.setText(LanguageManager.get_text('button_load', self.current_language))
         self.save_btn.setText(LanguageManager.get_text('button_save', self.current_language))
+        self.cancel_btn.setText(LanguageManager.get_text('button_cancel', self.current_language))
         
         # Etiketleri güncelle
         for widget in self.findChildren(QLabel):
@@ -266,13 +316,30 @@ class MainView(QMainWindow):
             elif widget.text() == "Düzenleniyor" or widget.text() == "Editing":
                 widget.setText(LanguageManager.get_text('label_editing', self.current_language))
             elif widget.text().startswith("Satır:") or widget.text().startswith("Lines:"):
-                widget.setText(f"{LanguageManager.get_text('label_lines', self.current_language)} {self.text_area.document().lineCount()}")
+                widget.setText(f"{LanguageManager.get_text('label_lines', self.current_language)} {self.text_area.line_count()}")
+        if self.last_run_trace is not None:
+            self.show_run_trace(self.last_run_trace)
+        if self.last_cycle_time is not None:
+            self.show_cycle_time(self.last_cycle_time)
         
         # Checkbox'ları güncelle
         for widget in self.findChildren(QCheckBox):
             if widget.text() == "Aktif" or widget.text() == "Active":
                 widget.setText(LanguageManager.get_text('label_active', self.current_language))
         
+        # Çıktı optimizasyonu paneli (panel henüz oluşturulmadıysa oluşturulurken çevrilir)
+        if self.parameter_panels_built:
+            self.optimization_group.setTitle(LanguageManager.get_text('group_optimization', self.current_language))
+            self.compact_output.setText(LanguageManager.get_text('label_compact_output', self.current_language))
+            self.merge_needle_up.setText(LanguageManager.get_text('label_merge_needle_up', self.current_language))
+            self.simplify_points.setText(LanguageManager.get_text('label_simplify_points', self.current_language))
+            self.simplify_tolerance_label.setText(LanguageManager.get_text('label_simplify_tolerance', self.current_language))
+            self.min_stitch_length_label.setText(LanguageManager.get_text('label_min_stitch_length', self.current_language))
+            self.feed_planning.setText(LanguageManager.get_text('label_feed_planning', self.current_language))
+            self.optimize_route_order.setText(LanguageManager.get_text('label_optimize_route_order', self.current_language))
+            self.allow_route_reversal.setText(LanguageManager.get_text('label_allow_route_reversal', self.current_language))
+            self.parallel_processing.setText(LanguageManager.get_text('label_parallel_processing', self.current_language))
+        
         # Kullanıcıya bilgi ver
         QMessageBox.information(
             self, 
@@ -292,37 +359,13 @@ class MainView(QMainWindow):
         
     def apply_styles(self):
         """Arayüz stillerini uygular."""
-        # Butonlar için stil
+        # Tüm widget stilleri tek stil sayfasıyla pencereye bir kez uygulanır;
+        # sonradan oluşturulan parametre panelleri de bu stili alır
+        self.setStyleSheet(StyleManager.get_window_style())
+        
+        # Butonlar için yükseklik
         for widget in self.findChildren(QPushButton):
-            widget.setStyleSheet(StyleManager.get_button_style())
             widget.setMinimumHeight(40)
-            
-        # GroupBox için stil
-        for widget in self.findChildren(QGroupBox):
-            widget.setStyleSheet(StyleManager.get_group_style())
-            
-        # QTextEdit için stil
-        for widget in self.findChildren(QTextEdit):
-            widget.setStyleSheet(StyleManager.get_text_edit_style())
-            
-        # QLineEdit için stil
-        for widget in self.findChildren(QLineEdit):
-            widget.setStyleSheet(StyleManager.get_line_edit_style())
-            
-        # QCheckBox için stil
-        for widget in self.findChildren(QCheckBox):
-            widget.setStyleSheet(StyleManager.get_checkbox_style())
-            
-        # QScrollBar için stil
-        self.setStyleSheet(StyleManager.get_scroll_bar_style())
-            
-        # QLabel için stil
-        for widget in self.findChildren(QLabel):
-            widget.setStyleSheet(StyleManager.get_label_style())
-            
-        # QSplitter için stil
-        for widget in self.findChildren(QSplitter):
-            widget.setStyleSheet(StyleManager.get_splitter_style())
     
     def create_parameter_inputs(self, layout):
         """Sol paneldeki parametre giriş alanlarını oluşturur."""
@@ -484,6 +527,54 @@ class MainView(QMainWindow):
         calibration_layout.addLayout(calibration_controls)
         scroll_layout.addWidget(calibration_group)
         
+        # Çıktı Optimizasyonu
+        self.optimization_group = QGroupBox(LanguageManager.get_text('group_optimization', self.current_language))
+        optimization_layout = QVBoxLayout(self.optimization_group)
+        optimization_layout.setContentsMargins(10, 15, 10, 10)
+        optimization_controls = QGridLayout()
+        optimization_controls.setVerticalSpacing(10)
+        optimization_controls.setHorizontalSpacing(15)
+        
+        self.compact_output = QCheckBox(LanguageManager.get_text('label_compact_output', self.current_language))
+        optimization_controls.addWidget(self.compact_output, 0, 0, 1, 2)
+        
+        self.merge_needle_up = QCheckBox(LanguageManager.get_text('label_merge_needle_up', self.current_language))
+        self.merge_needle_up.setEnabled(False)
+        optimization_controls.addWidget(self.merge_needle_up, 1, 0, 1, 2)
+        
+        self.optimize_route_order = QCheckBox(LanguageManager.get_text('label_optimize_route_order', self.current_language))
+        optimization_controls.addWidget(self.optimize_route_order, 2, 0, 1, 2)
+        
+        self.allow_route_reversal = QCheckBox(LanguageManager.get_text('label_allow_route_reversal', self.current_language))
+        self.allow_route_reversal.setEnabled(False)
+        optimization_controls.addWidget(self.allow_route_reversal, 3, 0, 1, 2)
+        
+        self.simplify_points = QCheckBox(LanguageManager.get_text('label_simplify_points', self.current_language))
+        optimization_controls.addWidget(self.simplify_points, 4, 0, 1, 2)
+        
+        self.simplify_tolerance_label = QLabel(LanguageManager.get_text('label_simplify_tolerance', self.current_language))
+        optimization_controls.addWidget(self.simplify_tolerance_label, 5, 0)
+        self.simplify_tolerance = QLineEdit("0.05")
+        self.simplify_tolerance.setEnabled(False)
+        self.simplify_tolerance.setFixedWidth(120)
+        optimization_controls.addWidget(self.simplify_tolerance, 5, 1)
+        
+        self.min_stitch_length_label = QLabel(LanguageManager.get_text('label_min_stitch_length', self.current_language))
+        optimization_controls.addWidget(self.min_stitch_length_label, 6, 0)
+        self.min_stitch_length = QLineEdit("0")
+        self.min_stitch_length.setEnabled(False)
+        self.min_stitch_length.setFixedWidth(120)
+        optimization_controls.addWidget(self.min_stitch_length, 6, 1)
+        
+        self.feed_planning = QCheckBox(LanguageManager.get_text('label_feed_planning', self.current_language))
+        optimization_controls.addWidget(self.feed_planning, 7, 0, 1, 2)
+        
+        self.parallel_processing = QCheckBox(LanguageManager.get_text('label_parallel_processing', self.current_language))
+        optimization_controls.addWidget(self.parallel_processing, 8, 0, 1, 2)
+        
+        optimization_layout.addLayout(optimization_controls)
+        scroll_layout.addWidget(self.optimization_group)
+        
         # Scroll area'yı tamamla
         scroll_layout.addStretch()
         scroll_area.setWidget(scroll_widget)
@@ -496,9 +587,8 @@ class MainView(QMainWindow):
         content_layout = QVBoxLayout(content_group)
         content_layout.setContentsMargins(10, 15, 10, 10)
         
-        # Text alanı
-        self.text_area = QTextEdit()
-        self.text_area.setLineWrapMode(QTextEdit.NoWrap)  # Satır kaydırma kapalı
+        # Text alanı - büyük belgelerde yalnızca görünen satırları çizen görünüme geçer
+        self.text_area = GCodeViewer()
         self.text_area.setMinimumHeight(500)
         
         # Monospace font kullan
@@ -507,7 +597,7 @@ class MainView(QMainWindow):
         
         # Satır numaralarını göster
         self.text_area.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit, LargeDocumentView {
                 background-color: #FAFAFA;
                 color: #212121;
                 border: 1px solid #E0E0E0;
@@ -517,7 +607,7 @@ class MainView(QMainWindow):
                 selection-color: white;
                 font-family: 'Consolas', 'Courier New', monospace;
             }
-            QTextEdit:focus {
+            QPlainTextEdit:focus, LargeDocumentView:focus {
                 border: 1px solid #2196F3;
             }
         """)
@@ -535,25 +625,89 @@ class MainView(QMainWindow):
         self.line_count_label.setStyleSheet("color: #757575;")
         status_layout.addWidget(self.line_count_label)
         
+        # Son oluşturulan programın tahmini çalışma süresi (rota süreleri ipucunda)
+        self.cycle_time_label = QLabel()
+        self.cycle_time_label.setStyleSheet("color: #757575;")
+        status_layout.addWidget(self.cycle_time_label)
+        
+        # Son işlemin aşama süreleri (ayrıntılar ipucunda)
+        self.timing_label = QLabel()
+        self.timing_label.setStyleSheet("color: #757575;")
+        status_layout.addWidget(self.timing_label)
+        
         # Sağa hizala
         status_layout.addStretch()
         
+        # Arka planda çalışan işi iptal etme butonu (yalnızca iş sürerken görünür)
+        self.cancel_btn = QPushButton(LanguageManager.get_text('button_cancel', self.current_language))
+        self.cancel_btn.setIcon(QIcon.fromTheme("process-stop"))
+        self.cancel_btn.setCursor(Qt.PointingHandCursor)
+        self.cancel_btn.setVisible(False)
+        status_layout.addWidget(self.cancel_btn)
+        
         content_layout.addLayout(status_layout)
         layout.addWidget(content_group)
         
-        # Text değişikliklerini izle
-        self.text_area.textChanged.connect(self.update_line_count)
+        # Text değişikliklerini izle - art arda gelen değişiklikler tek güncellemede birleştirilir
+        self.line_count_timer = QTimer(self)
+        self.line_count_timer.setSingleShot(True)
+        self.line_count_timer.setInterval(LINE_COUNT_DEBOUNCE_MS)
+        self.line_count_timer.timeout.connect(self.update_line_count)
+        self.text_area.textChanged.connect(self.line_count_timer.start)
     
     def update_line_count(self):
-        """Metin alanındaki satır sayısını günceller."""
-        text = self.text_area.toPlainText()
-        line_count = text.count('\n') + 1 if text else 0
-        self.line_count_label.setText(f"{LanguageManager.get_text('label_lines', self.current_language)} {line_count}")
+        """Metin alanındaki satır sayısını belgeyi kopyalamadan (blok sayısından) günceller."""
+        line_count = self.text_area.line_count()
+        status_key = 'label_editing' if line_count else 'label_ready'
+        
+        # Görünen hiçbir şey değişmediyse etiketlere dokunma
+        line_status = (line_count, status_key, self.current_language)
+        if line_status == self.shown_line_status:
+            return
+        self.shown_line_status = line_status
         
-        if text:
-            self.status_label.setText(LanguageManager.get_text('label_editing', self.current_language))
-        else:
-            self.status_label.setText(LanguageManager.get_text('label_ready', self.current_language))
+        self.line_count_label.setText(f"{LanguageManager.get_text('label_lines', self.current_language)} {line_count}")
+        self.status_label.setText(LanguageManager.get_text(status_key, self.current_language))
+    
+    def set_busy(self, busy):
+        """Arka planda iş sürerken Oluştur, Yükle ve Kaydet işlemlerini devre dışı bırakır."""
+        for widget in (self.generate_btn, self.load_btn, self.save_btn,
+                       self.generate_action, self.load_action, self.save_action):
+            widget.setEnabled(not busy)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setVisible(busy)
+        
+        if not busy:
+            self.update_line_count()
+    
+    def show_progress(self, message):
+        """Durum çubuğunda ilerleme mesajı gösterir."""
+        self.status_label.setText(message)
+        self.shown_line_status = None  # İş bitince satır durumu yeniden yazılsın
+    
+    def show_run_trace(self, trace):
+        """Son işlemin en uzun süren aşamalarını durum çubuğunda, tüm ayrıntıları ipucunda gösterir."""
+        self.last_run_trace = trace
+        self.timing_label.setText(f"{LanguageManager.get_text('label_last_run', self.current_language)} {trace.summary()}")
+        self.timing_label.setToolTip(trace.details())
+    
+    def show_cycle_time(self, summary):
+        """Tahmini çalışma süresini durum çubuğunda, bölüm ve en uzun rota sürelerini ipucunda gösterir."""
+        self.last_cycle_time = summary
+        language = self.current_language
+        self.cycle_time_label.setText(
+            f"{LanguageManager.get_text('label_cycle_time', language)} {format_duration(summary['total_seconds'])}"
+        )
+        lines = [LanguageManager.get_text('tooltip_cycle_time', language).format(
+            format_duration(summary['motion_seconds']), format_duration(summary['dwell_seconds']),
+            format_duration(summary['start_seconds'] + summary['end_seconds'])
+        )]
+        longest = sorted(summary['routes'], key=lambda route: route['seconds'], reverse=True)[:CYCLE_TIME_TOOLTIP_ROUTES]
+        if longest:
+            lines.append(LanguageManager.get_text('tooltip_longest_routes', language))
+            for route in longest:
+                lines.append(f"  {route['number']}: {format_duration(route['seconds'])}")
+        self.cycle_time_label.setToolTip('\n'.join(lines))
     
     def create_action_buttons(self, layout):
         """Alt kısımdaki aksiyon butonlarını oluşturur."""
@@ -591,6 +745,7 @@ class MainView(QMainWindow):
     
     def get_parameters(self):
         """Kullanıcı arayüzündeki tüm parametreleri alır."""
+        self.ensure_parameter_panels()
         params = {
             'start_params': self.start_params_text.toPlainText().strip().split('\n'),
             'route_start_params': self.route_start_params_text.toPlainText().strip().split('\n'),
@@ -607,12 +762,22 @@ class MainView(QMainWindow):
             'punteriz_end': self.punteriz_end.text().strip(),
             'start_speed': self.start_speed.text().strip(),
             'max_speed': self.max_speed.text().strip(),
-            'speed_increment': self.speed_increment.text().strip()
+            'speed_increment': self.speed_increment.text().strip(),
+            'compact_output': self.compact_output.isChecked(),
+            'merge_needle_up': self.merge_needle_up.isChecked(),
+            'simplify_enabled': self.simplify_points.isChecked(),
+            'simplify_tolerance': self.simplify_tolerance.text().strip(),
+            'min_stitch_length': self.min_stitch_length.text().strip(),
+            'feed_planning': self.feed_planning.isChecked(),
+            'optimize_route_order': self.optimize_route_order.isChecked(),
+            'allow_route_reversal': self.allow_route_reversal.isChecked(),
+            'parallel_processing': self.parallel_processing.isChecked()
         }
         return params
     
     def set_parameters(self, params):
         """Parametreleri kullanıcı arayüzüne yükler."""
+        self.ensure_parameter_panels()
         try:
             # G-Code Başlangıç Parametreleri
             start_params = '\n'.join(params.get('start_params', []))
@@ -656,12 +821,35 @@ class MainView(QMainWindow):
             self.bobbin_enabled.setChecked(params.get('bobbin_enabled', False))
             self.bobbin_reset_value.setEnabled(self.bobbin_enabled.isChecked())
             self.bobbin_reset_value.setText(params.get('bobbin_reset_value', "1"))
+            
+            # Çıktı Optimizasyonu Ayarları
+            self.compact_output.setChecked(params.get('compact_output', False))
+            self.merge_needle_up.setEnabled(self.compact_output.isChecked())
+            self.merge_needle_up.setChecked(params.get('merge_needle_up', False))
+            self.simplify_points.setChecked(params.get('simplify_enabled', False))
+            self.simplify_tolerance.setEnabled(self.simplify_points.isChecked())
+            self.min_stitch_length.setEnabled(self.simplify_points.isChecked())
+            self.simplify_tolerance.setText(params.get('simplify_tolerance', "0.05"))
+            self.min_stitch_length.setText(params.get('min_stitch_length', "0"))
+            self.feed_planning.setChecked(params.get('feed_planning', False))
+            self.optimize_route_order.setChecked(params.get('optimize_route_order', False))
+            self.allow_route_reversal.setEnabled(self.optimize_route_order.isChecked())
+            self.allow_route_reversal.setChecked(params.get('allow_route_reversal', False))
+            self.parallel_processing.setChecked(params.get('parallel_processing', False))
         except Exception as e:
             self.show_error(f"Parametreler yüklenirken hata oluştu: {str(e)}")
     
     def set_gcode_content(self, content):
         """G-Code içeriğini text alanına yükler."""
-        self.text_area.setText(content)
+        self.text_area.set_content(content)
+    
+    def is_gcode_modified(self):
+        """Text alanındaki içeriğin yüklendikten sonra düzenlenip düzenlenmediğini döndürür."""
+        return self.text_area.is_modified()
+    
+    def has_gcode_content(self):
+        """Text alanında içerik olup olmadığını metni kopyalamadan döndürür."""
+        return not self.text_area.is_empty()
     
     def get_gcode_content(self):
         """Text alanındaki G-Code içeriğini alır."""